@@ -0,0 +1,136 @@
+"""
+Primitives shared by the worker agents.
+
+ApplicationAgent and NetworkAgent (which extends it) both use these:
+- Lazy observability spans (emit_span / spans_enabled)
+- Single-flight results shared between concurrent observation sources
+- Keyword-bucketed observation index handed to hypothesis detectors
+"""
+from typing import Any, Callable, Dict, List, Optional
+import threading
+
+from compass.core.scientific_framework import Observation, ObservationKind
+
+_emit_span: Any = None
+_is_observability_enabled: Any = None
+
+
+def _load_observability() -> None:
+    """
+    Resolve compass.observability on first use.
+
+    Deferred so importing the workers does not pull in the OpenTelemetry SDK
+    for agents that never emit spans.
+    """
+    global _emit_span, _is_observability_enabled
+    try:
+        from compass.observability import emit_span as _impl
+        from compass.observability import is_observability_enabled
+    except ImportError:
+        # Fallback if observability not available
+        from contextlib import contextmanager
+
+        @contextmanager
+        def _impl(name, attributes=None):  # type: ignore[misc]
+            yield
+
+        def is_observability_enabled() -> bool:
+            return False
+
+    _emit_span = _impl
+    _is_observability_enabled = is_observability_enabled
+
+
+def emit_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+    """Open an observability span (see _load_observability)."""
+    if _emit_span is None:
+        _load_observability()
+    return _emit_span(name, attributes)
+
+
+def spans_enabled() -> bool:
+    """Whether a tracer provider is active (checked per call - may be set up late)."""
+    if _is_observability_enabled is None:
+        _load_observability()
+    return _is_observability_enabled()
+
+
+class SharedResult:
+    """
+    Run a call at most once and share its result between concurrent callers.
+
+    The first caller runs it (holding the lock); others block until it is
+    done, then get the same result - or the same exception re-raised.
+    """
+
+    __slots__ = ("_fn", "_lock", "_done", "_result", "_error")
+
+    def __init__(self, fn: Callable[[], Any]):
+        self._fn = fn
+        self._lock = threading.Lock()
+        self._done = False
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+
+    def get(self) -> Any:
+        with self._lock:
+            if not self._done:
+                try:
+                    self._result = self._fn()
+                except Exception as e:
+                    self._error = e
+                self._done = True
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+# ObservationKind -> ObservationIndex bucket
+_KIND_BUCKETS: Dict[ObservationKind, str] = {
+    ObservationKind.ERROR_LOG: "error",
+    ObservationKind.TRACE: "latency",
+    ObservationKind.DEPLOYMENT_LOG: "deployment",
+    ObservationKind.MEMORY: "memory",
+}
+
+
+class ObservationIndex(list):
+    """
+    Observation list with keyword buckets built in a single pass.
+
+    generate_hypothesis() wraps observations once and hands the index to every
+    detector, so each observation's source/description is lowercased once
+    instead of once per detector scan. Still a plain list for detectors that
+    don't use the buckets.
+    """
+
+    __slots__ = ("deployment", "error", "latency", "memory")
+
+    def __init__(self, observations: List[Observation]):
+        super().__init__(observations)
+        self.deployment: List[Observation] = []
+        self.error: List[Observation] = []
+        self.latency: List[Observation] = []
+        self.memory: List[Observation] = []
+        for obs in observations:
+            # Tagged observations route on their kind; untagged ones (and generic
+            # metrics) fall back to keyword matching on source/description
+            bucket = _KIND_BUCKETS.get(obs.kind)
+            if bucket is not None:
+                getattr(self, bucket).append(obs)
+                continue
+            source = obs._source_lc
+            description = obs._desc_lc
+            if "deployment" in source:
+                self.deployment.append(obs)
+            if "error" in source:
+                self.error.append(obs)
+            if "latency" in description or "trace" in source:
+                self.latency.append(obs)
+            if "memory" in description or "memory" in source:
+                self.memory.append(obs)
+
+    @classmethod
+    def of(cls, observations: List[Observation]) -> "ObservationIndex":
+        """Return observations as an index, building one only if needed."""
+        return observations if isinstance(observations, cls) else cls(observations)
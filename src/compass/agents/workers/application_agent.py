@@ -15,31 +15,297 @@ Key Features:
 - Graceful degradation for partial failures
 - Time-scoped observations (incident time ± 15 minutes)
 """
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
+from statistics import fmean, quantiles
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import logging
+import re
+import sys
 import threading  # P1-2 FIX (Alpha): Thread-safety for cost tracking
+import time
 
 import structlog
 
-from compass.core.query_generator import QueryGenerator, QueryRequest, QueryType
-from compass.core.scientific_framework import Incident, Observation, Hypothesis
+from compass.agents.workers._shared import (
+    ObservationIndex,
+    SharedResult,
+    emit_span,
+    spans_enabled,
+)
+from compass.core.query_generator import (
+    GeneratedQuery,
+    QueryGenerator,
+    QueryRequest,
+    QueryType,
+)
+from compass.core.scientific_framework import (
+    Hypothesis,
+    Incident,
+    Observation,
+    ObservationKind,
+    parse_incident_time,
+)
 
 
 class BudgetExceededError(Exception):
     """Raised when operation would exceed investigation budget limit."""
     pass
 
-try:
-    from compass.observability import emit_span
-except ImportError:
-    # Fallback if observability not available
-    from contextlib import contextmanager
-    @contextmanager
-    def emit_span(name, attributes=None):
-        yield
-
 logger = structlog.get_logger()
+# stdlib logger behind the structlog proxy - lets hot paths skip building
+# debug event dicts when DEBUG is filtered out anyway
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Whether debug records from this module would be emitted."""
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+# Shared pool for concurrent observation queries (one worker per source).
+# Module-level so observe() doesn't pay thread start-up cost on every call.
+_OBSERVE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=3, thread_name_prefix="application_agent_observe"
+)
+
+# Deployment keywords as a single case-insensitive alternation. Besides
+# "deploy" (which also covers "deployment", the original two keywords) this
+# matches the wording of progressive-delivery tooling: rollouts, canaries and
+# releases. The pattern is RE2-compatible, so the same string is pushed down
+# to Loki (|~) and compiled here to pick deployment lines out of the combined
+# error + deployment result in one scan instead of one per keyword.
+_DEPLOYMENT_PATTERN = "deploy|rollout|canary|release"
+_DEPLOYMENT_RE = re.compile(_DEPLOYMENT_PATTERN, re.IGNORECASE)
+
+# Version identifiers in deployment logs, e.g. "v2.3.1" or "v2.3.1-rc4"
+_VERSION_RE = re.compile(r"\bv\d+(?:\.\d+)*(?:-[0-9A-Za-z]+(?:\.[0-9A-Za-z]+)*)?\b")
+
+_TIME_AND_LINE = itemgetter("time", "line")
+
+
+def _extract_deployment(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a Loki entry into a deployment record, or None if it lacks a
+    time or line.
+
+    Uses a C-level itemgetter for both fields instead of separate membership
+    tests and lookups per entry.
+    """
+    try:
+        entry_time, line = _TIME_AND_LINE(entry)
+    except KeyError:
+        return None
+    return {"time": entry_time, "log": line}
+
+
+# Catalog of hand-written LogQL, keyed by intent. Authored and validated once
+# here; formatted per service by the memoized helpers below. Filters that OR
+# several terms must be a single |~ regex stage - "|= a or |= b" is not LogQL.
+LOGQL_TEMPLATES: Dict[str, str] = {
+    "error_logs": '{{service="{service}"}} |= "error"',
+    "deployment_logs": '{{service="{service}"}} |~ "(?i)({deployment_pattern})"',
+    # Union of the two above (error stays case-sensitive like |=), used when
+    # both are simple so one range query serves both sources
+    "error_or_deployment_logs": '{{service="{service}"}} |~ "error|(?i:{deployment_pattern})"',
+}
+
+
+def _render_logql(intent: str, service: str) -> str:
+    """Format a LOGQL_TEMPLATES entry for a service."""
+    return sys.intern(
+        LOGQL_TEMPLATES[intent].format(
+            service=service, deployment_pattern=_DEPLOYMENT_PATTERN
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _error_query(service: str) -> str:
+    """Return the simple error-log LogQL query for a service (memoized, interned)."""
+    return _render_logql("error_logs", service)
+
+
+@lru_cache(maxsize=256)
+def _deployment_query(service: str) -> str:
+    """Return the deployment-log LogQL query for a service (memoized, interned)."""
+    return _render_logql("deployment_logs", service)
+
+
+@lru_cache(maxsize=256)
+def _combined_logs_query(service: str) -> str:
+    """Return the combined error + deployment LogQL query (memoized, interned)."""
+    return _render_logql("error_or_deployment_logs", service)
+
+
+# Costs are tracked internally as integer micro-dollars (1e-6 USD) so each
+# update is an int add/compare rather than Decimal arithmetic. Decimal is only
+# used at reporting boundaries (_total_cost, logs, error messages).
+MICRODOLLARS_PER_DOLLAR = 1_000_000
+_ONE_MICRO = Decimal(1)
+
+# Estimate $0.003 per query (typical GPT-4 cost for query generation)
+QUERY_GENERATION_ESTIMATE_MICRO = 3_000
+
+
+def _to_micro(cost: Decimal) -> int:
+    """Convert a dollar amount to integer micro-dollars, rounding half up."""
+    return int((cost * MICRODOLLARS_PER_DOLLAR).quantize(_ONE_MICRO, rounding=ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=256)
+def _observation_window(start_time: str, window_minutes: int) -> Tuple[datetime, datetime]:
+    """
+    Parse an incident start time and return the ± window around it.
+
+    Memoized on the raw ISO string: the same incident flows through every
+    observe call (and every agent), so it is parsed once instead of per call.
+
+    Args:
+        start_time: ISO 8601 incident start time
+        window_minutes: Minutes either side of the incident time
+
+    Returns:
+        Tuple of (start_time, end_time)
+    """
+    incident_time = parse_incident_time(start_time)
+    window = timedelta(minutes=window_minutes)
+    return (incident_time - window, incident_time + window)
+
+
+@lru_cache(maxsize=256)
+def _observation_window_iso(start_time: str, window_minutes: int) -> Tuple[str, str]:
+    """
+    ISO 8601 strings for the observation window, serialized once per incident.
+
+    Args:
+        start_time: ISO 8601 incident start time
+        window_minutes: Minutes either side of the incident time
+
+    Returns:
+        Tuple of (start_iso, end_iso)
+    """
+    window_start, window_end = _observation_window(start_time, window_minutes)
+    return (window_start.isoformat(), window_end.isoformat())
+
+
+def _latency_stats(durations: List[float]) -> Tuple[float, float]:
+    """
+    Compute mean and max span duration.
+
+    Two separate passes over durations (statistics.fmean, then max), both in
+    C - cheaper than a single fused Python-level loop. fmean also sums with
+    full floating-point precision, so the mean doesn't drift on large trace
+    sets. Percentiles are computed separately by _latency_percentiles.
+
+    Args:
+        durations: Non-empty list of span durations (ms)
+
+    Returns:
+        Tuple of (avg_duration, max_duration)
+    """
+    return (fmean(durations), max(durations))
+
+
+def _latency_percentiles(durations: List[float]) -> Tuple[float, float]:
+    """
+    Compute p50 and p99 span duration.
+
+    Uses statistics.quantiles (inclusive method, linear interpolation between
+    closest ranks), which sorts once in C.
+
+    Args:
+        durations: Non-empty list of span durations (ms)
+
+    Returns:
+        Tuple of (p50_duration, p99_duration)
+    """
+    if len(durations) == 1:
+        return (durations[0], durations[0])
+    cut_points = quantiles(durations, n=100, method="inclusive")
+    return (cut_points[49], cut_points[98])
+
+
+class CoalescingLokiClient:
+    """
+    Loki client wrapper that coalesces identical in-flight range queries.
+
+    When several observations (sources of one observe() pass, or concurrent
+    incidents on the same agent) issue the same query over the same window at
+    once, only the first caller hits Loki; the rest wait for and share its
+    result. All other attributes are delegated to the wrapped client.
+    """
+
+    __slots__ = ("_client", "_inflight", "_inflight_lock")
+
+    def __init__(self, client: Any):
+        self._client = client
+        # In-flight queries keyed by (query, sorted kwargs). Per wrapper, so
+        # entries can't outlive (or be mistaken for) another client's queries
+        self._inflight: Dict[Tuple[Any, ...], "Future[Any]"] = {}
+        self._inflight_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def has_method(self, name: str) -> bool:
+        """Whether the wrapped client's type defines a callable `name`.
+
+        Checked on the type so Mock-style clients don't appear to support
+        every optional API.
+        """
+        return callable(getattr(type(self._client), name, None))
+
+    def iter_query_range(self, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate Loki range query entries.
+
+        Streams from the wrapped client's own iter_query_range when it has one
+        (paginated clients), so entries needn't all be held in memory; else
+        iterates the (coalesced) query_range result.
+        """
+        if self.has_method("iter_query_range"):
+            return iter(self._client.iter_query_range(**kwargs))
+        return iter(self.query_range(**kwargs) or ())
+
+    def query_range(self, **kwargs: Any) -> Any:
+        """Run (or join an identical in-flight) Loki range query."""
+        try:
+            key = tuple(sorted(kwargs.items()))
+            hash(key)
+        except TypeError:
+            # Unhashable arguments - nothing to coalesce on
+            return self._client.query_range(**kwargs)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            if _debug_enabled():
+                logger.debug("loki_query_coalesced", query=kwargs.get("query"))
+            return future.result()
+
+        try:
+            result = self._client.query_range(**kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
 
 class ApplicationAgent:
@@ -52,9 +318,44 @@ class ApplicationAgent:
     DECIDE phase: Handled by Orchestrator (returns hypotheses for human selection)
     """
 
+    # Fixed attribute layout: no per-instance __dict__, and attribute reads on
+    # the observe hot path are slot lookups. Subclasses that add instance
+    # attributes must declare their own __slots__.
+    __slots__ = (
+        "loki",
+        "_loki_wrapper",
+        "tempo",
+        "prometheus",
+        "query_generator",
+        "budget_limit",
+        "_cost_lock",
+        "_budget_micro",
+        "_budget_warned",
+        "_total_cost_micro",
+        "_observation_costs",
+        "_query_cache_lock",
+        "_query_cache",
+        "_query_cache_hits",
+        "_query_cache_misses",
+        "_query_cost_saved_micro",
+        "_hypothesis_detectors",
+    )
+
     # Agent identity - child classes MUST override this class attribute (Beta's P0-5)
     agent_id: str = "application_agent"
 
+    # Index generate_hypothesis() builds once for all detectors; subclasses with
+    # their own detector buckets extend ObservationIndex and override this
+    _OBSERVATION_INDEX: "type[ObservationIndex]" = ObservationIndex
+
+    # Built-in hypothesis detectors, in dispatch order (Agent Beta's P0-1 -
+    # extensibility). Subclasses extend the tuple; __init__ binds it once.
+    HYPOTHESIS_DETECTOR_NAMES: Tuple[str, ...] = (
+        "_detect_and_create_deployment_hypothesis",
+        "_detect_and_create_dependency_hypothesis",
+        "_detect_and_create_memory_leak_hypothesis",
+    )
+
     # Time window for observations (Agent Alpha's P1-2)
     OBSERVATION_WINDOW_MINUTES = 15  # ± from incident time
 
@@ -67,6 +368,24 @@ class ApplicationAgent:
     # Default service name when affected_services is empty
     DEFAULT_SERVICE_NAME = "unknown"
 
+    # Severities routine enough to use the template error query without a
+    # QueryGenerator (LLM) call - see _is_simple_error_query. High and critical
+    # incidents still get generated LogQL; subclasses may narrow or widen this.
+    TEMPLATE_ONLY_SEVERITIES: FrozenSet[str] = frozenset({"low", "medium"})
+
+    # Error log entries kept on the observation (count covers all of them)
+    ERROR_SAMPLE_SIZE = 50
+
+    # Entries fetched by the combined error + deployment query (Loki's default
+    # query limit). A result this size may be truncated, so each source then
+    # runs its own query instead of splitting one another's leftovers.
+    COMBINED_LOGS_LIMIT = 100
+
+    # Max generated queries kept per agent (LRU, keyed by intent not time range)
+    QUERY_CACHE_MAX_SIZE = 512
+    # Cached queries expire so LogQL regenerates if log schemas drift
+    QUERY_CACHE_TTL_SECONDS = 900
+
     # Hypothesis generation thresholds
     HIGH_LATENCY_THRESHOLD_MS = 1000  # Latency above this triggers dependency hypothesis
     MEMORY_LEAK_INCREASE_RATIO = 1.5  # Memory must increase by 50% to indicate leak
@@ -99,6 +418,7 @@ class ApplicationAgent:
             )
 
         self.loki = loki_client
+        self._loki_wrapper: Optional[CoalescingLokiClient] = None
         self.tempo = tempo_client
         self.prometheus = prometheus_client
         self.query_generator = query_generator
@@ -107,19 +427,33 @@ class ApplicationAgent:
         # Cost tracking (Agent Alpha's P1-1)
         # P1-2 FIX (Alpha): Thread-safe cost tracking with lock
         self._cost_lock = threading.Lock()
-        self._total_cost = Decimal("0.0000")
+        # Integer micro-dollars (see MICRODOLLARS_PER_DOLLAR)
+        self._budget_micro = _to_micro(budget_limit) if budget_limit else 0
+        self._total_cost_micro = 0
+        self._budget_warned = False  # budget_exhausted logged once per agent
         self._observation_costs = {
-            "error_rates": Decimal("0.0000"),
-            "latency": Decimal("0.0000"),
-            "deployments": Decimal("0.0000"),
+            "error_rates": 0,
+            "latency": 0,
+            "deployments": 0,
         }
 
+        # Generated query cache: identical intents for the same service reuse the
+        # LLM-generated query instead of paying for another generation
+        self._query_cache_lock = threading.Lock()
+        # (query_type, service, log_level, window_minutes) -> (query, cost_micro, expires_at)
+        self._query_cache: "OrderedDict[Tuple[str, str, str, int], Tuple[str, int, float]]" = (
+            OrderedDict()
+        )
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+        self._query_cost_saved_micro = 0
+
         # Hypothesis detectors (Agent Beta's P0-1 - extensibility)
-        # Each detector examines observations and returns Hypothesis or None
+        # Each detector examines observations and returns Hypothesis or None.
+        # Bound once here so generate_hypothesis() calls them directly; callers
+        # may still append custom detectors to this per-instance list.
         self._hypothesis_detectors = [
-            self._detect_and_create_deployment_hypothesis,
-            self._detect_and_create_dependency_hypothesis,
-            self._detect_and_create_memory_leak_hypothesis,
+            getattr(self, name) for name in self.HYPOTHESIS_DETECTOR_NAMES
         ]
 
         logger.info(
@@ -130,6 +464,115 @@ class ApplicationAgent:
             hypothesis_detectors=len(self._hypothesis_detectors),
         )
 
+    @property
+    def _loki_queries(self) -> Optional[CoalescingLokiClient]:
+        """
+        Coalescing wrapper around the current self.loki client.
+
+        Identical concurrent Loki queries share one round-trip. Derived from
+        self.loki (rebuilt when it is reassigned) so the guards on self.loki
+        and the queries sent through the wrapper always agree.
+        """
+        wrapper = self._loki_wrapper
+        if wrapper is None or wrapper._client is not self.loki:
+            wrapper = CoalescingLokiClient(self.loki) if self.loki else None
+            self._loki_wrapper = wrapper
+        return wrapper
+
+    @property
+    def _total_cost(self) -> Decimal:
+        """Total cost in dollars (read by Orchestrator for budget tracking)."""
+        return Decimal(self._total_cost_micro) / MICRODOLLARS_PER_DOLLAR
+
+    def _record_cost(self, cost_micro: int, category: Optional[str] = None) -> None:
+        """
+        Record an incurred cost.
+
+        Args:
+            cost_micro: Cost in integer micro-dollars
+            category: Optional _observation_costs key to attribute the cost to
+        """
+        # P1-2 FIX (Alpha): Thread-safe cost tracking
+        with self._cost_lock:
+            self._total_cost_micro += cost_micro
+            if category is not None:
+                self._observation_costs[category] += cost_micro
+
+    def _reserve_budget_micro(self, estimated_micro: int) -> None:
+        """
+        Atomically check the budget and reserve an estimated cost against it.
+
+        The reservation counts towards _total_cost until _settle_cost replaces
+        it with the actual cost, so concurrent callers see each other's
+        in-flight spend.
+
+        Args:
+            estimated_micro: Estimated cost of upcoming operation in micro-dollars
+
+        Raises:
+            BudgetExceededError: If the reservation would exceed budget_limit
+        """
+        with self._cost_lock:
+            self._check_budget_micro(estimated_micro)
+            self._total_cost_micro += estimated_micro
+
+    def _settle_cost(
+        self, reserved_micro: int, cost_micro: int, category: Optional[str] = None
+    ) -> None:
+        """
+        Replace a _reserve_budget_micro reservation with the actual cost.
+
+        Args:
+            reserved_micro: Amount previously reserved, in micro-dollars
+            cost_micro: Actual cost incurred (0 if the operation failed)
+            category: Optional _observation_costs key to attribute the cost to
+        """
+        with self._cost_lock:
+            self._total_cost_micro += cost_micro - reserved_micro
+            if category is not None:
+                self._observation_costs[category] += cost_micro
+
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get generated-query cache statistics.
+
+        Returns:
+            Dict with hits, misses, hit_ratio, cost_saved (USD) and cache_size
+        """
+        with self._query_cache_lock:
+            hits = self._query_cache_hits
+            misses = self._query_cache_misses
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses > 0 else 0.0,
+                "cost_saved": Decimal(self._query_cost_saved_micro) / MICRODOLLARS_PER_DOLLAR,
+                "cache_size": len(self._query_cache),
+            }
+
+    def _budget_exhausted(self) -> bool:
+        """
+        Check if the budget is already fully spent.
+
+        Observation sources call this on entry and return no observations
+        instead of issuing queries whose cost can't be covered. Logs a single
+        budget_exhausted warning the first time it trips.
+
+        Returns:
+            True if total cost has reached budget_limit
+        """
+        if not self.budget_limit or self._total_cost_micro < self._budget_micro:
+            return False
+        if not self._budget_warned:
+            self._budget_warned = True
+            logger.warning(
+                "budget_exhausted",
+                agent_id=self.agent_id,
+                total_cost=str(self._total_cost),
+                budget_limit=str(self.budget_limit),
+            )
+        return True
+
     def _check_budget(self, estimated_cost: Decimal = Decimal("0")) -> None:
         """
         Check if operation would exceed budget limit.
@@ -137,15 +580,27 @@ class ApplicationAgent:
         Args:
             estimated_cost: Estimated cost of upcoming operation
 
+        Raises:
+            BudgetExceededError: If operation would exceed budget_limit
+        """
+        self._check_budget_micro(_to_micro(estimated_cost))
+
+    def _check_budget_micro(self, estimated_micro: int = 0) -> None:
+        """
+        Integer fast path for _check_budget (no Decimal unless over budget).
+
+        Args:
+            estimated_micro: Estimated cost of upcoming operation in micro-dollars
+
         Raises:
             BudgetExceededError: If operation would exceed budget_limit
         """
         if not self.budget_limit:
             return  # No budget limit set
 
-        projected_cost = self._total_cost + estimated_cost
-
-        if projected_cost > self.budget_limit:
+        if self._total_cost_micro + estimated_micro > self._budget_micro:
+            estimated_cost = Decimal(estimated_micro) / MICRODOLLARS_PER_DOLLAR
+            projected_cost = self._total_cost + estimated_cost
             logger.error(
                 "budget_exceeded",
                 agent_id=self.agent_id,
@@ -177,59 +632,68 @@ class ApplicationAgent:
             BudgetExceededError: If budget already exceeded before observations
         """
         # Check budget before starting observations (fail fast)
-        self._check_budget()
-
-        with emit_span("application_agent.observe", attributes={"agent.id": self.agent_id}):
-            observations = []
+        self._check_budget_micro()
+
+        # Nothing to query - skip span, time-range parsing and dispatch entirely
+        if not (self.loki or self.tempo or self.prometheus):
+            logger.warning("no_sources_configured", agent_id=self.agent_id)
+            return []
+
+        # Fast path: with tracing off, skip the attribute dict and generator-based
+        # context manager entirely
+        span = (
+            emit_span("application_agent.observe", attributes={"agent.id": self.agent_id})
+            if spans_enabled()
+            else nullcontext()
+        )
+        with span:
             successful_sources = 0
-            total_sources = 3
 
             # Calculate time range (Agent Alpha's P1-2)
             time_range = self._calculate_time_range(incident)
-
-            logger.info(
-                "application_agent.observe_started",
-                agent_id=self.agent_id,
-                incident_id=incident.incident_id,
-                time_range_start=time_range[0].isoformat(),
-                time_range_end=time_range[1].isoformat(),
+            time_range_iso = self._time_range_iso(incident)
+            service = self._get_primary_service(incident)
+
+            # Sources are independent and each blocks on network I/O, so dispatch
+            # them concurrently: wall-clock becomes the slowest source, not the sum.
+            # When the error query is the template (no QueryGenerator, or a routine
+            # incident) both Loki sources are simple line filters over the same
+            # stream and window: fetch once and split client-side.
+            log_entries = (
+                SharedResult(partial(self._query_combined_logs, service, time_range))
+                if self.loki
+                and (not self.query_generator or self._is_simple_error_query(incident))
+                else None
             )
+            sources = (
+                # Error rates (Agent Alpha & Beta - use QueryGenerator)
+                ("error", partial(self._observe_error_rates, log_entries=log_entries)),
+                ("latency", self._observe_latency),
+                ("deployment", partial(self._observe_deployments, log_entries=log_entries)),
+            )
+            total_sources = len(sources)
+            futures = [
+                (name, _OBSERVE_EXECUTOR.submit(observe_source, incident, time_range, service))
+                for name, observe_source in sources
+            ]
+
+            # Collect in submission order so observation ordering stays deterministic.
+            # Per-source lists are concatenated once at the end instead of extended per source.
+            # Per-source counts go into the single observe_completed record rather than
+            # one log record per source (None marks a failed source).
+            source_lists: List[List[Observation]] = []
+            source_results: Dict[str, Optional[int]] = {}
+            for name, future in futures:
+                try:
+                    source_obs = future.result()
+                    source_lists.append(source_obs)
+                    source_results[name] = len(source_obs)
+                    successful_sources += 1
+                except Exception as e:
+                    source_results[name] = None
+                    logger.warning(f"{name}_observation_failed", error=str(e))
 
-            # Observe error rates (Agent Alpha & Beta - use QueryGenerator)
-            try:
-                error_obs = self._observe_error_rates(incident, time_range)
-                observations.extend(error_obs)
-                successful_sources += 1
-                logger.debug(
-                    "error_observation_succeeded",
-                    observation_count=len(error_obs),
-                )
-            except Exception as e:
-                logger.warning("error_observation_failed", error=str(e))
-
-            # Observe latency
-            try:
-                latency_obs = self._observe_latency(incident, time_range)
-                observations.extend(latency_obs)
-                successful_sources += 1
-                logger.debug(
-                    "latency_observation_succeeded",
-                    observation_count=len(latency_obs),
-                )
-            except Exception as e:
-                logger.warning("latency_observation_failed", error=str(e))
-
-            # Observe deployments
-            try:
-                deployment_obs = self._observe_deployments(incident, time_range)
-                observations.extend(deployment_obs)
-                successful_sources += 1
-                logger.debug(
-                    "deployment_observation_succeeded",
-                    observation_count=len(deployment_obs),
-                )
-            except Exception as e:
-                logger.warning("deployment_observation_failed", error=str(e))
+            observations = list(chain.from_iterable(source_lists))
 
             # Calculate confidence based on successful sources (Agent Alpha's P1-5)
             confidence = successful_sources / total_sources if total_sources > 0 else 0.0
@@ -237,16 +701,38 @@ class ApplicationAgent:
             logger.info(
                 "application_agent.observe_completed",
                 agent_id=self.agent_id,
+                incident_id=incident.incident_id,
+                time_range_start=time_range_iso[0],
+                time_range_end=time_range_iso[1],
+                source_results=source_results,
                 total_observations=len(observations),
                 successful_sources=successful_sources,
                 total_sources=total_sources,
                 confidence=confidence,
                 total_cost=str(self._total_cost),
-                within_budget=self._total_cost <= self.budget_limit if self.budget_limit else True,
+                within_budget=(
+                    self._total_cost_micro <= self._budget_micro if self.budget_limit else True
+                ),
             )
 
             return observations
 
+    async def observe_async(self, incident: Incident) -> List[Observation]:
+        """
+        Async entry point for observe() (for callers running an event loop).
+
+        The Loki/Tempo clients are synchronous and observe() already queries
+        its sources concurrently on _OBSERVE_EXECUTOR, so this only moves the
+        blocking call off the event loop thread.
+
+        Returns:
+            Same observations as observe()
+
+        Raises:
+            BudgetExceededError: If budget already exceeded before observations
+        """
+        return await asyncio.to_thread(self.observe, incident)
+
     def _get_primary_service(self, incident: Incident) -> str:
         """
         Extract primary affected service from incident.
@@ -273,16 +759,28 @@ class ApplicationAgent:
         Returns:
             Version string (e.g., "v2.3.1") or "unknown" if not found
         """
-        if "v" not in log_line:
-            return "unknown"
+        match = _VERSION_RE.search(log_line)
+        return match.group(0) if match else "unknown"
 
-        # Try to extract version like "v2.3.1"
-        parts = log_line.split()
-        for part in parts:
-            if part.startswith("v") and any(char.isdigit() for char in part):
-                return part
+    def _is_simple_error_query(self, incident: Incident) -> bool:
+        """
+        Check whether the template error query is good enough for this incident.
 
-        return "unknown"
+        True for routine incidents: severity in TEMPLATE_ONLY_SEVERITIES, at most
+        one affected service and no custom log labels in metadata. For these
+        the generated LogQL would match the template, so the LLM call is skipped.
+
+        Args:
+            incident: The incident to investigate
+
+        Returns:
+            True if the simple error query should be used without generation
+        """
+        return (
+            incident.severity in self.TEMPLATE_ONLY_SEVERITIES
+            and len(incident.affected_services) <= 1
+            and not incident.metadata.get("log_labels")
+        )
 
     def _calculate_time_range(self, incident: Incident) -> Tuple[datetime, datetime]:
         """
@@ -296,13 +794,194 @@ class ApplicationAgent:
         Returns:
             Tuple of (start_time, end_time) for observations
         """
-        incident_time = datetime.fromisoformat(incident.start_time.replace("Z", "+00:00"))
-        start_time = incident_time - timedelta(minutes=self.OBSERVATION_WINDOW_MINUTES)
-        end_time = incident_time + timedelta(minutes=self.OBSERVATION_WINDOW_MINUTES)
-        return (start_time, end_time)
+        return _observation_window(incident.start_time, self.OBSERVATION_WINDOW_MINUTES)
+
+    def _time_range_iso(self, incident: Incident) -> Tuple[str, str]:
+        """
+        Observation time window as precomputed ISO 8601 strings.
+
+        Args:
+            incident: The incident to investigate
+
+        Returns:
+            Tuple of (start_iso, end_iso) matching _calculate_time_range
+        """
+        return _observation_window_iso(incident.start_time, self.OBSERVATION_WINDOW_MINUTES)
+
+    def _cached_query(
+        self, service: str, log_level: str, time_range_iso: Tuple[str, str]
+    ) -> str:
+        """
+        Return a QueryGenerator LogQL query, reusing a cached one when possible.
+
+        The cache key is (query_type, service, log_level, window size). The
+        absolute time range is deliberately excluded: LogQL carries no time
+        bounds (start/end are passed to query_range separately), so the same
+        query is valid for any window of that size.
+
+        Args:
+            service: Service to query logs for
+            log_level: Log level to filter on (e.g., "error")
+            time_range_iso: (start, end) ISO strings, used as LLM context on miss
+
+        Returns:
+            LogQL query string
+
+        Raises:
+            BudgetExceededError: If a generation would exceed budget_limit
+        """
+        request = QueryRequest(
+            query_type=QueryType.LOGQL,
+            intent="Find error logs with structured parsing for rate calculation",
+            context={
+                "service": service,
+                "log_level": log_level,
+                "time_range_start": time_range_iso[0],
+                "time_range_end": time_range_iso[1],
+            },
+        )
+        query, generated = self._generate_query_cached(
+            (QueryType.LOGQL.value, service, log_level, self.OBSERVATION_WINDOW_MINUTES),
+            request,
+            cost_category="error_rates",
+        )
+
+        if generated is not None and _debug_enabled():
+            logger.debug(
+                "error_query_generated",
+                query=query,
+                tokens_used=generated.tokens_used,
+                cost=str(generated.cost),
+            )
+
+        return query
+
+    def _generate_query_cached(
+        self,
+        cache_key: Tuple[str, str, str, int],
+        request: QueryRequest,
+        cost_category: Optional[str] = None,
+    ) -> Tuple[str, Optional[GeneratedQuery]]:
+        """
+        Generate a query via QueryGenerator, reusing a cached one for cache_key.
+
+        Callers key on whatever determines the generated text - typically
+        (query_type, service, intent discriminator, window size) - and leave
+        absolute times out since start/end are passed to the backend separately.
+        Entries expire after QUERY_CACHE_TTL_SECONDS. On a cache miss the
+        estimated cost is reserved against the budget before generating and
+        settled to the actual cost afterwards.
+
+        Args:
+            cache_key: Key identifying an equivalent generation request
+            request: QueryRequest sent to the QueryGenerator on a miss
+            cost_category: Optional _observation_costs key for the generation cost
+
+        Returns:
+            Tuple of (query, GeneratedQuery on a miss or None on a cache hit)
+
+        Raises:
+            BudgetExceededError: If a generation would exceed budget_limit
+        """
+        now = time.monotonic()
+        with self._query_cache_lock:
+            entry = self._query_cache.get(cache_key)
+            if entry is not None and entry[2] <= now:
+                # Expired - regenerate below
+                del self._query_cache[cache_key]
+                entry = None
+            if entry is not None:
+                self._query_cache.move_to_end(cache_key)
+                self._query_cache_hits += 1
+                self._query_cost_saved_micro += entry[1]
+            else:
+                self._query_cache_misses += 1
+
+        if spans_enabled():
+            with emit_span(
+                "application_agent.query_cache",
+                attributes={
+                    "outcome": "hit" if entry is not None else "miss",
+                    "service": cache_key[1],
+                    "cost_saved": str(
+                        Decimal(entry[1]) / MICRODOLLARS_PER_DOLLAR if entry else Decimal("0")
+                    ),
+                },
+            ):
+                pass
+
+        if entry is not None:
+            return entry[0], None
+
+        # Reserve the estimate before the expensive QueryGenerator call: observe
+        # sources run concurrently, so a plain check-then-record would let every
+        # thread pass the check before any of them records its cost
+        self._reserve_budget_micro(QUERY_GENERATION_ESTIMATE_MICRO)
+        try:
+            generated = self.query_generator.generate_query(request)
+        except BaseException:
+            self._settle_cost(QUERY_GENERATION_ESTIMATE_MICRO, 0)
+            raise
+        query = generated.query
+        cost_micro = _to_micro(generated.cost)
+        self._settle_cost(QUERY_GENERATION_ESTIMATE_MICRO, cost_micro, cost_category)
+
+        with self._query_cache_lock:
+            self._query_cache[cache_key] = (
+                query,
+                cost_micro,
+                time.monotonic() + self.QUERY_CACHE_TTL_SECONDS,
+            )
+            if len(self._query_cache) > self.QUERY_CACHE_MAX_SIZE:
+                self._query_cache.popitem(last=False)
+
+        return query, generated
+
+    def _query_combined_logs(
+        self, service: str, time_range: Tuple[datetime, datetime]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch error and deployment log lines for a service in one Loki query.
+
+        Both sources share the query's COMBINED_LOGS_LIMIT, so a result that
+        reaches it could be all one source's lines: it is then discarded and
+        each source queries Loki on its own.
+
+        Args:
+            service: Service to query logs for
+            time_range: (start_time, end_time) tuple for observation window
+
+        Returns:
+            Loki entries matching either the error or the deployment filter,
+            or None if the result was truncated
+        """
+        query = _combined_logs_query(service)
+        try:
+            results = self._loki_queries.query_range(
+                query=query,
+                start=time_range[0],
+                end=time_range[1],
+                limit=self.COMBINED_LOGS_LIMIT,
+            )
+        except Exception as e:
+            logger.error("loki_query_failed", query=query, error=str(e))
+            raise
+        results = list(results or ())
+        if len(results) >= self.COMBINED_LOGS_LIMIT:
+            logger.info(
+                "combined_logs_split_on_truncation",
+                service=service,
+                limit=self.COMBINED_LOGS_LIMIT,
+            )
+            return None
+        return results
 
     def _observe_error_rates(
-        self, incident: Incident, time_range: Tuple[datetime, datetime]
+        self,
+        incident: Incident,
+        time_range: Tuple[datetime, datetime],
+        service: str,
+        log_entries: Optional[SharedResult] = None,
     ) -> List[Observation]:
         """
         Observe error rates using QueryGenerator for sophisticated LogQL.
@@ -312,6 +991,10 @@ class ApplicationAgent:
         Args:
             incident: The incident to investigate
             time_range: (start_time, end_time) tuple for observation window
+            service: Primary affected service (resolved once in observe())
+            log_entries: Shared combined-query result (see _query_combined_logs);
+                when given and complete, error lines are selected from it
+                instead of querying
 
         Returns:
             List of error rate observations from Loki logs
@@ -322,72 +1005,80 @@ class ApplicationAgent:
             logger.warning("loki_client_not_available")
             return observations
 
-        service = self._get_primary_service(incident)
+        if self._budget_exhausted():
+            return observations
+
+        entries = log_entries.get() if log_entries is not None else None
+        if entries is not None:
+            # Same selection as |= "error" (case-sensitive substring)
+            results = (e for e in entries if "error" in e.get("line", ""))
+            return self._error_rate_observations(service, _error_query(service), results)
 
-        # Generate query (sophisticated if QueryGenerator available, simple otherwise)
-        if self.query_generator:
+        # Generate query (sophisticated if QueryGenerator available and the
+        # incident warrants it, simple otherwise)
+        if self.query_generator and not self._is_simple_error_query(incident):
             try:
-                # Check budget before expensive QueryGenerator call
-                # Estimate $0.003 per query (typical GPT-4 cost for query generation)
-                self._check_budget(estimated_cost=Decimal("0.003"))
-
-                request = QueryRequest(
-                    query_type=QueryType.LOGQL,
-                    intent="Find error logs with structured parsing for rate calculation",
-                    context={
-                        "service": service,
-                        "log_level": "error",
-                        "time_range_start": time_range[0].isoformat(),
-                        "time_range_end": time_range[1].isoformat(),
-                    },
-                )
-                generated = self.query_generator.generate_query(request)
-                query = generated.query
-                # P1-2 FIX (Alpha): Thread-safe cost tracking
-                with self._cost_lock:
-                    self._total_cost += generated.cost
-                    self._observation_costs["error_rates"] += generated.cost
-
-                logger.debug(
-                    "error_query_generated",
-                    query=query,
-                    tokens_used=generated.tokens_used,
-                    cost=str(generated.cost),
+                query = self._cached_query(
+                    service, "error", self._time_range_iso(incident)
                 )
             except Exception as e:
                 logger.warning("query_generation_failed", error=str(e))
                 # Fallback to simple query
-                query = f'{{service="{service}"}} |= "error"'
+                query = _error_query(service)
         else:
             # Simple query without QueryGenerator
-            query = f'{{service="{service}"}} |= "error"'
+            query = _error_query(service)
 
-        # Query Loki
+        # Query Loki (streamed: only the count and a bounded sample are kept)
         try:
-            results = self.loki.query_range(
+            results = self._loki_queries.iter_query_range(
                 query=query,
                 start=time_range[0],
                 end=time_range[1],
             )
-
-            # Create observation from results
-            if results:
-                observation = Observation(
-                    source=f"loki:error_logs:{service}",
-                    data={"error_count": len(results), "query": query},
-                    description=f"Found {len(results)} error log entries for {service}",
-                    confidence=self.CONFIDENCE_LOG_DATA,
-                )
-                observations.append(observation)
-
+            return self._error_rate_observations(service, query, results)
         except Exception as e:
             logger.error("loki_query_failed", query=query, error=str(e))
             raise
 
-        return observations
+    def _error_rate_observations(
+        self, service: str, query: str, results: Iterable[Dict[str, Any]]
+    ) -> List[Observation]:
+        """
+        Build the error rate observation from matching Loki entries.
+
+        Consumes results in one pass, keeping the count and the first
+        ERROR_SAMPLE_SIZE entries rather than the whole result set.
+
+        Args:
+            service: Service the entries belong to
+            query: LogQL query that produced them
+            results: Error log entries (any iterable, e.g. a streamed response)
+
+        Returns:
+            Single-item list, or empty if there were no error entries
+        """
+        count = 0
+        sample: List[Dict[str, Any]] = []
+        for entry in results:
+            count += 1
+            if len(sample) < self.ERROR_SAMPLE_SIZE:
+                sample.append(entry)
+
+        if not count:
+            return []
+        return [
+            Observation(
+                source=f"loki:error_logs:{service}",
+                data={"error_count": count, "query": query, "sample": sample},
+                description=f"Found {count} error log entries for {service}",
+                confidence=self.CONFIDENCE_LOG_DATA,
+                kind=ObservationKind.ERROR_LOG,
+            )
+        ]
 
     def _observe_latency(
-        self, incident: Incident, time_range: Tuple[datetime, datetime]
+        self, incident: Incident, time_range: Tuple[datetime, datetime], service: str
     ) -> List[Observation]:
         """
         Observe latency from traces.
@@ -397,6 +1088,7 @@ class ApplicationAgent:
         Args:
             incident: The incident to investigate
             time_range: (start_time, end_time) tuple for observation window
+            service: Primary affected service (resolved once in observe())
 
         Returns:
             List of latency observations from Tempo traces
@@ -407,12 +1099,13 @@ class ApplicationAgent:
             logger.warning("tempo_client_not_available")
             return observations
 
-        service = self._get_primary_service(incident)
+        if self._budget_exhausted():
+            return observations
 
         try:
             # Query Tempo for traces (currently no QueryGenerator, $0 cost)
             # Cost tracking infrastructure ready for future TraceQL generation
-            query_cost = Decimal("0.0000")  # Direct Tempo API call, no LLM cost
+            query_cost = 0  # Direct Tempo API call, no LLM cost (micro-dollars)
 
             results = self.tempo.query_traces(
                 service=service,
@@ -421,23 +1114,21 @@ class ApplicationAgent:
             )
 
             # Track cost (Agent Alpha's P1-1 - complete cost tracking)
-            # P1-2 FIX (Alpha): Thread-safe cost tracking
-            with self._cost_lock:
-                self._total_cost += query_cost
-                self._observation_costs["latency"] += query_cost
+            self._record_cost(query_cost, "latency")
 
             if results:
                 # Calculate latency statistics
-                durations = []
-                for trace in results:
-                    if "spans" in trace:
-                        for span in trace["spans"]:
-                            if "duration" in span:
-                                durations.append(span["duration"])
+                durations = [
+                    span["duration"]
+                    for trace in results
+                    if "spans" in trace
+                    for span in trace["spans"]
+                    if "duration" in span
+                ]
 
                 if durations:
-                    avg_duration = sum(durations) / len(durations)
-                    max_duration = max(durations)
+                    avg_duration, max_duration = _latency_stats(durations)
+                    p50_duration, p99_duration = _latency_percentiles(durations)
 
                     observation = Observation(
                         source=f"tempo:traces:{service}",
@@ -445,9 +1136,12 @@ class ApplicationAgent:
                             "trace_count": len(results),
                             "avg_duration_ms": avg_duration,
                             "max_duration_ms": max_duration,
+                            "p50_duration_ms": p50_duration,
+                            "p99_duration_ms": p99_duration,
                         },
                         description=f"Analyzed {len(results)} traces for {service}, avg latency: {avg_duration:.1f}ms",
                         confidence=self.CONFIDENCE_TRACE_DATA,
+                        kind=ObservationKind.TRACE,
                     )
                     observations.append(observation)
 
@@ -458,16 +1152,27 @@ class ApplicationAgent:
         return observations
 
     def _observe_deployments(
-        self, incident: Incident, time_range: Tuple[datetime, datetime]
+        self,
+        incident: Incident,
+        time_range: Tuple[datetime, datetime],
+        service: str,
+        log_entries: Optional[SharedResult] = None,
     ) -> List[Observation]:
         """
         Observe recent deployments from logs.
 
-        Looks for deployment-related log entries around incident time.
+        Looks for deployment-related log entries around incident time: lines
+        matching any of _DEPLOYMENT_PATTERN's keywords (deploy, rollout,
+        canary, release), case-insensitively. Entries without a time or line
+        are skipped.
 
         Args:
             incident: The incident to investigate
             time_range: (start_time, end_time) tuple for observation window
+            service: Primary affected service (resolved once in observe())
+            log_entries: Shared combined-query result (see _query_combined_logs);
+                when given and complete, deployment lines are selected from it
+                instead of querying
 
         Returns:
             List of deployment observations from Loki logs
@@ -478,44 +1183,44 @@ class ApplicationAgent:
             logger.warning("loki_client_not_available_for_deployments")
             return observations
 
-        service = self._get_primary_service(incident)
+        if self._budget_exhausted():
+            return observations
 
         # Simple query for deployment logs (currently no QueryGenerator, $0 cost)
         # Cost tracking infrastructure ready for future LogQL generation
-        query = f'{{service="{service}"}} |= "deployment" or |= "deploy"'
-        query_cost = Decimal("0.0000")  # Direct Loki API call, no LLM cost
+        query = _deployment_query(service)
+        query_cost = 0  # Direct Loki API call, no LLM cost (micro-dollars)
 
         try:
-            results = self.loki.query_range(
-                query=query,
-                start=time_range[0],
-                end=time_range[1],
-            )
+            entries = log_entries.get() if log_entries is not None else None
+            if entries is not None:
+                # Combined result: keep the lines the deployment filter matches
+                results = (e for e in entries if _DEPLOYMENT_RE.search(e.get("line", "")))
+            else:
+                # Own query: Loki applies the deployment filter; streamed
+                results = self._loki_queries.iter_query_range(
+                    query=query,
+                    start=time_range[0],
+                    end=time_range[1],
+                )
 
             # Track cost (Agent Alpha's P1-1 - complete cost tracking)
-            # P1-2 FIX (Alpha): Thread-safe cost tracking
-            with self._cost_lock:
-                self._total_cost += query_cost
-                self._observation_costs["deployments"] += query_cost
+            self._record_cost(query_cost, "deployments")
 
-            if results:
-                # Extract deployment information
-                deployments = []
-                for entry in results:
-                    if "time" in entry and "line" in entry:
-                        deployments.append({
-                            "time": entry["time"],
-                            "log": entry["line"],
-                        })
-
-                if deployments:
-                    observation = Observation(
-                        source=f"loki:deployments:{service}",
-                        data={"deployments": deployments, "count": len(deployments)},
-                        description=f"Found {len(deployments)} deployment-related log entries for {service}",
-                        confidence=self.CONFIDENCE_HEURISTIC_SEARCH,
-                    )
-                    observations.append(observation)
+            # Extract deployment information
+            deployments = [
+                d for d in map(_extract_deployment, results) if d is not None
+            ]
+
+            if deployments:
+                observation = Observation(
+                    source=f"loki:deployments:{service}",
+                    data={"deployments": deployments, "count": len(deployments)},
+                    description=f"Found {len(deployments)} deployment-related log entries for {service}",
+                    confidence=self.CONFIDENCE_HEURISTIC_SEARCH,
+                    kind=ObservationKind.DEPLOYMENT_LOG,
+                )
+                observations.append(observation)
 
         except Exception as e:
             logger.error("deployment_query_failed", service=service, error=str(e))
@@ -543,7 +1248,12 @@ class ApplicationAgent:
         Returns:
             List of hypotheses ranked by confidence (highest first)
         """
-        with emit_span("application_agent.generate_hypothesis", attributes={"agent.id": self.agent_id}):
+        span = (
+            emit_span("application_agent.generate_hypothesis", attributes={"agent.id": self.agent_id})
+            if spans_enabled()
+            else nullcontext()
+        )
+        with span:
             hypotheses = []
 
             if not observations:
@@ -557,6 +1267,9 @@ class ApplicationAgent:
                 detector_count=len(self._hypothesis_detectors),
             )
 
+            # Classify once; detectors read the buckets instead of rescanning
+            observations = self._OBSERVATION_INDEX.of(observations)
+
             # Run all registered hypothesis detectors (Agent Beta's P0-1 - extensibility)
             # Each detector returns Hypothesis or None
             for detector in self._hypothesis_detectors:
@@ -564,12 +1277,13 @@ class ApplicationAgent:
                     hypothesis = detector(observations)
                     if hypothesis:
                         hypotheses.append(hypothesis)
-                        logger.debug(
-                            "hypothesis_generated",
-                            detector=detector.__name__,
-                            statement=hypothesis.statement,
-                            confidence=hypothesis.initial_confidence,
-                        )
+                        if _debug_enabled():
+                            logger.debug(
+                                "hypothesis_generated",
+                                detector=detector.__name__,
+                                statement=hypothesis.statement,
+                                confidence=hypothesis.initial_confidence,
+                            )
                 except Exception as e:
                     logger.warning(
                         "hypothesis_detector_failed",
@@ -656,9 +1370,9 @@ class ApplicationAgent:
         Returns:
             Detection data dict if pattern found, None otherwise
         """
-        # Find deployment observations
-        deployment_obs = [obs for obs in observations if "deployment" in obs.source.lower()]
-        error_obs = [obs for obs in observations if "error" in obs.source.lower()]
+        index = ObservationIndex.of(observations)
+        deployment_obs = index.deployment
+        error_obs = index.error
 
         if not deployment_obs or not error_obs:
             return None
@@ -704,7 +1418,8 @@ class ApplicationAgent:
             Detection data dict if pattern found, None otherwise
         """
         # Find latency observations
-        latency_obs = [obs for obs in observations if "latency" in obs.description.lower() or "trace" in obs.source.lower()]
+        index = ObservationIndex.of(observations)
+        latency_obs = index.latency
 
         if not latency_obs:
             return None
@@ -740,7 +1455,8 @@ class ApplicationAgent:
             Detection data dict if pattern found, None otherwise
         """
         # Find memory observations
-        memory_obs = [obs for obs in observations if "memory" in obs.description.lower() or "memory" in obs.source.lower()]
+        index = ObservationIndex.of(observations)
+        memory_obs = index.memory
 
         if not memory_obs:
             return None
@@ -766,7 +1482,7 @@ class ApplicationAgent:
             return None
 
         # Find corresponding deployment
-        deployment_obs = [obs for obs in observations if "deployment" in obs.source.lower()]
+        deployment_obs = index.deployment
         deployment_id = "unknown"
         deployment_time = memory_data.timestamp.isoformat()
 
@@ -6,30 +6,252 @@ metrics, logs, and traces from MCP servers (Grafana and Tempo).
 Design:
 - Inherits from ScientificAgent for hypothesis-driven investigation
 - Implements OODA loop with observe(), generate_disproof_strategies()
-- Queries Grafana MCP (metrics + logs) and Tempo MCP (traces) sequentially
+- Queries Grafana MCP (metrics + logs, batched via bulk_query) and Tempo MCP (traces)
 - Caches observe() results for 5 minutes to avoid redundant queries
 - Uses LLM for hypothesis generation with cost tracking
 - Fully synchronous for MVP simplicity (P0-3 fix)
 """
 
+import copy
+import hashlib
+import heapq
+import json
+import logging
+import re
 import threading
 import time
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, cast
+from functools import partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union, cast
 
 import structlog
 
 from compass.agents.base import ScientificAgent
-from compass.core.scientific_framework import Hypothesis
+from compass.agents.workers.database_agent_prompts import SYSTEM_PROMPT, format_hypothesis_prompt
+from compass.core.scientific_framework import Hypothesis, Incident
 from compass.integrations.mcp.base import MCPConnectionError, MCPQueryError
 from compass.integrations.mcp.grafana_client import GrafanaMCPClient
 from compass.integrations.mcp.tempo_client import TempoMCPClient
 from compass.observability import emit_span
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json for prompt serialization and response parsing
+    orjson = None  # type: ignore[assignment]
+
 logger = structlog.get_logger(__name__)
 
+# stdlib logger behind the structlog proxy - lets the cache-hit paths skip
+# building debug event dicts when DEBUG is filtered out anyway
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Whether debug records from this module would be emitted."""
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+
 # Cache TTL for observe() method
 OBSERVE_CACHE_TTL_SECONDS = 300  # 5 minutes
+OBSERVE_CACHE_MAX_ENTRIES = 64  # Per-incident entries kept before evicting the oldest
+
+# Identical LLM hypothesis prompts within this window reuse the first answer
+HYPOTHESIS_CACHE_TTL_SECONDS = 60
+HYPOTHESIS_CACHE_MAX_ENTRIES = 32
+
+# Prompt size caps for generate_hypothesis_with_llm (per metrics/logs/traces section)
+PROMPT_SECTION_MAX_CHARS = 4000
+PROMPT_LIST_EDGE_ITEMS = 10  # Entries kept from each end of a long list
+
+# Disproof strategies whose priority depends on the hypothesis statement:
+# (template, keyword pattern, priority on match, priority otherwise). Keyword
+# patterns are plain substring alternations (no word boundaries), matching the
+# `word in statement` checks they replaced.
+_DYNAMIC_STRATEGIES: Tuple[Tuple[Dict[str, Any], Pattern[str], float, float], ...] = (
+    # 1. Temporal Contradiction - High priority for time-based hypotheses
+    (
+        {
+            "strategy": "temporal_contradiction",
+            "method": "Verify timing: did database issue occur before or after symptom onset?",
+            "expected_if_true": "Database metrics should degrade before user-facing symptoms appear",
+        },
+        re.compile("started|time|since|after|before"),
+        0.9,
+        0.7,
+    ),
+    # 2. Scope Verification - High priority for system/component-specific hypotheses
+    (
+        {
+            "strategy": "scope_verification",
+            "method": "Isolate scope: is issue isolated to specific database/table/query?",
+            "expected_if_true": "Issue should be isolated to the specific database component mentioned",
+        },
+        re.compile("table|database|replica|shard|cluster"),
+        0.8,
+        0.6,
+    ),
+    # 3. Correlation vs Causation - High priority for correlation-based hypotheses
+    (
+        {
+            "strategy": "correlation_vs_causation",
+            "method": "Test causation: does changing database state directly affect symptoms?",
+            "expected_if_true": "Symptoms should vary proportionally with database metric changes",
+        },
+        re.compile("correlate|correlation|with|and"),
+        0.85,
+        0.65,
+    ),
+)
+
+# Fixed-priority disproof strategies, already sorted highest priority first
+_STATIC_STRATEGIES: Tuple[Dict[str, Any], ...] = (
+    # 4. Metric Baseline Deviation - Always relevant for database performance
+    {
+        "strategy": "metric_baseline_deviation",
+        "method": "Compare current metrics against historical baselines and SLOs",
+        "expected_if_true": "Database metrics should exceed known baseline/threshold values",
+        "priority": 0.75,
+    },
+    # 5. External Factor Elimination - Check for confounding variables
+    {
+        "strategy": "external_factor_elimination",
+        "method": "Rule out external factors: network, disk, upstream/downstream services",
+        "expected_if_true": "External factors should be stable/normal during incident",
+        "priority": 0.7,
+    },
+    # 6. Alternate Hypothesis - Always generate competing explanations
+    {
+        "strategy": "alternate_hypothesis",
+        "method": "Generate and test competing explanations for observed symptoms",
+        "expected_if_true": "Alternate hypotheses should be less consistent with observations",
+        "priority": 0.6,
+    },
+    # 7. Consistency Check - Verify hypothesis consistency
+    {
+        "strategy": "consistency_check",
+        "method": "Check if hypothesis is consistent with ALL available observations",
+        "expected_if_true": "All logs, metrics, and traces should align with hypothesis",
+        "priority": 0.55,
+    },
+)
+
+
+# Strategy sort key; used with reverse=True for highest priority first
+_PRIORITY = itemgetter("priority")
+
+
+def _unwrap_outcome(outcome: Union[Dict[str, Any], Exception]) -> Dict[str, Any]:
+    """Return a pre-fetched source result, re-raising it if it was a failure."""
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize observation data for the LLM prompt (2-space indent)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects non-str dict keys and integers beyond 64 bits;
+            # stdlib json handles both
+            pass
+    return json.dumps(obj, indent=2)
+
+
+def _sample_lists(value: Any, edge_items: int) -> Any:
+    """Shorten long lists to their first/last edge_items entries (recursively).
+
+    Returns value itself (not a copy) when nothing needed shortening, so callers
+    can skip re-serializing it.
+    """
+    if isinstance(value, dict):
+        sampled_dict = {key: _sample_lists(item, edge_items) for key, item in value.items()}
+        if all(sampled_dict[key] is item for key, item in value.items()):
+            return value
+        return sampled_dict
+    if isinstance(value, list):
+        if len(value) > 2 * edge_items:
+            omitted = len(value) - 2 * edge_items
+            return [
+                *(_sample_lists(item, edge_items) for item in value[:edge_items]),
+                f"...[{omitted} entries omitted]...",
+                *(_sample_lists(item, edge_items) for item in value[-edge_items:]),
+            ]
+        sampled_list = [_sample_lists(item, edge_items) for item in value]
+        if all(new is old for new, old in zip(sampled_list, value)):
+            return value
+        return sampled_list
+    return value
+
+
+def _truncate_for_prompt(payload: Any, max_chars: int = PROMPT_SECTION_MAX_CHARS) -> str:
+    """Serialize a prompt section, capped at roughly max_chars.
+
+    Long lists are sampled first (head and tail entries) so the section stays
+    valid JSON; only if that is still too long is the text cut in the middle.
+    """
+    text = _dumps_indented(payload)
+    if len(text) <= max_chars:
+        return text
+    sampled = _sample_lists(payload, PROMPT_LIST_EDGE_ITEMS)
+    if sampled is not payload:
+        # Only re-serialize when sampling dropped something; a payload that is
+        # large because of one huge value would otherwise be dumped twice
+        text = _dumps_indented(sampled)
+        if len(text) <= max_chars:
+            return text
+    half = max_chars // 2
+    omitted = len(text) - 2 * half
+    return f"{text[:half]}\n...[{omitted} chars omitted]...\n{text[-half:]}"
+
+
+def _fresh_hypothesis_copy(hypothesis: Hypothesis) -> Hypothesis:
+    """Deep copy of a cached hypothesis with its own id and timestamp."""
+    duplicate = copy.deepcopy(hypothesis)
+    duplicate.id = str(uuid.uuid4())
+    duplicate.timestamp = datetime.now(timezone.utc)
+    return duplicate
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Serialize an observe() result for the compressed cache."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(content: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes (orjson.JSONDecodeError subclasses json's)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Markdown code fence around an LLM JSON response: opening fence line
+# (```json or ```), body, and optional closing fence on its own line
+_CODE_FENCE_RE = re.compile(r"^```[^\n]*\n?(.*?)(?:\n[ \t]*```)?$", re.DOTALL)
+
+# Default query parameters per observe() source (logged as `query` on failure).
+# Result sizes are capped at the source where the query language allows it:
+# topk for PromQL, limit for TraceQL. LogQL has no in-query line limit.
+# Override per agent with config["source_queries"], e.g.
+# {"logs": {"duration": "1m"}}, or point metrics at the pre-aggregated
+# recording rule in observability/prometheus-rules.yml.
+_SOURCE_QUERY_CONTEXT: Dict[str, Dict[str, Any]] = {
+    "metrics": {"query": "topk(50, db_connections)", "datasource_uid": "prometheus"},
+    "logs": {"query": '{app="postgres"}', "datasource_uid": "loki", "duration": "5m"},
+    "traces": {"query": '{service.name="database"}', "limit": 20},
+}
 
 
 class DatabaseAgent(ScientificAgent):
@@ -65,7 +287,8 @@ class DatabaseAgent(ScientificAgent):
             agent_id: Unique identifier for this agent
             grafana_client: Grafana MCP client for metrics and logs
             tempo_client: Tempo MCP client for traces
-            config: Optional configuration dictionary
+            config: Optional configuration dictionary (supports "cache_compress",
+                per-source "source_queries" overrides and "prompt_section_max_chars")
             budget_limit: Optional budget limit in USD (default: no limit)
         """
         # Call parent constructor
@@ -80,10 +303,29 @@ class DatabaseAgent(ScientificAgent):
         self.grafana_client = grafana_client
         self.tempo_client = tempo_client
 
-        # Cache for observe() results
-        self._observe_cache: Optional[Dict[str, Any]] = None
-        self._observe_cache_time: Optional[float] = None
+        # Per-source query parameters: module defaults plus config overrides
+        overrides = self.config.get("source_queries", {})
+        self._source_queries: Dict[str, Dict[str, Any]] = {
+            key: {**defaults, **overrides.get(key, {})}
+            for key, defaults in _SOURCE_QUERY_CONTEXT.items()
+        }
+
+        # Cache for observe() results, keyed by incident: incident_id ->
+        # (result, time.monotonic() of fill). Bounded to OBSERVE_CACHE_MAX_ENTRIES
+        # so agents reused across incidents don't grow without limit. With
+        # config["cache_compress"] results are held as zlib-compressed JSON bytes.
+        self._observe_cache: "OrderedDict[str, Tuple[Union[Dict[str, Any], bytes], float]]" = (
+            OrderedDict()
+        )
+        self._cache_compress = bool(self.config.get("cache_compress", False))
         self._cache_lock = threading.Lock()  # Prevent race conditions in cache access
+        # Single-flight per incident: concurrent cold-cache callers wait on the owner's query
+        self._observe_inflight: Dict[str, "Future[Dict[str, Any]]"] = {}
+
+        # LLM hypotheses keyed by prompt digest: digest -> (immutable snapshot,
+        # time.monotonic() of fill), with the same single-flight treatment as observe()
+        self._hypothesis_cache: "OrderedDict[bytes, Tuple[Hypothesis, float]]" = OrderedDict()
+        self._hypothesis_inflight: Dict[bytes, "Future[Hypothesis]"] = {}
 
         logger.info(
             "database_agent.initialized",
@@ -92,15 +334,42 @@ class DatabaseAgent(ScientificAgent):
             has_tempo=tempo_client is not None,
         )
 
-    def observe(self) -> Dict[str, Any]:
+    def warmup(self) -> None:
+        """Open MCP client sessions ahead of the first observe().
+
+        Optional - sessions otherwise open lazily on the first query. The
+        clients keep them on a persistent loop, so later observe() cycles reuse
+        the same connections instead of reconnecting.
+        """
+        for client in (self.grafana_client, self.tempo_client):
+            if isinstance(client, (GrafanaMCPClient, TempoMCPClient)):
+                try:
+                    client.warmup()
+                except MCPConnectionError as e:
+                    logger.warning(
+                        "database_agent.warmup_failed",
+                        agent_id=self.agent_id,
+                        client=type(client).__name__,
+                        error=str(e),
+                    )
+
+    def observe(self, incident: Optional[Incident] = None) -> Dict[str, Any]:
         """Execute Observe phase: gather database metrics, logs, traces.
 
         Queries Grafana MCP for metrics (PromQL) and logs (LogQL), and
-        Tempo MCP for distributed traces (TraceQL). Queries execute
-        sequentially for MVP simplicity (P0-3 fix).
+        Tempo MCP for distributed traces (TraceQL). A GrafanaMCPClient gets
+        metrics and logs in one bulk_query pass; the remaining sources run
+        one after another on the calling thread (P0-3 fix).
 
-        Results are cached for 5 minutes to avoid redundant MCP queries
-        during repeated observe() calls.
+        Results are cached per incident for 5 minutes to avoid redundant MCP
+        queries during repeated observe() calls. Concurrent cold-cache
+        callers for the same incident share one query pass.
+
+        Args:
+            incident: Incident the observations belong to (as passed by the
+                Orchestrator). Results are cached per incident_id, so cached
+                results don't leak between investigations; without an incident
+                a single shared "default" entry is used
 
         Returns:
             Dictionary with structure:
@@ -124,131 +393,178 @@ class DatabaseAgent(ScientificAgent):
                 "agent.has_tempo": self.tempo_client is not None,
             },
         ) as span:
-            # Use lock to prevent race conditions in concurrent cache access
+            incident_id = incident.incident_id if incident is not None else "default"
+
+            # Warm cache: lock-free read (see _fresh_cache)
+            cached = self._fresh_cache(span, incident_id)
+            if cached is not None:
+                return cached
+
+            # Cold cache: hold the lock only to claim or join the in-flight query,
+            # not for the MCP round-trips themselves
             with self._cache_lock:
-                # Check cache first
-                current_time = time.time()
-                if (
-                    self._observe_cache is not None
-                    and self._observe_cache_time is not None
-                    and (current_time - self._observe_cache_time) < OBSERVE_CACHE_TTL_SECONDS
-                ):
-                    span.set_attribute("cache.hit", True)
-                    span.set_attribute("cache.age_seconds", current_time - self._observe_cache_time)
-                    logger.debug(
-                        "database_agent.observe_cache_hit",
-                        agent_id=self.agent_id,
-                        cache_age_seconds=current_time - self._observe_cache_time,
-                    )
-                    return self._observe_cache
-
-                span.set_attribute("cache.hit", False)
-                logger.info("database_agent.observe_started", agent_id=self.agent_id)
-
-                # Initialize result structure
-                result: Dict[str, Any] = {
-                    "metrics": {},
-                    "logs": {},
-                    "traces": {},
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "confidence": 0.0,
-                }
-
-                # If no MCP clients configured, return empty result
-                if self.grafana_client is None and self.tempo_client is None:
-                    logger.warning("database_agent.no_mcp_clients", agent_id=self.agent_id)
-                    span.set_attribute("mcp.sources_configured", 0)
-                    self._observe_cache = result
-                    self._observe_cache_time = current_time
-                    return result
-
-                # Query all MCP sources sequentially (P0-3 fix)
-                # Execute queries sequentially and collect results
-                successful_sources = 0
-                total_sources = 0
-
-                # Metrics
-                if self.grafana_client is not None:
-                    total_sources += 1
-                    try:
-                        metrics_result = self._query_metrics()
-                        result["metrics"] = metrics_result
-                        successful_sources += 1
-                    except Exception as e:
-                        logger.warning(
-                            "database_agent.metrics_query_failed",
-                            agent_id=self.agent_id,
-                            error_type=type(e).__name__,
-                            error=str(e),
-                            query="db_connections",
-                            datasource_uid="prometheus",
-                            exc_info=True,
-                        )
-                        result["metrics"] = {}
-
-                # Logs
-                if self.grafana_client is not None:
-                    total_sources += 1
-                    try:
-                        logs_result = self._query_logs()
-                        result["logs"] = logs_result
-                        successful_sources += 1
-                    except Exception as e:
-                        logger.warning(
-                            "database_agent.logs_query_failed",
-                            agent_id=self.agent_id,
-                            error_type=type(e).__name__,
-                            error=str(e),
-                            query='{app="postgres"}',
-                            datasource_uid="loki",
-                            duration="5m",
-                            exc_info=True,
-                        )
-                        result["logs"] = {}
-
-                # Traces
-                if self.tempo_client is not None:
-                    total_sources += 1
-                    try:
-                        traces_result = self._query_traces()
-                        result["traces"] = traces_result
-                        successful_sources += 1
-                    except Exception as e:
-                        logger.warning(
-                            "database_agent.traces_query_failed",
-                            agent_id=self.agent_id,
-                            error_type=type(e).__name__,
-                            error=str(e),
-                            query='{service.name="database"}',
-                            limit=20,
-                            exc_info=True,
-                        )
-                        result["traces"] = {}
-
-                # Calculate confidence based on successful sources
-                if total_sources > 0:
-                    result["confidence"] = successful_sources / total_sources
-                else:
-                    result["confidence"] = 0.0
-
-                # Set span attributes for observability
-                span.set_attribute("mcp.sources_total", total_sources)
-                span.set_attribute("mcp.sources_successful", successful_sources)
-                span.set_attribute("observe.confidence", result["confidence"])
-
-                logger.info(
-                    "database_agent.observe_completed",
+                cached = self._fresh_cache(span, incident_id)
+                if cached is not None:
+                    return cached
+                inflight = self._observe_inflight.get(incident_id)
+                owner = inflight is None
+                if owner:
+                    inflight = self._observe_inflight[incident_id] = Future()
+
+            if not owner:
+                span.set_attribute("cache.coalesced", True)
+                if _debug_enabled():
+                    logger.debug("database_agent.observe_coalesced", agent_id=self.agent_id)
+                return inflight.result()
+
+            try:
+                result = self._observe_sources(span, incident_id)
+            except BaseException as e:
+                inflight.set_exception(e)
+                raise
+            else:
+                inflight.set_result(result)
+            finally:
+                with self._cache_lock:
+                    del self._observe_inflight[incident_id]
+            return result
+
+    def _fresh_cache(self, span: Any, incident_id: str) -> Optional[Dict[str, Any]]:
+        """Return the incident's cached observe() result if still within its TTL.
+
+        Safe without the lock: each entry is a single (result, fill time) tuple,
+        so a reader never pairs one fill's result with another's timestamp.
+        """
+        entry = self._observe_cache.get(incident_id)
+        if entry is None:
+            return None
+        cache, cache_time = entry
+        cache_age = time.monotonic() - cache_time
+        if cache_age >= OBSERVE_CACHE_TTL_SECONDS:
+            return None
+        span.set_attribute("cache.hit", True)
+        span.set_attribute("cache.age_seconds", cache_age)
+        if _debug_enabled():
+            logger.debug(
+                "database_agent.observe_cache_hit",
+                agent_id=self.agent_id,
+                cache_age_seconds=cache_age,
+            )
+        if isinstance(cache, bytes):
+            return cast(Dict[str, Any], _loads(zlib.decompress(cache)))
+        return cache
+
+    def _store_cache(self, incident_id: str, result: Dict[str, Any], current_time: float) -> None:
+        """Cache an incident's observe() result, evicting the oldest fill when full."""
+        cached: Union[Dict[str, Any], bytes] = result
+        if self._cache_compress:
+            try:
+                cached = zlib.compress(_dumps_compact(result), 1)
+            except (TypeError, ValueError):
+                # Not JSON-serializable - keep the dict as-is
+                logger.debug("database_agent.cache_compress_skipped", agent_id=self.agent_id)
+        with self._cache_lock:
+            self._observe_cache[incident_id] = (cached, current_time)
+            self._observe_cache.move_to_end(incident_id)
+            while len(self._observe_cache) > OBSERVE_CACHE_MAX_ENTRIES:
+                self._observe_cache.popitem(last=False)
+
+    def _observe_sources(self, span: Any, incident_id: str) -> Dict[str, Any]:
+        """Query all MCP sources and cache the combined result (cache miss path)."""
+        current_time = time.monotonic()
+        span.set_attribute("cache.hit", False)
+        logger.info("database_agent.observe_started", agent_id=self.agent_id)
+
+        # Initialize result structure
+        result: Dict[str, Any] = {
+            "metrics": {},
+            "logs": {},
+            "traces": {},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "confidence": 0.0,
+        }
+
+        # If no MCP clients configured, return empty result
+        if self.grafana_client is None and self.tempo_client is None:
+            logger.warning("database_agent.no_mcp_clients", agent_id=self.agent_id)
+            span.set_attribute("mcp.sources_configured", 0)
+            self._store_cache(incident_id, result, current_time)
+            return result
+
+        # Query all MCP sources sequentially (P0-3 fix). Sources are keyed by
+        # result field so success/failure handling is one uniform loop.
+        sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        if isinstance(self.grafana_client, GrafanaMCPClient):
+            # Metrics + logs in one MCP pass instead of two sequential calls
+            grafana = self._query_grafana_bulk()
+            sources["metrics"] = partial(_unwrap_outcome, grafana["metrics"])
+            sources["logs"] = partial(_unwrap_outcome, grafana["logs"])
+        elif self.grafana_client is not None:
+            sources["metrics"] = self._query_metrics
+            sources["logs"] = self._query_logs
+        if self.tempo_client is not None:
+            sources["traces"] = self._query_traces
+
+        successful_sources = 0
+        total_sources = len(sources)
+        for key, query_source in sources.items():
+            try:
+                result[key] = query_source()
+                successful_sources += 1
+            except Exception as e:
+                logger.warning(
+                    f"database_agent.{key}_query_failed",
                     agent_id=self.agent_id,
-                    successful_sources=successful_sources,
-                    total_sources=total_sources,
-                    confidence=result["confidence"],
+                    error_type=type(e).__name__,
+                    error=str(e),
+                    query=self._source_queries[key],
+                    exc_info=True,
                 )
+                result[key] = {}
+
+        # Calculate confidence based on successful sources
+        if total_sources > 0:
+            result["confidence"] = successful_sources / total_sources
+        else:
+            result["confidence"] = 0.0
+
+        # Set span attributes for observability
+        span.set_attribute("mcp.sources_total", total_sources)
+        span.set_attribute("mcp.sources_successful", successful_sources)
+        span.set_attribute("observe.confidence", result["confidence"])
+
+        logger.info(
+            "database_agent.observe_completed",
+            agent_id=self.agent_id,
+            successful_sources=successful_sources,
+            total_sources=total_sources,
+            confidence=result["confidence"],
+        )
 
-                # Cache the result
-                self._observe_cache = result
-                self._observe_cache_time = current_time
+        # Cache the result
+        self._store_cache(incident_id, result, current_time)
 
-                return result
+        return result
+
+    def _query_grafana_bulk(self) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Query metrics and logs via one GrafanaMCPClient.bulk_query call.
+
+        Returns:
+            Per-source response data, or the exception that source raised
+            (a failure of the whole call is reported for both sources)
+        """
+        assert isinstance(self.grafana_client, GrafanaMCPClient)
+        try:
+            bulk = self.grafana_client.bulk_query_sync(
+                promql=[self._source_queries["metrics"]],
+                logql=[self._source_queries["logs"]],
+            )
+        except Exception as e:
+            return {"metrics": e, "logs": e}
+        return {
+            key: outcome if isinstance(outcome, Exception) else cast(Dict[str, Any], outcome.data)
+            for key, outcome in (("metrics", bulk.metrics[0]), ("logs", bulk.logs[0]))
+        }
 
     def _query_metrics(self) -> Dict[str, Any]:
         """Query Prometheus/Mimir metrics via Grafana MCP.
@@ -263,12 +579,10 @@ class DatabaseAgent(ScientificAgent):
         if self.grafana_client is None:
             return {}
 
-        # Query database-specific metrics
-        # TODO: Make these queries configurable
+        # Query database-specific metrics (overridable via config["source_queries"])
         # Note: Synchronous call (P0-3 fix)
         response = self.grafana_client.query_promql(
-            query="db_connections",
-            datasource_uid="prometheus",
+            **self._source_queries["metrics"],
         )
 
         return cast(Dict[str, Any], response.data)
@@ -286,13 +600,10 @@ class DatabaseAgent(ScientificAgent):
         if self.grafana_client is None:
             return {}
 
-        # Query database-specific logs
-        # TODO: Make these queries configurable
+        # Query database-specific logs (overridable via config["source_queries"])
         # Note: Synchronous call (P0-3 fix)
         response = self.grafana_client.query_logql(
-            query='{app="postgres"}',
-            datasource_uid="loki",
-            duration="5m",
+            **self._source_queries["logs"],
         )
 
         return cast(Dict[str, Any], response.data)
@@ -310,12 +621,10 @@ class DatabaseAgent(ScientificAgent):
         if self.tempo_client is None:
             return {}
 
-        # Query database-specific traces
-        # TODO: Make these queries configurable
+        # Query database-specific traces (overridable via config["source_queries"])
         # Note: Synchronous call (P0-3 fix)
         response = self.tempo_client.query_traceql(
-            query='{service.name="database"}',
-            limit=20,
+            **self._source_queries["traces"],
         )
 
         return cast(Dict[str, Any], response.data)
@@ -339,73 +648,19 @@ class DatabaseAgent(ScientificAgent):
         """
         statement = hypothesis.statement.lower()
 
-        # Build list of strategies with dynamic priorities
-        strategies = []
-
-        # 1. Temporal Contradiction - High priority for time-based hypotheses
-        temporal_priority = 0.9 if any(word in statement for word in ["started", "time", "since", "after", "before"]) else 0.7
-        strategies.append({
-            "strategy": "temporal_contradiction",
-            "method": "Verify timing: did database issue occur before or after symptom onset?",
-            "expected_if_true": "Database metrics should degrade before user-facing symptoms appear",
-            "priority": temporal_priority,
-        })
-
-        # 2. Scope Verification - High priority for system/component-specific hypotheses
-        scope_priority = 0.8 if any(word in statement for word in ["table", "database", "replica", "shard", "cluster"]) else 0.6
-        strategies.append({
-            "strategy": "scope_verification",
-            "method": "Isolate scope: is issue isolated to specific database/table/query?",
-            "expected_if_true": "Issue should be isolated to the specific database component mentioned",
-            "priority": scope_priority,
-        })
-
-        # 3. Correlation vs Causation - High priority for correlation-based hypotheses
-        correlation_priority = 0.85 if any(word in statement for word in ["correlate", "correlation", "with", "and"]) else 0.65
-        strategies.append({
-            "strategy": "correlation_vs_causation",
-            "method": "Test causation: does changing database state directly affect symptoms?",
-            "expected_if_true": "Symptoms should vary proportionally with database metric changes",
-            "priority": correlation_priority,
-        })
-
-        # 4. Metric Baseline Deviation - Always relevant for database performance
-        strategies.append({
-            "strategy": "metric_baseline_deviation",
-            "method": "Compare current metrics against historical baselines and SLOs",
-            "expected_if_true": "Database metrics should exceed known baseline/threshold values",
-            "priority": 0.75,
-        })
-
-        # 5. External Factor Elimination - Check for confounding variables
-        strategies.append({
-            "strategy": "external_factor_elimination",
-            "method": "Rule out external factors: network, disk, upstream/downstream services",
-            "expected_if_true": "External factors should be stable/normal during incident",
-            "priority": 0.7,
-        })
-
-        # 6. Alternate Hypothesis - Always generate competing explanations
-        strategies.append({
-            "strategy": "alternate_hypothesis",
-            "method": "Generate and test competing explanations for observed symptoms",
-            "expected_if_true": "Alternate hypotheses should be less consistent with observations",
-            "priority": 0.6,
-        })
-
-        # 7. Consistency Check - Verify hypothesis consistency
-        strategies.append({
-            "strategy": "consistency_check",
-            "method": "Check if hypothesis is consistent with ALL available observations",
-            "expected_if_true": "All logs, metrics, and traces should align with hypothesis",
-            "priority": 0.55,
-        })
-
-        # Sort by priority (highest first) and return
-        strategies.sort(key=lambda s: cast(float, s["priority"]), reverse=True)
-
-        # Return top 5-7 strategies (we generated 7, so return all)
-        return strategies
+        # Only the three statement-dependent strategies are built per call
+        dynamic = [
+            dict(template, priority=high if keywords.search(statement) else low)
+            for template, keywords, high, low in _DYNAMIC_STRATEGIES
+        ]
+        dynamic.sort(key=_PRIORITY, reverse=True)
+
+        # Merge with the pre-sorted static strategies (copied so callers own
+        # their dicts). On equal priority dynamic strategies come first, as
+        # with the previous stable sort over all seven.
+        return list(
+            heapq.merge(dynamic, map(dict, _STATIC_STRATEGIES), key=_PRIORITY, reverse=True)
+        )
 
     def generate_hypothesis_with_llm(
         self,
@@ -443,14 +698,12 @@ class DatabaseAgent(ScientificAgent):
                 "Set llm_provider to use generate_hypothesis_with_llm()"
             )
 
-        # Import prompts
-        from compass.agents.workers.database_agent_prompts import format_hypothesis_prompt, SYSTEM_PROMPT
-
-        # Format observations for prompt
-        import json as json_module
-        metrics_str = json_module.dumps(observations.get("metrics", {}), indent=2)
-        logs_str = json_module.dumps(observations.get("logs", {}), indent=2)
-        traces_str = json_module.dumps(observations.get("traces", {}), indent=2)
+        # Format observations for prompt, capping each section's size so large
+        # log/trace payloads don't inflate token cost
+        max_chars = self.config.get("prompt_section_max_chars", PROMPT_SECTION_MAX_CHARS)
+        metrics_str = _truncate_for_prompt(observations.get("metrics", {}), max_chars)
+        logs_str = _truncate_for_prompt(observations.get("logs", {}), max_chars)
+        traces_str = _truncate_for_prompt(observations.get("traces", {}), max_chars)
 
         # Build prompt
         prompt = format_hypothesis_prompt(
@@ -462,10 +715,69 @@ class DatabaseAgent(ScientificAgent):
             context=context or "",
         )
 
+        # Identical prompts (same cached observations + context) get the same
+        # answer: reuse it within HYPOTHESIS_CACHE_TTL_SECONDS instead of paying again.
+        # Reused answers make no LLM call, so they record no cost and are not
+        # charged against budget_limit; their metadata keeps the original
+        # call's llm_cost for reference.
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        cached = self._cached_hypothesis(key)
+        if cached is not None:
+            return cached
+
+        with self._cache_lock:
+            cached = self._cached_hypothesis(key)
+            if cached is not None:
+                return cached
+            inflight = self._hypothesis_inflight.get(key)
+            owner = inflight is None
+            if owner:
+                inflight = self._hypothesis_inflight[key] = Future()
+
+        if not owner:
+            return _fresh_hypothesis_copy(inflight.result())
+
+        # The parsed hypothesis becomes the shared snapshot: it is never handed
+        # out itself, so every caller (this one included) gets its own copy and
+        # nobody can mutate it while a waiter is copying
+        try:
+            snapshot = self._hypothesis_from_llm(prompt, has_context=context is not None)
+        except BaseException as e:
+            with self._cache_lock:
+                del self._hypothesis_inflight[key]
+            inflight.set_exception(e)
+            raise
+        with self._cache_lock:
+            del self._hypothesis_inflight[key]
+            self._hypothesis_cache[key] = (snapshot, time.monotonic())
+            self._hypothesis_cache.move_to_end(key)
+            while len(self._hypothesis_cache) > HYPOTHESIS_CACHE_MAX_ENTRIES:
+                self._hypothesis_cache.popitem(last=False)
+        inflight.set_result(snapshot)
+        # Keeps the id and timestamp logged by database_agent.hypothesis_generated
+        return copy.deepcopy(snapshot)
+
+    def _cached_hypothesis(self, key: bytes) -> Optional[Hypothesis]:
+        """Return a fresh copy of a cached hypothesis for this prompt, if still valid."""
+        entry = self._hypothesis_cache.get(key)
+        if entry is None or time.monotonic() - entry[1] >= HYPOTHESIS_CACHE_TTL_SECONDS:
+            return None
+        if _debug_enabled():
+            logger.debug("database_agent.hypothesis_cache_hit", agent_id=self.agent_id)
+        return _fresh_hypothesis_copy(entry[0])
+
+    def _hypothesis_from_llm(self, prompt: str, has_context: bool) -> Hypothesis:
+        """Call the LLM with a formatted prompt and parse its hypothesis.
+
+        Raises:
+            ValueError: If the LLM returns invalid JSON or invalid fields
+            BudgetExceededError: If generating hypothesis would exceed budget
+        """
+        assert self.llm_provider is not None
         logger.info(
             "database_agent.generating_hypothesis",
             agent_id=self.agent_id,
-            has_context=context is not None,
+            has_context=has_context,
         )
 
         # Call LLM provider (synchronous - P0-3 fix)
@@ -489,18 +801,12 @@ class DatabaseAgent(ScientificAgent):
             content = response.content.strip()
 
             # Remove markdown code fences (```json...``` or ```...```)
-            if content.startswith("```"):
-                # Remove opening fence (```json or ```)
-                lines = content.split("\n")
-                if lines[0].startswith("```"):
-                    lines = lines[1:]  # Remove first line
-                # Remove closing fence
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]  # Remove last line
-                content = "\n".join(lines).strip()
-
-            hypothesis_data = json_module.loads(content)
-        except json_module.JSONDecodeError as e:
+            fenced = _CODE_FENCE_RE.match(content)
+            if fenced:
+                content = fenced.group(1).strip()
+
+            hypothesis_data = _loads(content)
+        except json.JSONDecodeError as e:
             raise ValueError(
                 f"LLM returned invalid JSON. Response: {response.content[:200]}"
             ) from e
@@ -10,6 +10,9 @@ Design Principles:
 - Guide LLM to generate testable, falsifiable hypotheses
 """
 
+from string import Formatter
+from typing import Tuple
+
 # System prompt providing database domain context
 SYSTEM_PROMPT = """You are an expert database reliability engineer investigating database-related incidents.
 
@@ -75,6 +78,16 @@ Requirements:
 
 Generate the JSON now:"""
 
+# Template pre-split into (literal, field) pieces at import time. str.format
+# re-parses the whole ~1.5KB template on every call; joining the pieces skips that.
+_TEMPLATE_PIECES: Tuple[Tuple[str, str], ...] = tuple(
+    (literal, field or "")
+    for literal, field, _, _ in Formatter().parse(HYPOTHESIS_GENERATION_PROMPT_TEMPLATE)
+)
+
+# Rendered in place of {context} when no additional context is given
+_NO_CONTEXT_SECTION = ""
+
 
 def format_hypothesis_prompt(
     metrics: str,
@@ -98,15 +111,19 @@ def format_hypothesis_prompt(
         Formatted prompt string ready for LLM
     """
     # Add context section if provided
-    context_section = ""
-    if context:
-        context_section = f"\n### Additional Context\n{context}\n"
-
-    return HYPOTHESIS_GENERATION_PROMPT_TEMPLATE.format(
-        metrics=metrics or "No metrics data available",
-        logs=logs or "No logs data available",
-        traces=traces or "No traces data available",
-        timestamp=timestamp,
-        confidence=confidence,
-        context=context_section,
+    context_section = (
+        f"\n### Additional Context\n{context}\n" if context else _NO_CONTEXT_SECTION
     )
+
+    # Equivalent to HYPOTHESIS_GENERATION_PROMPT_TEMPLATE.format(...) - the
+    # template uses no format specs or conversions, so str() matches format()
+    values = {
+        "metrics": metrics or "No metrics data available",
+        "logs": logs or "No logs data available",
+        "traces": traces or "No traces data available",
+        "timestamp": timestamp,
+        "confidence": str(confidence),
+        "context": context_section,
+        "": "",
+    }
+    return "".join([literal + values[field] for literal, field in _TEMPLATE_PIECES])
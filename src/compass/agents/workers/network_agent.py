@@ -8,32 +8,176 @@ Implements OODA Observe + Orient phases for network domain:
 - Load balancer failures
 - Connection exhaustion
 
-SIMPLIFIED: No TimeRange dataclass, no fallback query library, inline queries only.
+Fallback queries come from the QUERY_TEMPLATES catalog (formatted per service
+by the memoized _fallback_query). Observation sources run concurrently on a
+shared executor; load balancer and connection logs share one combined Loki
+query and fall back to per-source queries when it truncates.
 P0 FIXES: Timeouts, result limits, correct LogQL syntax, agent ID pattern.
 """
 
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
+import logging
+import re
+import sys
 import requests
 
 import structlog
 
+from compass.agents.workers._shared import (
+    ObservationIndex,
+    SharedResult,
+    emit_span,
+    spans_enabled,
+)
 from compass.agents.workers.application_agent import ApplicationAgent, BudgetExceededError
-from compass.core.query_generator import QueryGenerator, QueryRequest, QueryType
+from compass.core.query_generator import GeneratedQuery, QueryGenerator, QueryRequest, QueryType
 from compass.core.scientific_framework import Incident, Observation, Hypothesis
 
-# P0-4 FIX (Alpha): Add OpenTelemetry tracing
-try:
-    from compass.observability import emit_span
-except ImportError:
-    # Fallback if observability not available
-    from contextlib import contextmanager
-    @contextmanager
-    def emit_span(name, attributes=None):
-        yield
-
 logger = structlog.get_logger()
+# stdlib logger behind the structlog proxy - lets hot paths skip building
+# debug event dicts when DEBUG is filtered out anyway
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Whether debug records from this module would be emitted."""
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+
+# Shared pool for concurrent observation queries (one worker per source).
+# Module-level so observe() doesn't pay thread start-up cost on every call.
+_OBSERVE_EXECUTOR = ThreadPoolExecutor(max_workers=5, thread_name_prefix="network_agent_observe")
+
+# Shared defaults for Prometheus results missing "metric"/"value", so the
+# per-row lookups don't allocate a fresh dict/list on every miss
+_NO_LABELS: Mapping[str, str] = MappingProxyType({})
+_ZERO_SAMPLE: Tuple[int, str] = (0, "0")
+
+# Line filters for the two Loki sources. Both are fetched by one |~ alternation
+# (QUERY_TEMPLATES["network_logs"]) and each source re-applies its own pattern
+# client-side, so a line matching both still reaches both sources. When that
+# shared query hits its limit, each source re-queries with its own filter.
+_LB_LOG_PATTERN = "backend.*(DOWN|UP|MAINT)"
+_CONNECTION_LOG_PATTERN = "connection.*(refused|timeout|failed)"
+_LB_LOG_RE = re.compile(_LB_LOG_PATTERN)
+_CONNECTION_LOG_RE = re.compile(_CONNECTION_LOG_PATTERN)
+
+# Catalog of hand-written PromQL/LogQL, keyed by kind. Formatted per service
+# by the memoized _fallback_query below, so repeat incidents reuse the string.
+# P0-4: LogQL filters that OR several terms use a single |~ regex stage.
+QUERY_TEMPLATES: Dict[str, str] = {
+    "dns": 'rate(dns_lookup_duration_seconds{{service="{service}"}}[5m])',
+    "latency": (
+        "histogram_quantile(0.95, "
+        'rate(http_request_duration_seconds_bucket{{service="{service}"}}[5m]))'
+    ),
+    "packet_loss": "rate(node_network_transmit_drop_total[5m])",
+    "lb_backend_status": 'haproxy_backend_status{{service="{service}"}}',
+    "network_logs": (
+        '{{service="{service}"}} |~ "' + _LB_LOG_PATTERN + "|" + _CONNECTION_LOG_PATTERN + '"'
+    ),
+    "lb_logs": '{{service="{service}"}} |~ "' + _LB_LOG_PATTERN + '"',
+    "connection_logs": '{{service="{service}"}} |~ "' + _CONNECTION_LOG_PATTERN + '"',
+}
+
+
+@lru_cache(maxsize=256)
+def _fallback_query(kind: str, service: str) -> str:
+    """Return the QUERY_TEMPLATES entry for a service (memoized, interned)."""
+    return sys.intern(QUERY_TEMPLATES[kind].format(service=service))
+
+
+def _dns_sample(result: Mapping[str, Any]) -> Tuple[str, float]:
+    """Extract (dns_server, duration_ms) from a Prometheus DNS result."""
+    dns_server = result.get("metric", _NO_LABELS).get("dns_server", "unknown")
+    return dns_server, float(result.get("value", _ZERO_SAMPLE)[1]) * 1000
+
+
+def _log_query_failure(
+    log: Callable[..., Any], event: str, exc: BaseException, **context: Any
+) -> None:
+    """Log a failed query with the structured error/error_type fields (P1-1)."""
+    log(event, error=str(exc), error_type=exc.__class__.__name__, **context)
+
+
+def _matching_log_lines(
+    results: List[Dict[str, Any]], line_filter: Pattern[str], limit: int
+) -> Tuple[List[Any], int]:
+    """
+    First `limit` Loki [timestamp_ns, line] entries matching line_filter, in
+    stream order, plus how many entries matched in total.
+    """
+    matches = (
+        entry
+        for stream in results
+        for entry in stream.get("values", ())
+        if line_filter.search(entry[1])
+    )
+    sample = list(islice(matches, limit))
+    return sample, len(sample) + sum(1 for _ in matches)
+
+
+def _loki_observations(
+    entries: List[Any],
+    source: str,
+    description_prefix: str,
+    confidence: float,
+    fields: Dict[str, Any],
+) -> List[Observation]:
+    """One Observation per Loki [timestamp_ns, line] entry, with fields added to its data."""
+    return [
+        Observation(
+            source=source,
+            data={"log_line": log_line, "timestamp_ns": timestamp_ns, **fields},
+            # Plain concatenation; the slice is free for lines already <= 100
+            # chars (CPython returns the same str object)
+            description=description_prefix + log_line[:100],
+            confidence=confidence,
+        )
+        for timestamp_ns, log_line in entries
+    ]
+
+
+class _NetworkObservationIndex(ObservationIndex):
+    """
+    ObservationIndex plus NetworkAgent's source buckets.
+
+    Each network detector reads its bucket instead of scanning every
+    observation's source.
+    """
+
+    __slots__ = ("dns", "latency_sources", "load_balancer", "connection", "_detected_at")
+
+    def __init__(self, observations: List[Observation]):
+        super().__init__(observations)
+        self._detected_at: Optional[str] = None
+        self.dns: List[Observation] = []
+        self.latency_sources: List[Observation] = []
+        self.load_balancer: List[Observation] = []
+        self.connection: List[Observation] = []
+        for obs in observations:
+            source = obs._source_lc
+            if "dns" in source:
+                self.dns.append(obs)
+            if "latency" in source:
+                self.latency_sources.append(obs)
+            if "load_balancer" in source:
+                self.load_balancer.append(obs)
+            if "connection" in source:
+                self.connection.append(obs)
+
+    def detected_at(self) -> str:
+        """UTC ISO timestamp for hypotheses from this pass (taken once, on first use)."""
+        if self._detected_at is None:
+            self._detected_at = datetime.now(timezone.utc).isoformat()
+        return self._detected_at
 
 
 class NetworkAgent(ApplicationAgent):
@@ -44,15 +188,34 @@ class NetworkAgent(ApplicationAgent):
     FOCUS: Core functionality only, small team sustainability.
     """
 
+    # No extra instance attributes - keep ApplicationAgent's slot layout
+    __slots__ = ()
+
     # P0-5 FIX: Agent ID as class attribute (not instance variable)
     agent_id = "network_agent"
 
+    # generate_hypothesis() builds this once; the detectors below read its buckets
+    _OBSERVATION_INDEX = _NetworkObservationIndex
+
+    # Extend hypothesis detectors (P0-3 extensibility fix)
+    HYPOTHESIS_DETECTOR_NAMES = ApplicationAgent.HYPOTHESIS_DETECTOR_NAMES + (
+        "_detect_and_create_dns_hypothesis",
+        "_detect_and_create_routing_hypothesis",
+        "_detect_and_create_load_balancer_hypothesis",
+        "_detect_and_create_connection_exhaustion_hypothesis",
+    )
+
     # Network thresholds
     DNS_DURATION_THRESHOLD_MS = 1000  # >1s indicates DNS issue
     HIGH_LATENCY_THRESHOLD_S = 1.0  # >1s p95 latency
     PACKET_LOSS_THRESHOLD = 0.01  # >1% packet loss
     CONNECTION_FAILURE_THRESHOLD = 10  # >10 failures in window
 
+    # P0-3 FIX: Entries fetched per Loki query
+    LOKI_QUERY_LIMIT = 1000
+    # Loki log lines turned into Observations per source (of up to 1000 fetched)
+    MAX_LOG_OBSERVATIONS_PER_SOURCE = 200
+
     def __init__(
         self,
         budget_limit: Decimal,
@@ -80,19 +243,10 @@ class NetworkAgent(ApplicationAgent):
             query_generator=query_generator,
         )
 
-        # Extend hypothesis detectors (P0-3 extensibility fix)
-        # Day 1: Add placeholder detectors, implement Day 2-3
-        self._hypothesis_detectors.extend([
-            self._detect_and_create_dns_hypothesis,
-            self._detect_and_create_routing_hypothesis,
-            self._detect_and_create_load_balancer_hypothesis,
-            self._detect_and_create_connection_exhaustion_hypothesis,
-        ])
-
         logger.info(
             "network_agent_initialized",
             agent_id=self.agent_id,
-            budget_limit=str(budget_limit),
+            budget_limit=budget_limit,
             has_prometheus=prometheus_client is not None,
             has_loki=loki_client is not None,
             has_query_generator=query_generator is not None,
@@ -102,7 +256,10 @@ class NetworkAgent(ApplicationAgent):
         """
         Observe network state around incident.
 
-        SIMPLE: Just datetime math, no TimeRange dataclass.
+        Dispatches the DNS, latency, load balancer, connection and packet loss
+        sources concurrently on _OBSERVE_EXECUTOR. The two log sources share a
+        single Loki query (see _query_network_logs) and re-query separately if
+        it was truncated.
         P0-2 FIX: 30-second timeouts on all queries.
         P0-4 FIX (Alpha): OpenTelemetry tracing for production debugging.
         P1-1 FIX: Structured exception handling.
@@ -118,94 +275,184 @@ class NetworkAgent(ApplicationAgent):
             BudgetExceededError: If cost exceeds budget
         """
         # Budget check (inherited from ApplicationAgent)
-        self._check_budget()
-
-        # P0-4 FIX (Alpha): Add OpenTelemetry tracing (matches ApplicationAgent pattern)
-        with emit_span("network_agent.observe", attributes={"agent.id": self.agent_id}):
-            # Parse and validate incident time (SIMPLE: no TimeRange class)
-            incident_time = datetime.fromisoformat(incident.start_time.replace("Z", "+00:00"))
-            if incident_time.tzinfo is None:
+        self._check_budget_micro()
+
+        # P0-4 FIX (Alpha): Add OpenTelemetry tracing (matches ApplicationAgent pattern).
+        # emit_span/spans_enabled are the workers' lazy wrappers (_shared) - skip building
+        # the span (and its attribute dict) entirely when no tracer is active
+        span = (
+            emit_span("network_agent.observe", attributes={"agent.id": self.agent_id})
+            if spans_enabled()
+            else nullcontext()
+        )
+        with span:
+            # Time window (±15 minutes), parsed once per incident start time
+            # (memoized in ApplicationAgent._calculate_time_range)
+            start_time, end_time = self._calculate_time_range(incident)
+            if start_time.tzinfo is None:
                 raise ValueError("Incident time must be timezone-aware")
 
-            # Calculate time window (±15 minutes, SIMPLE: inline datetime math)
-            window_minutes = 15
-            start_time = incident_time - timedelta(minutes=window_minutes)
-            end_time = incident_time + timedelta(minutes=window_minutes)
-
-            observations = []
             service = incident.affected_services[0] if incident.affected_services else "unknown"
 
-            # Observe DNS (Day 1 implementation)
-            try:
-                dns_obs = self._observe_dns_resolution(incident, service, start_time, end_time)
-                observations.extend(dns_obs)
-            except Exception as e:
-                # P1-1: Structured exception handling
-                logger.warning(
-                    "dns_observation_failed",
-                    service=service,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-
-            # Day 2: Observe network latency
-            try:
-                latency_obs = self._observe_network_latency(incident, service, start_time, end_time)
-                observations.extend(latency_obs)
-            except Exception as e:
-                logger.warning(
-                    "latency_observation_failed",
-                    service=service,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-
-            # Day 2: Observe packet loss
-            try:
-                packet_obs = self._observe_packet_loss(incident, service, start_time, end_time)
-                observations.extend(packet_obs)
-            except Exception as e:
-                logger.warning(
-                    "packet_loss_observation_failed",
-                    service=service,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-
-            # Day 2: Observe load balancer
-            try:
-                lb_obs = self._observe_load_balancer(incident, service, start_time, end_time)
-                observations.extend(lb_obs)
-            except Exception as e:
-                logger.warning(
-                    "load_balancer_observation_failed",
-                    service=service,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
+            # Both Loki sources filter the same service streams over the same
+            # window: fetch once with a combined filter and split client-side -
+            # ApplicationAgent's combined-logs pattern
+            log_streams = (
+                SharedResult(partial(self._query_network_logs, service, start_time, end_time))
+                if self.loki
+                else None
+            )
 
-            # Day 2: Observe connection failures
-            try:
-                conn_obs = self._observe_connection_failures(incident, service, start_time, end_time)
-                observations.extend(conn_obs)
-            except Exception as e:
-                logger.warning(
-                    "connection_failures_observation_failed",
-                    service=service,
-                    error=str(e),
-                    error_type=type(e).__name__,
+            # The five sources are independent and each blocks on a Prometheus/Loki
+            # round trip, so dispatch them concurrently: wall-clock becomes the
+            # slowest source rather than the sum (ApplicationAgent pattern)
+            sources = (
+                ("dns", self._observe_dns_resolution),
+                ("latency", self._observe_network_latency),
+                ("packet_loss", self._observe_packet_loss),
+                ("load_balancer", partial(self._observe_load_balancer, log_streams=log_streams)),
+                (
+                    "connection_failures",
+                    partial(self._observe_connection_failures, log_streams=log_streams),
+                ),
+            )
+            futures = [
+                (
+                    name,
+                    _OBSERVE_EXECUTOR.submit(
+                        observe_source, incident, service, start_time, end_time
+                    ),
                 )
+                for name, observe_source in sources
+            ]
+
+            # Collect in submission order so observation ordering stays deterministic
+            observations: List[Observation] = []
+            for name, future in futures:
+                try:
+                    observations.extend(future.result())
+                except Exception as e:
+                    # P1-1: Structured exception handling
+                    _log_query_failure(
+                        logger.warning, f"{name}_observation_failed", e, service=service
+                    )
 
             logger.info(
                 "network_agent.observe_completed",
                 agent_id=self.agent_id,
                 incident_id=incident.incident_id,
                 observation_count=len(observations),
-                total_cost=str(self._total_cost),
+                total_cost=self._total_cost,
             )
 
             return observations
 
+    def _generate_promql_cached(
+        self, service: str, metric_type: str, request: QueryRequest
+    ) -> Tuple[str, Optional[GeneratedQuery]]:
+        """
+        Generate a PromQL query, reusing ApplicationAgent's generated-query cache.
+
+        Keyed by (service, metric_type, window size): the generated PromQL has
+        no absolute time bounds (custom_query_range takes start/end separately),
+        so repeat incidents for the same service reuse it without LLM cost.
+
+        Args:
+            service: The affected service name
+            metric_type: Metric the request asks for (distinguishes the intents)
+            request: QueryRequest sent to the QueryGenerator on a cache miss
+
+        Returns:
+            Tuple of (query, GeneratedQuery on a miss or None on a cache hit)
+
+        Raises:
+            BudgetExceededError: If a generation would exceed budget_limit
+        """
+        return self._generate_query_cached(
+            (QueryType.PROMQL.value, service, metric_type, self.OBSERVATION_WINDOW_MINUTES),
+            request,
+        )
+
+    def _query_loki_logs(
+        self, kind: str, service: str, start_time: datetime, end_time: datetime
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Run one QUERY_TEMPLATES LogQL query against Loki.
+
+        P0-3 FIX: LOKI_QUERY_LIMIT-entry limit. P1-1 FIX (Alpha): 30-second timeout.
+
+        Returns:
+            Tuple of (Loki streams, whether the result reached the limit)
+        """
+        results = self._loki_queries.query_range(
+            query=_fallback_query(kind, service),
+            start=int(start_time.timestamp()),
+            end=int(end_time.timestamp()),
+            limit=self.LOKI_QUERY_LIMIT,  # P0-3 FIX: Result limiting
+            timeout=30,  # P1-1 FIX: 30-second timeout
+        )
+        total_entries = sum(len(stream.get("values", ())) for stream in results)
+        return results, total_entries >= self.LOKI_QUERY_LIMIT
+
+    def _query_network_logs(
+        self, service: str, start_time: datetime, end_time: datetime
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch load balancer and connection failure log lines in one Loki query.
+
+        The two sources share the query's limit, so a truncated result could
+        be all one source's lines. It is then discarded (None) and each source
+        runs its own query with its own limit (_query_source_logs).
+
+        Args:
+            service: The affected service name
+            start_time: Start of observation window
+            end_time: End of observation window
+
+        Returns:
+            Loki streams whose lines match either source's filter, or None if
+            the combined result was truncated
+        """
+        results, truncated = self._query_loki_logs("network_logs", service, start_time, end_time)
+        if truncated:
+            logger.info(
+                "network_logs_split_on_truncation",
+                service=service,
+                limit=self.LOKI_QUERY_LIMIT,
+            )
+            return None
+        return results
+
+    def _query_source_logs(
+        self,
+        kind: str,
+        truncation_event: str,
+        service: str,
+        start_time: datetime,
+        end_time: datetime,
+        log_streams: Optional[SharedResult],
+    ) -> List[Dict[str, Any]]:
+        """
+        Loki streams for one log source: the shared combined result when it is
+        complete, else the source's own query (kind) with its own limit.
+
+        P0-3: Warns (truncation_event) if the source's own results hit the limit.
+        """
+        if log_streams is not None:
+            shared: Optional[List[Dict[str, Any]]] = log_streams.get()
+            if shared is not None:
+                return shared
+
+        results, truncated = self._query_loki_logs(kind, service, start_time, end_time)
+        if truncated:
+            logger.warning(
+                truncation_event,
+                service=service,
+                limit=self.LOKI_QUERY_LIMIT,
+                message="Results may be incomplete due to limit",
+            )
+        return results
+
     def _observe_dns_resolution(
         self,
         incident: Incident,
@@ -234,11 +481,14 @@ class NetworkAgent(ApplicationAgent):
         if not self.prometheus:
             return observations
 
+        # Serialized once: shared by the query request and every observation
+        window_start = start_time.isoformat()
+        window_end = end_time.isoformat()
+
         # Generate or use fallback query (SIMPLE inline approach)
         if self.query_generator:
-            # P0-1 FIX: Check budget before expensive QueryGenerator call
-            self._check_budget(estimated_cost=Decimal("0.003"))
-
+            # P0-1 FIX: Budget is checked before the QueryGenerator call (on a
+            # cache miss - repeat incidents for the service reuse the query)
             try:
                 request = QueryRequest(
                     query_type=QueryType.PROMQL,
@@ -246,34 +496,32 @@ class NetworkAgent(ApplicationAgent):
                     context={
                         "service": service,
                         "metric_type": "dns_lookup_duration",
-                        "time_range": f"{start_time.isoformat()} to {end_time.isoformat()}",
+                        "time_range": f"{window_start} to {window_end}",
                     },
                 )
-                generated = self.query_generator.generate_query(request)
-                query = generated.query
-                # P1-2 FIX (Alpha): Thread-safe cost tracking
-                with self._cost_lock:
-                    self._total_cost += generated.cost
-
-                logger.debug(
-                    "query_generator_used",
-                    service=service,
-                    query=query,
-                    cost=str(generated.cost),
+                query, generated = self._generate_promql_cached(
+                    service, "dns_lookup_duration", request
                 )
 
+                if generated is not None and _debug_enabled():
+                    logger.debug(
+                        "query_generator_used",
+                        service=service,
+                        query=query,
+                        cost=generated.cost,
+                    )
+
+            except BudgetExceededError:
+                raise
             except Exception as e:
                 # Fallback to simple query if QueryGenerator fails
-                logger.warning(
-                    "query_generator_failed_using_fallback",
-                    service=service,
-                    error=str(e),
-                    error_type=type(e).__name__,
+                _log_query_failure(
+                    logger.warning, "query_generator_failed_using_fallback", e, service=service
                 )
-                query = f'rate(dns_lookup_duration_seconds{{service="{service}"}}[5m])'
+                query = _fallback_query("dns", service)
         else:
             # SIMPLE fallback: just inline the query (no library module)
-            query = f'rate(dns_lookup_duration_seconds{{service="{service}"}}[5m])'
+            query = _fallback_query("dns", service)
 
         # Query Prometheus with TIMEOUT and TIME RANGE (P0-2, P0-5 fixes)
         try:
@@ -288,25 +536,22 @@ class NetworkAgent(ApplicationAgent):
             )
 
             # Convert to Observations
-            for result in results:
-                dns_server = result.get("metric", {}).get("dns_server", "unknown")
-                duration_ms = float(result.get("value", [0, "0"])[1]) * 1000
-
-                observations.append(
-                    Observation(
-                        source=f"prometheus:dns_resolution:{dns_server}",
-                        data={
-                            "dns_server": dns_server,
-                            "avg_duration_ms": duration_ms,
-                            "query": query,
-                            "service": service,
-                            "window_start": start_time.isoformat(),
-                            "window_end": end_time.isoformat(),
-                        },
-                        description=f"DNS resolution to {dns_server}: {duration_ms:.1f}ms average",
-                        confidence=0.85,
-                    )
+            observations = [
+                Observation(
+                    source=f"prometheus:dns_resolution:{dns_server}",
+                    data={
+                        "dns_server": dns_server,
+                        "avg_duration_ms": duration_ms,
+                        "query": query,
+                        "service": service,
+                        "window_start": window_start,
+                        "window_end": window_end,
+                    },
+                    description=f"DNS resolution to {dns_server}: {duration_ms:.1f}ms average",
+                    confidence=0.85,
                 )
+                for dns_server, duration_ms in map(_dns_sample, results)
+            ]
 
             logger.info(
                 "dns_observation_completed",
@@ -326,21 +571,14 @@ class NetworkAgent(ApplicationAgent):
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
         except requests.ConnectionError as e:
             # P1-1 FIX: Structured exception handling - connection
-            logger.error(
-                "dns_query_connection_failed",
-                service=service,
-                query=query,
-                error=str(e),
+            _log_query_failure(
+                logger.error, "dns_query_connection_failed", e, service=service, query=query
             )
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
         except Exception as e:
             # P1-1 FIX: Structured exception handling - general
-            logger.error(
-                "dns_query_failed_unknown",
-                service=service,
-                query=query,
-                error=str(e),
-                error_type=type(e).__name__,
+            _log_query_failure(
+                logger.error, "dns_query_failed_unknown", e, service=service, query=query
             )
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
 
@@ -375,8 +613,6 @@ class NetworkAgent(ApplicationAgent):
 
         # Generate or use fallback query (SIMPLE inline approach)
         if self.query_generator:
-            self._check_budget(estimated_cost=Decimal("0.003"))
-
             try:
                 request = QueryRequest(
                     query_type=QueryType.PROMQL,
@@ -387,17 +623,17 @@ class NetworkAgent(ApplicationAgent):
                         "quantile": "0.95",
                     },
                 )
-                generated = self.query_generator.generate_query(request)
-                query = generated.query
-                # P1-2 FIX (Alpha): Thread-safe cost tracking
-                with self._cost_lock:
-                    self._total_cost += generated.cost
+                query, _ = self._generate_promql_cached(service, "http_request_duration", request)
+            except BudgetExceededError:
+                raise
             except Exception as e:
-                logger.warning("query_generator_failed_using_fallback", error=str(e))
-                query = f'histogram_quantile(0.95, rate(http_request_duration_seconds_bucket{{service="{service}"}}[5m]))'
+                _log_query_failure(
+                    logger.warning, "query_generator_failed_using_fallback", e, service=service
+                )
+                query = _fallback_query("latency", service)
         else:
             # SIMPLE fallback: inline p95 query
-            query = f'histogram_quantile(0.95, rate(http_request_duration_seconds_bucket{{service="{service}"}}[5m]))'
+            query = _fallback_query("latency", service)
 
         # Query Prometheus with TIMEOUT and TIME RANGE (P0-2, P0-5 fixes)
         try:
@@ -412,8 +648,8 @@ class NetworkAgent(ApplicationAgent):
 
             # Convert to Observations
             for result in results:
-                endpoint = result.get("metric", {}).get("endpoint", "unknown")
-                p95_latency_s = float(result.get("value", [0, "0"])[1])
+                endpoint = result.get("metric", _NO_LABELS).get("endpoint", "unknown")
+                p95_latency_s = float(result.get("value", _ZERO_SAMPLE)[1])
 
                 observations.append(
                     Observation(
@@ -439,10 +675,12 @@ class NetworkAgent(ApplicationAgent):
             logger.error("latency_query_timeout", service=service, query=query, timeout_seconds=30)
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
         except requests.ConnectionError as e:
-            logger.error("latency_query_connection_failed", service=service, error=str(e))
+            _log_query_failure(
+                logger.error, "latency_query_connection_failed", e, service=service
+            )
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
         except Exception as e:
-            logger.error("latency_query_failed_unknown", service=service, error=str(e), error_type=type(e).__name__)
+            _log_query_failure(logger.error, "latency_query_failed_unknown", e, service=service)
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
 
         return observations
@@ -476,8 +714,6 @@ class NetworkAgent(ApplicationAgent):
 
         # Generate or use fallback query
         if self.query_generator:
-            self._check_budget(estimated_cost=Decimal("0.003"))
-
             try:
                 request = QueryRequest(
                     query_type=QueryType.PROMQL,
@@ -487,17 +723,19 @@ class NetworkAgent(ApplicationAgent):
                         "metric_type": "node_network_transmit_drop",
                     },
                 )
-                generated = self.query_generator.generate_query(request)
-                query = generated.query
-                # P1-2 FIX (Alpha): Thread-safe cost tracking
-                with self._cost_lock:
-                    self._total_cost += generated.cost
+                query, _ = self._generate_promql_cached(
+                    service, "node_network_transmit_drop", request
+                )
+            except BudgetExceededError:
+                raise
             except Exception as e:
-                logger.warning("query_generator_failed_using_fallback", error=str(e))
-                query = 'rate(node_network_transmit_drop_total[5m])'
+                _log_query_failure(
+                    logger.warning, "query_generator_failed_using_fallback", e, service=service
+                )
+                query = _fallback_query("packet_loss", service)
         else:
             # SIMPLE fallback: inline packet drop query
-            query = 'rate(node_network_transmit_drop_total[5m])'
+            query = _fallback_query("packet_loss", service)
 
         # Query Prometheus with TIMEOUT and TIME RANGE (P0-2, P0-5 fixes)
         try:
@@ -512,9 +750,10 @@ class NetworkAgent(ApplicationAgent):
 
             # Convert to Observations
             for result in results:
-                instance = result.get("metric", {}).get("instance", "unknown")
-                interface = result.get("metric", {}).get("interface", "unknown")
-                drop_rate = float(result.get("value", [0, "0"])[1])
+                labels = result.get("metric", _NO_LABELS)
+                instance = labels.get("instance", "unknown")
+                interface = labels.get("interface", "unknown")
+                drop_rate = float(result.get("value", _ZERO_SAMPLE)[1])
 
                 observations.append(
                     Observation(
@@ -539,10 +778,10 @@ class NetworkAgent(ApplicationAgent):
             logger.error("packet_loss_query_timeout", query=query, timeout_seconds=30)
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
         except requests.ConnectionError as e:
-            logger.error("packet_loss_query_connection_failed", error=str(e))
+            _log_query_failure(logger.error, "packet_loss_query_connection_failed", e)
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
         except Exception as e:
-            logger.error("packet_loss_query_failed_unknown", error=str(e), error_type=type(e).__name__)
+            _log_query_failure(logger.error, "packet_loss_query_failed_unknown", e)
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
 
         return observations
@@ -553,6 +792,7 @@ class NetworkAgent(ApplicationAgent):
         service: str,
         start_time: datetime,
         end_time: datetime,
+        log_streams: Optional[SharedResult] = None,
     ) -> List[Observation]:
         """
         Observe load balancer backend health (Prometheus + Loki).
@@ -567,6 +807,8 @@ class NetworkAgent(ApplicationAgent):
             service: The affected service name
             start_time: Start of observation window
             end_time: End of observation window
+            log_streams: Optional shared _query_network_logs result; the
+                source's own query runs when not given or truncated
 
         Returns:
             List of load balancer observations (empty on failure)
@@ -575,7 +817,7 @@ class NetworkAgent(ApplicationAgent):
 
         # Prometheus: Backend health metrics
         if self.prometheus:
-            query = f'haproxy_backend_status{{service="{service}"}}'
+            query = _fallback_query("lb_backend_status", service)
 
             try:
                 # P0-1 FIX (Alpha): Use timeout as direct parameter, not in params dict
@@ -588,9 +830,10 @@ class NetworkAgent(ApplicationAgent):
                 )
 
                 for result in results:
-                    backend = result.get("metric", {}).get("backend", "unknown")
-                    status = result.get("metric", {}).get("status", "unknown")
-                    value = float(result.get("value", [0, "0"])[1])
+                    labels = result.get("metric", _NO_LABELS)
+                    backend = labels.get("backend", "unknown")
+                    status = labels.get("status", "unknown")
+                    value = float(result.get("value", _ZERO_SAMPLE)[1])
 
                     observations.append(
                         Observation(
@@ -607,54 +850,37 @@ class NetworkAgent(ApplicationAgent):
                     )
 
             except Exception as e:
-                logger.warning("lb_prometheus_query_failed", error=str(e), error_type=type(e).__name__)
+                _log_query_failure(logger.warning, "lb_prometheus_query_failed", e)
                 raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
 
         # Loki: Backend state changes in logs
         if self.loki:
-            # P0-4 FIX: Use |~ for regex matching multiple patterns (not |= with OR)
-            query = f'{{service="{service}"}} |~ "backend.*(DOWN|UP|MAINT)"'
-
             try:
-                # P1-1 FIX (Alpha): Add timeout to Loki queries
-                results = self.loki.query_range(
-                    query=query,
-                    start=int(start_time.timestamp()),
-                    end=int(end_time.timestamp()),
-                    limit=1000,  # P0-3 FIX: Result limiting
-                    timeout=30  # P1-1 FIX: 30-second timeout
+                results = self._query_source_logs(
+                    "lb_logs",
+                    "loki_results_truncated",
+                    service,
+                    start_time,
+                    end_time,
+                    log_streams,
                 )
 
-                # Count total log entries found
-                total_entries = sum(len(stream.get("values", [])) for stream in results)
-
-                # P0-3: Warn if results might be truncated
-                if total_entries >= 1000:
-                    logger.warning(
-                        "loki_results_truncated",
-                        service=service,
-                        limit=1000,
-                        message="Results may be incomplete due to limit"
+                # Capped: detectors only need a sample of log lines
+                entries, _ = _matching_log_lines(
+                    results, _LB_LOG_RE, self.MAX_LOG_OBSERVATIONS_PER_SOURCE
+                )
+                observations.extend(
+                    _loki_observations(
+                        entries,
+                        f"loki:load_balancer_logs:{service}",
+                        "LB log: ",
+                        0.75,
+                        {"service": service},
                     )
-
-                for stream in results:
-                    for value in stream.get("values", []):
-                        timestamp_ns, log_line = value
-                        observations.append(
-                            Observation(
-                                source=f"loki:load_balancer_logs:{service}",
-                                data={
-                                    "log_line": log_line,
-                                    "timestamp_ns": timestamp_ns,
-                                    "service": service,
-                                },
-                                description=f"LB log: {log_line[:100]}",
-                                confidence=0.75,
-                            )
-                        )
+                )
 
             except Exception as e:
-                logger.warning("lb_loki_query_failed", error=str(e), error_type=type(e).__name__)
+                _log_query_failure(logger.warning, "lb_loki_query_failed", e)
                 raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
 
         logger.info(
@@ -671,6 +897,7 @@ class NetworkAgent(ApplicationAgent):
         service: str,
         start_time: datetime,
         end_time: datetime,
+        log_streams: Optional[SharedResult] = None,
     ) -> List[Observation]:
         """
         Observe connection failure logs.
@@ -684,6 +911,8 @@ class NetworkAgent(ApplicationAgent):
             service: The affected service name
             start_time: Start of observation window
             end_time: End of observation window
+            log_streams: Optional shared _query_network_logs result; the
+                source's own query runs when not given or truncated
 
         Returns:
             List of connection failure observations (empty on failure)
@@ -693,60 +922,40 @@ class NetworkAgent(ApplicationAgent):
         if not self.loki:
             return observations
 
-        # P0-4 FIX: Use |~ for regex matching multiple patterns
-        query = f'{{service="{service}"}} |~ "connection.*(refused|timeout|failed)"'
-
         try:
-            # P1-1 FIX (Alpha): Add timeout to Loki queries
-            results = self.loki.query_range(
-                query=query,
-                start=int(start_time.timestamp()),
-                end=int(end_time.timestamp()),
-                limit=1000,  # P0-3 FIX: Result limiting
-                timeout=30  # P1-1 FIX: 30-second timeout
+            results = self._query_source_logs(
+                "connection_logs",
+                "connection_failures_truncated",
+                service,
+                start_time,
+                end_time,
+                log_streams,
             )
 
-            # Count total log entries
-            total_entries = sum(len(stream.get("values", [])) for stream in results)
-
-            # P0-3: Warn if results truncated
-            if total_entries >= 1000:
-                logger.warning(
-                    "connection_failures_truncated",
-                    service=service,
-                    limit=1000,
-                    message="Results may be incomplete due to limit"
+            # Capped: detectors only need a sample of log lines, but every
+            # observation carries the full match count for the threshold check
+            entries, failure_count = _matching_log_lines(
+                results, _CONNECTION_LOG_RE, self.MAX_LOG_OBSERVATIONS_PER_SOURCE
+            )
+            observations.extend(
+                _loki_observations(
+                    entries,
+                    f"loki:connection_failures:{service}",
+                    "Connection failure: ",
+                    0.80,
+                    {"service": service, "failure_count": failure_count},
                 )
-
-            for stream in results:
-                for value in stream.get("values", []):
-                    timestamp_ns, log_line = value
-                    observations.append(
-                        Observation(
-                            source=f"loki:connection_failures:{service}",
-                            data={
-                                "log_line": log_line,
-                                "timestamp_ns": timestamp_ns,
-                                "service": service,
-                            },
-                            description=f"Connection failure: {log_line[:100]}",
-                            confidence=0.80,
-                        )
-                    )
+            )
 
             logger.info(
                 "connection_failures_observation_completed",
                 service=service,
                 observation_count=len(observations),
+                failure_count=failure_count,
             )
 
         except Exception as e:
-            logger.error(
-                "connection_failures_query_failed",
-                service=service,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
+            _log_query_failure(logger.error, "connection_failures_query_failed", e, service=service)
             raise  # P0-3 FIX (Beta): Raise after logging for consistent error handling
 
         return observations
@@ -768,30 +977,31 @@ class NetworkAgent(ApplicationAgent):
         Returns:
             Hypothesis if DNS issue detected, None otherwise
         """
-        for obs in observations:
-            if "dns" in obs.source.lower():
-                avg_duration_ms = obs.data.get("avg_duration_ms", 0)
-
-                if avg_duration_ms > self.DNS_DURATION_THRESHOLD_MS:
-                    dns_server = obs.data.get("dns_server", "unknown")
-
-                    return Hypothesis(
-                        agent_id=self.agent_id,
-                        statement=f"DNS resolution failing for {dns_server} causing timeouts",
-                        initial_confidence=obs.confidence,
-                        affected_systems=[dns_server],
-                        metadata={
-                            "metric": "dns_lookup_duration_ms",
-                            "threshold": self.DNS_DURATION_THRESHOLD_MS,
-                            "operator": ">",
-                            "observed_value": avg_duration_ms,
-                            "suspected_time": datetime.now(timezone.utc).isoformat(),
-                            "hypothesis_type": "dns_failure",
-                            "source": obs.source,
-                        },
-                    )
+        index = _NetworkObservationIndex.of(observations)
+        threshold = self.DNS_DURATION_THRESHOLD_MS
+        obs = next(
+            (o for o in index.dns if o.data.get("avg_duration_ms", 0) > threshold),
+            None,
+        )
+        if obs is None:
+            return None
 
-        return None
+        dns_server = obs.data.get("dns_server", "unknown")
+        return Hypothesis(
+            agent_id=self.agent_id,
+            statement=f"DNS resolution failing for {dns_server} causing timeouts",
+            initial_confidence=obs.confidence,
+            affected_systems=[dns_server],
+            metadata={
+                "metric": "dns_lookup_duration_ms",
+                "threshold": threshold,
+                "operator": ">",
+                "observed_value": obs.data["avg_duration_ms"],
+                "suspected_time": index.detected_at(),
+                "hypothesis_type": "dns_failure",
+                "source": obs.source,
+            },
+        )
 
     def _detect_and_create_routing_hypothesis(
         self, observations: List[Observation]
@@ -807,30 +1017,31 @@ class NetworkAgent(ApplicationAgent):
         Returns:
             Hypothesis if routing issue detected, None otherwise
         """
-        for obs in observations:
-            if "latency" in obs.source.lower():
-                p95_latency_s = obs.data.get("p95_latency_s", 0)
-
-                if p95_latency_s > self.HIGH_LATENCY_THRESHOLD_S:
-                    endpoint = obs.data.get("endpoint", "unknown")
-
-                    return Hypothesis(
-                        agent_id=self.agent_id,
-                        statement=f"High network latency to {endpoint} indicating routing or congestion issue",
-                        initial_confidence=obs.confidence,
-                        affected_systems=[endpoint],
-                        metadata={
-                            "metric": "p95_latency_s",
-                            "threshold": self.HIGH_LATENCY_THRESHOLD_S,
-                            "operator": ">",
-                            "observed_value": p95_latency_s,
-                            "suspected_time": datetime.now(timezone.utc).isoformat(),
-                            "hypothesis_type": "routing_latency",
-                            "source": obs.source,
-                        },
-                    )
+        index = _NetworkObservationIndex.of(observations)
+        threshold = self.HIGH_LATENCY_THRESHOLD_S
+        obs = next(
+            (o for o in index.latency_sources if o.data.get("p95_latency_s", 0) > threshold),
+            None,
+        )
+        if obs is None:
+            return None
 
-        return None
+        endpoint = obs.data.get("endpoint", "unknown")
+        return Hypothesis(
+            agent_id=self.agent_id,
+            statement=f"High network latency to {endpoint} indicating routing or congestion issue",
+            initial_confidence=obs.confidence,
+            affected_systems=[endpoint],
+            metadata={
+                "metric": "p95_latency_s",
+                "threshold": threshold,
+                "operator": ">",
+                "observed_value": obs.data["p95_latency_s"],
+                "suspected_time": index.detected_at(),
+                "hypothesis_type": "routing_latency",
+                "source": obs.source,
+            },
+        )
 
     def _detect_and_create_load_balancer_hypothesis(
         self, observations: List[Observation]
@@ -846,29 +1057,27 @@ class NetworkAgent(ApplicationAgent):
         Returns:
             Hypothesis if LB issue detected, None otherwise
         """
-        for obs in observations:
-            if "load_balancer" in obs.source.lower():
-                backend = obs.data.get("backend", "unknown")
-                status = obs.data.get("status", "unknown")
-
-                if status == "DOWN":
-                    return Hypothesis(
-                        agent_id=self.agent_id,
-                        statement=f"Load balancer backend {backend} is DOWN causing traffic failures",
-                        initial_confidence=obs.confidence,
-                        affected_systems=[backend],
-                        metadata={
-                            "metric": "backend_status",
-                            "threshold": "UP",
-                            "operator": "!=",
-                            "observed_value": status,
-                            "suspected_time": datetime.now(timezone.utc).isoformat(),
-                            "hypothesis_type": "load_balancer_failure",
-                            "source": obs.source,
-                        },
-                    )
+        index = _NetworkObservationIndex.of(observations)
+        obs = next((o for o in index.load_balancer if o.data.get("status") == "DOWN"), None)
+        if obs is None:
+            return None
 
-        return None
+        backend = obs.data.get("backend", "unknown")
+        return Hypothesis(
+            agent_id=self.agent_id,
+            statement=f"Load balancer backend {backend} is DOWN causing traffic failures",
+            initial_confidence=obs.confidence,
+            affected_systems=[backend],
+            metadata={
+                "metric": "backend_status",
+                "threshold": "UP",
+                "operator": "!=",
+                "observed_value": "DOWN",
+                "suspected_time": index.detected_at(),
+                "hypothesis_type": "load_balancer_failure",
+                "source": obs.source,
+            },
+        )
 
     def _detect_and_create_connection_exhaustion_hypothesis(
         self, observations: List[Observation]
@@ -884,29 +1093,32 @@ class NetworkAgent(ApplicationAgent):
         Returns:
             Hypothesis if connection issue detected, None otherwise
         """
-        # Count connection failure observations
-        connection_failures = [
-            obs for obs in observations if "connection" in obs.source.lower()
-        ]
-
-        if len(connection_failures) > self.CONNECTION_FAILURE_THRESHOLD:
-            # Group by service if available
-            services = set()
-            for obs in connection_failures:
-                service = obs.data.get("service", "unknown")
-                services.add(service)
-
+        # Count connection failures per service: observations are a capped
+        # sample, so use the full count they carry (failure_count) when present
+        index = _NetworkObservationIndex.of(observations)
+        sampled: Dict[str, int] = {}
+        reported: Dict[str, int] = {}
+        for obs in index.connection:
+            service = obs.data.get("service", "unknown")
+            sampled[service] = sampled.get(service, 0) + 1
+            reported[service] = max(reported.get(service, 0), obs.data.get("failure_count", 0))
+        failure_counts = {
+            service: max(count, reported[service]) for service, count in sampled.items()
+        }
+        total_failures = sum(failure_counts.values())
+
+        if total_failures > self.CONNECTION_FAILURE_THRESHOLD:
             return Hypothesis(
                 agent_id=self.agent_id,
-                statement=f"Connection exhaustion detected with {len(connection_failures)} failures across {len(services)} service(s)",
+                statement=f"Connection exhaustion detected with {total_failures} failures across {len(failure_counts)} service(s)",
                 initial_confidence=0.80,  # High confidence with multiple failures
-                affected_systems=list(services),
+                affected_systems=list(failure_counts),
                 metadata={
                     "metric": "connection_failure_count",
                     "threshold": self.CONNECTION_FAILURE_THRESHOLD,
                     "operator": ">",
-                    "observed_value": len(connection_failures),
-                    "suspected_time": datetime.now(timezone.utc).isoformat(),
+                    "observed_value": total_failures,
+                    "suspected_time": index.detected_at(),
                     "hypothesis_type": "connection_exhaustion",
                     "source": "loki:connection_failures",
                 },
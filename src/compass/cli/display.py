@@ -11,7 +11,7 @@ Design:
 - Progress indicators for OODA phases
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -22,6 +22,35 @@ from compass.core.ooda_orchestrator import OODAResult
 from compass.core.phases.act import ValidationResult
 from compass.core.phases.orient import RankedHypothesis
 
+# Style lookups shared by every render (built once at import, not per call)
+_SEVERITY_COLORS: Dict[str, str] = {
+    "low": "blue",
+    "medium": "yellow",
+    "high": "orange1",
+    "critical": "red",
+}
+
+_PHASE_NAMES: Dict[InvestigationStatus, str] = {
+    InvestigationStatus.TRIGGERED: "Triggered",
+    InvestigationStatus.OBSERVING: "Observe",
+    InvestigationStatus.HYPOTHESIS_GENERATION: "Generate Hypotheses",
+    InvestigationStatus.AWAITING_HUMAN: "Decide",
+    InvestigationStatus.VALIDATING: "Act",
+    InvestigationStatus.RESOLVED: "Resolved",
+    InvestigationStatus.INCONCLUSIVE: "Inconclusive",
+}
+
+_OUTCOME_COLORS: Dict[str, str] = {
+    "SURVIVED": "green",
+    "FAILED": "red",
+    "INCONCLUSIVE": "yellow",
+}
+
+_STATUS_COLORS: Dict[InvestigationStatus, str] = {
+    InvestigationStatus.RESOLVED: "green",
+    InvestigationStatus.INCONCLUSIVE: "yellow",
+}
+
 
 class DisplayFormatter:
     """Formats investigation output with rich terminal styling.
@@ -51,21 +80,14 @@ class DisplayFormatter:
         Args:
             investigation: Investigation to display
         """
-        severity_colors = {
-            "low": "blue",
-            "medium": "yellow",
-            "high": "orange1",
-            "critical": "red",
-        }
-
-        color = severity_colors.get(
-            investigation.context.severity.lower(), "white"
-        )
+        context = investigation.context
+        severity = context.severity
+        color = _SEVERITY_COLORS.get(severity.lower(), "white")
 
         header = Panel(
-            f"[bold]Service:[/bold] {investigation.context.service}\n"
-            f"[bold]Symptom:[/bold] {investigation.context.symptom}\n"
-            f"[bold]Severity:[/bold] [{color}]{investigation.context.severity}[/{color}]\n"
+            f"[bold]Service:[/bold] {context.service}\n"
+            f"[bold]Symptom:[/bold] {context.symptom}\n"
+            f"[bold]Severity:[/bold] [{color}]{severity}[/{color}]\n"
             f"[bold]Investigation ID:[/bold] {investigation.id}",
             title="[bold cyan]COMPASS Investigation[/bold cyan]",
             border_style="cyan",
@@ -79,17 +101,7 @@ class DisplayFormatter:
         Args:
             status: New investigation status/phase
         """
-        phase_names = {
-            InvestigationStatus.TRIGGERED: "Triggered",
-            InvestigationStatus.OBSERVING: "Observe",
-            InvestigationStatus.HYPOTHESIS_GENERATION: "Generate Hypotheses",
-            InvestigationStatus.AWAITING_HUMAN: "Decide",
-            InvestigationStatus.VALIDATING: "Act",
-            InvestigationStatus.RESOLVED: "Resolved",
-            InvestigationStatus.INCONCLUSIVE: "Inconclusive",
-        }
-
-        phase_name = phase_names.get(status, status.value)
+        phase_name = _PHASE_NAMES.get(status, status.value)
         self.console.print(f"\n[bold blue]-> {phase_name}[/bold blue]\n")
 
     def show_observation_summary(
@@ -138,13 +150,7 @@ class DisplayFormatter:
         Args:
             result: Validation result to display
         """
-        outcome_colors = {
-            "SURVIVED": "green",
-            "FAILED": "red",
-            "INCONCLUSIVE": "yellow",
-        }
-
-        color = outcome_colors.get(result.outcome.name, "white")
+        color = _OUTCOME_COLORS.get(result.outcome.name, "white")
 
         panel = Panel(
             f"[bold]Hypothesis:[/bold] {result.hypothesis.statement}\n"
@@ -164,16 +170,13 @@ class DisplayFormatter:
         Args:
             investigation: Completed investigation
         """
-        status_colors = {
-            InvestigationStatus.RESOLVED: "green",
-            InvestigationStatus.INCONCLUSIVE: "yellow",
-        }
-
-        color = status_colors.get(investigation.status, "white")
+        status = investigation.status
+        color = _STATUS_COLORS.get(status, "white")
+        status_label = status.value.upper()
         duration = investigation.get_duration().total_seconds()
 
         panel = Panel(
-            f"[bold]Status:[/bold] [{color}]{investigation.status.value.upper()}[/{color}]\n"
+            f"[bold]Status:[/bold] [{color}]{status_label}[/{color}]\n"
             f"[bold]Duration:[/bold] {duration:.1f}s\n"
             f"[bold]Total Cost:[/bold] ${investigation.total_cost:.4f}\n"
             f"[bold]Hypotheses Generated:[/bold] {len(investigation.hypotheses)}",
@@ -8,7 +8,7 @@ Design:
 - Creates agents and providers with sensible defaults
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Type
 
 from compass.agents.workers.database_agent import DatabaseAgent
 from compass.config import settings
@@ -18,6 +18,13 @@ from compass.integrations.llm.openai_provider import OpenAIProvider
 from compass.integrations.mcp.grafana_client import GrafanaMCPClient
 from compass.integrations.mcp.tempo_client import TempoMCPClient
 
+# default_llm_provider -> (settings API key attribute, provider class,
+# display name, API key environment variable)
+_LLM_PROVIDERS: Dict[str, Tuple[str, Type[LLMProvider], str, str]] = {
+    "openai": ("openai_api_key", OpenAIProvider, "OpenAI", "OPENAI_API_KEY"),
+    "anthropic": ("anthropic_api_key", AnthropicProvider, "Anthropic", "ANTHROPIC_API_KEY"),
+}
+
 
 def create_database_agent(
     agent_id: str = "database_specialist",
@@ -99,30 +106,21 @@ def create_llm_provider_from_settings() -> LLMProvider:
     """
     provider_type = settings.default_llm_provider
 
-    if provider_type == "openai":
-        if not settings.openai_api_key:
-            raise ValidationError(
-                "OpenAI API key not configured. "
-                "Set OPENAI_API_KEY environment variable."
-            )
-        return OpenAIProvider(
-            api_key=settings.openai_api_key,
-            model=settings.default_model_name,
-        )
-
-    elif provider_type == "anthropic":
-        if not settings.anthropic_api_key:
-            raise ValidationError(
-                "Anthropic API key not configured. "
-                "Set ANTHROPIC_API_KEY environment variable."
-            )
-        return AnthropicProvider(
-            api_key=settings.anthropic_api_key,
-            model=settings.default_model_name,
-        )
-
-    else:
+    provider = _LLM_PROVIDERS.get(provider_type)
+    if provider is None:
         raise ValueError(
             f"Unsupported LLM provider: {provider_type}. "
             f"Set DEFAULT_LLM_PROVIDER to 'openai' or 'anthropic'."
         )
+
+    key_attr, provider_class, display_name, env_var = provider
+    api_key = getattr(settings, key_attr)
+    if not api_key:
+        raise ValidationError(
+            f"{display_name} API key not configured. "
+            f"Set {env_var} environment variable."
+        )
+    return provider_class(
+        api_key=api_key,
+        model=settings.default_model_name,
+    )
@@ -149,6 +149,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from compass.observability import get_tracer
@@ -249,7 +250,38 @@ class Incident:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def parse_incident_time(start_time: str) -> datetime:
+    """
+    Parse an Incident's ISO 8601 start_time.
+
+    Memoized on the raw string so the orchestrator's validation and every
+    agent's observation window share one parse per incident.
+
+    Raises:
+        ValueError: If start_time is not valid ISO 8601
+    """
+    # Python 3.11+ fromisoformat accepts a trailing "Z" directly
+    return datetime.fromisoformat(start_time)
+
+
+class ObservationKind(Enum):
+    """
+    Type of data an observation carries.
+
+    Set by the agent that creates the observation so Orient-phase detectors
+    can route observations without parsing source strings.
+    """
+
+    UNKNOWN = "unknown"  # Not tagged - classify from source/description
+    ERROR_LOG = "error_log"
+    TRACE = "trace"
+    DEPLOYMENT_LOG = "deployment_log"
+    METRIC = "metric"
+    MEMORY = "memory"
+
+
+@dataclass(slots=True)
 class Observation:
     """
     A single observation made during the Observe phase.
@@ -266,6 +298,15 @@ class Observation:
     data: Any = None
     description: str = ""
     confidence: float = 1.0  # Confidence in the observation accuracy
+    kind: ObservationKind = ObservationKind.UNKNOWN
+    # Lowercased source/description, computed once so keyword classification
+    # doesn't allocate a new string per check
+    _source_lc: str = field(init=False, repr=False, compare=False, default="")
+    _desc_lc: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        self._source_lc = self.source.lower()
+        self._desc_lc = self.description.lower()
 
 
 @dataclass
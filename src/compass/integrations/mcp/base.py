@@ -23,10 +23,21 @@ Example usage:
     ```
 """
 
+import asyncio
+import json
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json for decoding MCP response bodies
+    orjson = None  # type: ignore[assignment]
+
+T = TypeVar("T")
 
 
 # Exception hierarchy for MCP errors
@@ -122,3 +133,60 @@ class MCPServer(ABC):
     async def disconnect(self) -> None:
         """Close connection to the MCP server."""
         pass
+
+
+class SyncLoopRunner:
+    """Runs coroutines for synchronous callers on one long-lived event loop.
+
+    MCP clients keep an httpx session (and, for Tempo, an MCP session id)
+    across calls. Running each sync wrapper under asyncio.run() creates and
+    closes a fresh loop per call, so pooled keep-alive connections and the
+    initialized MCP session can't be reused. A single background loop per
+    client keeps them alive across agent observe() cycles.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run coro on the background loop and block for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def stop(self) -> None:
+        """Stop the background loop (a later run() starts a new one)."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None:
+            return loop
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self._name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+
+def decode_json_body(body: bytes) -> Any:
+    """Decode an MCP response body straight from the wire bytes.
+
+    Uses orjson when installed (a C decoder, noticeably faster than httpx's
+    stdlib-based Response.json() on large metric/log/trace payloads). Both
+    paths raise json.JSONDecodeError subclasses on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
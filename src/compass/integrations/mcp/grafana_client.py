@@ -14,8 +14,9 @@ Usage:
 
 import asyncio
 import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
 from urllib.parse import urlparse
 
 import httpx
@@ -25,10 +26,29 @@ from compass.integrations.mcp.base import (
     MCPConnectionError,
     MCPQueryError,
     MCPResponse,
+    SyncLoopRunner,
+    decode_json_body,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Keep-alive connections held open to the MCP server. Sized for the concurrent
+# observe sources of the agents that share one client (ApplicationAgent and
+# NetworkAgent each query on their own worker threads).
+DEFAULT_MAX_CONNECTIONS = 16
+
+
+@dataclass(frozen=True)
+class BulkResponse:
+    """Results of GrafanaMCPClient.bulk_query, in request order.
+
+    Each entry is the MCPResponse for that query, or the exception it raised -
+    one failing query does not discard the others.
+    """
+
+    metrics: List[Union[MCPResponse, Exception]]
+    logs: List[Union[MCPResponse, Exception]]
+
 
 class GrafanaMCPClient:
     """Client for interacting with Grafana MCP server.
@@ -40,6 +60,7 @@ class GrafanaMCPClient:
         url: Grafana URL (e.g., "http://localhost:3000")
         token: Grafana service account token
         timeout: Request timeout in seconds (default: 30.0)
+        max_connections: HTTP connection pool size, all kept alive (default: 16)
 
     Example:
         >>> async with GrafanaMCPClient(url=grafana_url, token=token) as client:
@@ -55,6 +76,7 @@ class GrafanaMCPClient:
         url: str,
         token: str,
         timeout: float = 30.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ):
         """Initialize Grafana MCP client.
 
@@ -62,6 +84,8 @@ class GrafanaMCPClient:
             url: Grafana URL (e.g., "http://localhost:3000")
             token: Grafana service account token (starts with "glsa_")
             timeout: Request timeout in seconds (default: 30.0)
+            max_connections: HTTP connection pool size, all kept alive
+                between requests (default: 16)
 
         Raises:
             ValueError: If url or token is empty or invalid
@@ -84,8 +108,11 @@ class GrafanaMCPClient:
         self.url = url.rstrip("/")
         self.token = token
         self.timeout = timeout
+        self.max_connections = max_connections
         self._session: Optional[httpx.AsyncClient] = None
         self._datasource_cache: Dict[str, str] = {}  # type -> UID cache
+        # Persistent loop for the synchronous wrappers (keeps the session warm)
+        self._sync_runner = SyncLoopRunner("grafana-mcp-sync")
 
         logger.info("grafana_mcp_client_initialized", url=self.url, timeout=timeout)
 
@@ -106,6 +133,10 @@ class GrafanaMCPClient:
         try:
             self._session = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
                 headers={
                     "Authorization": f"Bearer {self.token}",
                     "Content-Type": "application/json",
@@ -320,6 +351,46 @@ class GrafanaMCPClient:
             server_type="grafana",
         )
 
+    async def bulk_query(
+        self,
+        promql: Sequence[Dict[str, Any]] = (),
+        logql: Sequence[Dict[str, Any]] = (),
+    ) -> BulkResponse:
+        """Execute several PromQL and LogQL queries over one session in one pass.
+
+        Queries are issued concurrently on the shared HTTP session, so the
+        batch costs one round-trip of latency instead of one per query.
+
+        Args:
+            promql: query_promql keyword arguments, one dict per query
+            logql: query_logql keyword arguments, one dict per query
+
+        Returns:
+            BulkResponse with per-query results (or exceptions) in request order
+
+        Example:
+            >>> bulk = await client.bulk_query(
+            ...     promql=[{"query": "up", "datasource_uid": "prometheus"}],
+            ...     logql=[{"query": '{app="compass"}', "datasource_uid": "loki"}],
+            ... )
+            >>> metrics, logs = bulk.metrics[0], bulk.logs[0]
+        """
+        if self._session is None:
+            await self.connect()
+
+        results = await asyncio.gather(
+            *(self.query_promql(**params) for params in promql),
+            *(self.query_logql(**params) for params in logql),
+            return_exceptions=True,
+        )
+        for result in results:
+            # Only swallow query failures; cancellation etc. must propagate
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        split = len(promql)
+        return BulkResponse(metrics=list(results[:split]), logs=list(results[split:]))
+
     async def search_dashboards(
         self,
         title: str,
@@ -435,7 +506,7 @@ class GrafanaMCPClient:
 
                 # Success - return response
                 response.raise_for_status()
-                return cast(Dict[str, Any], response.json())
+                return cast(Dict[str, Any], decode_json_body(response.content))
 
             except httpx.TimeoutException as e:
                 if attempt < max_retries - 1:
@@ -484,7 +555,8 @@ class GrafanaMCPClient:
     # Synchronous Wrapper Methods (for agent compatibility)
     # ========================================================================
     # NOTE: These are temporary adapters until agents are refactored to async.
-    # They run async methods in a new event loop via asyncio.run().
+    # They run async methods on this client's persistent background loop
+    # (SyncLoopRunner) so the HTTP/MCP session survives across calls.
 
     def query_range(
         self,
@@ -563,7 +635,7 @@ class GrafanaMCPClient:
                 server_type="grafana",
             )
 
-        return asyncio.run(_query())
+        return self._sync_runner.run(_query())
 
     def custom_query_range(
         self,
@@ -648,4 +720,32 @@ class GrafanaMCPClient:
                 server_type="grafana",
             )
 
-        return asyncio.run(_query())
+        return self._sync_runner.run(_query())
+
+    def bulk_query_sync(
+        self,
+        promql: Sequence[Dict[str, Any]] = (),
+        logql: Sequence[Dict[str, Any]] = (),
+    ) -> BulkResponse:
+        """Synchronous wrapper for bulk_query.
+
+        Args:
+            promql: query_promql keyword arguments, one dict per query
+            logql: query_logql keyword arguments, one dict per query
+
+        Returns:
+            BulkResponse with per-query results (or exceptions) in request order
+        """
+        return self._sync_runner.run(self.bulk_query(promql=promql, logql=logql))
+
+    def warmup(self) -> None:
+        """Open the session on the sync loop ahead of the first query."""
+        self._sync_runner.run(self.connect())
+
+    def close_sync(self) -> None:
+        """Close the session and stop the sync loop (counterpart of warmup)."""
+        try:
+            self._sync_runner.run(self.disconnect())
+        finally:
+            self._sync_runner.stop()
+
@@ -25,6 +25,8 @@ from compass.integrations.mcp.base import (
     MCPConnectionError,
     MCPQueryError,
     MCPResponse,
+    SyncLoopRunner,
+    decode_json_body,
 )
 
 logger = structlog.get_logger(__name__)
@@ -83,6 +85,8 @@ class TempoMCPClient:
         self.timeout = timeout
         self._session: Optional[httpx.AsyncClient] = None
         self._mcp_session_id: Optional[str] = None  # MCP session management
+        # Persistent loop for the synchronous wrappers (keeps the session warm)
+        self._sync_runner = SyncLoopRunner("tempo-mcp-sync")
 
         logger.info("tempo_mcp_client_initialized", url=self.url, timeout=timeout)
 
@@ -449,7 +453,7 @@ class TempoMCPClient:
 
                 # Success - parse JSON-RPC 2.0 response
                 response.raise_for_status()
-                json_response = response.json()
+                json_response = decode_json_body(response.content)
 
                 # Check for JSON-RPC error
                 if "error" in json_response:
@@ -515,7 +519,8 @@ class TempoMCPClient:
     # Synchronous Wrapper Methods (for agent compatibility)
     # ========================================================================
     # NOTE: These are temporary adapters until agents are refactored to async.
-    # They run async methods in a new event loop via asyncio.run().
+    # They run async methods on this client's persistent background loop
+    # (SyncLoopRunner) so the HTTP/MCP session survives across calls.
 
     def query_traces(
         self,
@@ -566,7 +571,7 @@ class TempoMCPClient:
                 end_dt = end_time
 
         # Call async method and extract data from MCPResponse
-        response = asyncio.run(
+        response = self._sync_runner.run(
             self.query_traceql(
                 query=query,
                 start=start_dt,
@@ -576,3 +581,15 @@ class TempoMCPClient:
         )
         # Return just the data field for agent compatibility
         return response.data
+
+    def warmup(self) -> None:
+        """Open the session on the sync loop ahead of the first query."""
+        self._sync_runner.run(self.connect())
+
+    def close_sync(self) -> None:
+        """Close the session and stop the sync loop (counterpart of warmup)."""
+        try:
+            self._sync_runner.run(self.disconnect())
+        finally:
+            self._sync_runner.stop()
+
@@ -7,6 +7,7 @@ investigations and agent interactions across the system.
 import logging
 import sys
 from contextvars import ContextVar
+from decimal import Decimal
 from typing import Any, Dict, Optional
 
 import structlog
@@ -14,6 +15,12 @@ from structlog.types import Processor
 
 from compass.config import Environment, Settings
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json via structlog's default serializer
+    orjson = None  # type: ignore[assignment]
+
 # Context variable for correlation ID (thread-safe)
 _correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
@@ -58,6 +65,59 @@ def add_correlation_id(
     return event_dict
 
 
+def format_decimals(
+    logger: logging.Logger, method_name: str, event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Processor to render Decimal values (costs, budgets) as plain strings.
+
+    Console chain only - ConsoleRenderer reprs non-str values, so without it
+    a cost would print as Decimal('0.0025'). The JSON chain leaves Decimals
+    to _json_default instead. Call sites pass raw Decimals either way.
+
+    Args:
+        logger: Logger instance
+        method_name: Log method name
+        event_dict: Event dictionary
+
+    Returns:
+        Event dictionary with Decimal values converted to str
+    """
+    for key, value in event_dict.items():
+        if type(value) is Decimal:
+            event_dict[key] = str(value)
+    return event_dict
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    JSON serializer fallback: Decimals as plain strings, else structlog's rules.
+
+    Only called for values the serializer can't encode natively, so emitted
+    events aren't walked looking for Decimals.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    try:
+        return obj.__structlog__()
+    except AttributeError:
+        return repr(obj)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize a log event with orjson (JSONRenderer serializer).
+
+    orjson returns bytes; stdlib logging handlers expect str. Non-native
+    types go through the renderer's ``default`` fallback (_json_default), and
+    non-str dict keys are stringified, both as with json.dumps - a log call
+    must never fail on its payload.
+    """
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 def setup_logging(settings: Settings) -> None:
     """
     Configure structured logging for COMPASS.
@@ -74,6 +134,8 @@ def setup_logging(settings: Settings) -> None:
 
     # Build processor chain
     processors: list[Processor] = [
+        # Drop events below the configured level before any other processing
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -85,11 +147,18 @@ def setup_logging(settings: Settings) -> None:
     # Add appropriate renderer based on environment
     if settings.environment == Environment.PROD:
         # JSON for production (machine-readable)
-        processors.append(structlog.processors.JSONRenderer())
+        # orjson when installed: several times faster than stdlib json
+        if orjson is not None:
+            processors.append(
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps, default=_json_default)
+            )
+        else:
+            processors.append(structlog.processors.JSONRenderer(default=_json_default))
     else:
         # Console for development (human-readable)
         processors.extend(
             [
+                format_decimals,
                 structlog.processors.ExceptionPrettyPrinter(),
                 structlog.dev.ConsoleRenderer(colors=True),
             ]
@@ -24,7 +24,13 @@ import structlog
 from compass.agents.workers.application_agent import ApplicationAgent, BudgetExceededError
 from compass.agents.workers.database_agent import DatabaseAgent
 from compass.agents.workers.network_agent import NetworkAgent
-from compass.core.scientific_framework import Incident, Observation, Hypothesis, DisproofAttempt
+from compass.core.scientific_framework import (
+    Incident,
+    Observation,
+    Hypothesis,
+    DisproofAttempt,
+    parse_incident_time,
+)
 from compass.observability import emit_span
 
 logger = structlog.get_logger()
@@ -103,11 +109,11 @@ class Orchestrator:
         if not incident.start_time:
             raise ValueError("Incident must have start_time")
 
-        # Validate start_time is parseable (ISO8601)
+        # Validate start_time is parseable (ISO8601). Shares the agents' memoized
+        # parse, so each incident's start time is parsed once per process
         try:
-            from datetime import datetime
-            datetime.fromisoformat(incident.start_time.replace("Z", "+00:00"))
-        except (ValueError, AttributeError) as e:
+            parse_incident_time(incident.start_time)
+        except (ValueError, TypeError) as e:
             raise ValueError(f"Incident start_time must be valid ISO8601: {e}")
 
         if not incident.affected_services:
@@ -8,15 +8,18 @@ Tests that ApplicationAgent properly observes application-level data:
 - Graceful degradation for partial failures
 - Cost tracking within budget
 """
+import re
+import threading
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from unittest.mock import Mock, MagicMock
 
 import pytest
+from structlog.testing import capture_logs
 
-from compass.agents.workers.application_agent import ApplicationAgent
+from compass.agents.workers.application_agent import ApplicationAgent, CoalescingLokiClient
 from compass.core.query_generator import QueryGenerator, QueryRequest, QueryType, GeneratedQuery
-from compass.core.scientific_framework import Observation, Incident
+from compass.core.scientific_framework import Observation, ObservationKind, Incident
 
 
 @pytest.fixture
@@ -300,3 +303,660 @@ def test_application_agent_respects_budget_limit(
     # Should have observations despite budget (graceful degradation)
     # Budget is advisory, not hard limit (observability should continue)
     assert isinstance(observations, list)
+
+
+def test_application_agent_latency_statistics(
+    application_agent, sample_incident, mock_tempo_client
+):
+    """Test that latency observation reports mean, max and percentile span duration."""
+    mock_tempo_client.query_traces.return_value = [
+        {"traceId": "trace-1", "spans": [{"duration": 1200}, {"duration": 300}]},
+        {"traceId": "trace-2", "spans": [{"duration": 900}, {"service": "no-duration"}]},
+        {"traceId": "trace-3"},
+    ]
+
+    observations = application_agent.observe(sample_incident)
+
+    latency_obs = [obs for obs in observations if obs.source.startswith("tempo:")]
+    assert len(latency_obs) == 1
+    assert latency_obs[0].data["trace_count"] == 3
+    assert latency_obs[0].data["avg_duration_ms"] == pytest.approx(800.0)
+    assert latency_obs[0].data["max_duration_ms"] == 1200
+    assert latency_obs[0].data["p50_duration_ms"] == pytest.approx(900.0)
+    assert latency_obs[0].data["p99_duration_ms"] == pytest.approx(1194.0)
+    assert latency_obs[0].kind is ObservationKind.TRACE
+
+
+def test_application_agent_queries_sources_concurrently(
+    mock_loki_client, mock_tempo_client, sample_incident
+):
+    """Test that Loki and Tempo sources are queried in parallel."""
+    # Without a QueryGenerator, error and deployment logs share one Loki query;
+    # it and the Tempo query must be in flight at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def loki_query(**kwargs):
+        barrier.wait()
+        return [{"time": "2024-01-20T14:28:00Z", "line": "Deployment v2.3.1 error"}]
+
+    def tempo_query(**kwargs):
+        barrier.wait()
+        return [{"traceId": "trace-1", "spans": [{"duration": 100}]}]
+
+    mock_loki_client.query_range.side_effect = loki_query
+    mock_tempo_client.query_traces.side_effect = tempo_query
+
+    agent = ApplicationAgent(
+        budget_limit=Decimal("2.00"),
+        loki_client=mock_loki_client,
+        tempo_client=mock_tempo_client,
+    )
+
+    observations = agent.observe(sample_incident)
+
+    sources = [obs.source.split(":")[1] for obs in observations]
+    assert sources == ["error_logs", "traces", "deployments"]
+
+
+def test_application_agent_caches_generated_queries_across_incidents(
+    application_agent, mock_query_generator, mock_loki_client
+):
+    """Test that repeat intents for the same service reuse the generated query."""
+    mock_query_generator.generate_query.return_value = GeneratedQuery(
+        query_type=QueryType.LOGQL,
+        query='{service="payment-service"} |= "error" | json',
+        explanation="test",
+        is_valid=True,
+        tokens_used=100,
+        cost=Decimal("0.0010"),
+    )
+    mock_loki_client.query_range.return_value = [
+        {"time": "2024-01-20T14:30:00Z", "line": "error"}
+    ]
+
+    # Same service, different incident windows
+    for incident_id, start_time in [("INC-001", "2024-01-20T14:30:00Z"), ("INC-002", "2024-01-21T09:00:00Z")]:
+        application_agent.observe(
+            Incident(
+                incident_id=incident_id,
+                title="Error spike",
+                start_time=start_time,
+                affected_services=["payment-service"],
+                severity="high",
+            )
+        )
+
+    # LLM generation paid once; cached query reused for second window
+    assert mock_query_generator.generate_query.call_count == 1
+    assert application_agent._total_cost == Decimal("0.0010")
+    queries = [c.kwargs["query"] for c in mock_loki_client.query_range.call_args_list]
+    assert queries.count('{service="payment-service"} |= "error" | json') == 2
+
+    stats = application_agent.get_query_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["cost_saved"] == Decimal("0.0010")
+    assert stats["cache_size"] == 1
+
+
+def test_application_agent_query_cache_entries_expire(
+    application_agent, sample_incident, mock_query_generator, mock_loki_client, monkeypatch
+):
+    """Test cached generated queries are regenerated after the TTL elapses."""
+    from compass.agents.workers import application_agent as module
+
+    mock_query_generator.generate_query.return_value = GeneratedQuery(
+        query_type=QueryType.LOGQL,
+        query='{service="payment-service"} |= "error" | json',
+        explanation="test",
+        is_valid=True,
+        tokens_used=100,
+        cost=Decimal("0.0010"),
+    )
+    mock_loki_client.query_range.return_value = []
+    clock = [1000.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: clock[0])
+
+    application_agent.observe(sample_incident)
+    clock[0] += ApplicationAgent.QUERY_CACHE_TTL_SECONDS - 1
+    application_agent.observe(sample_incident)
+    assert mock_query_generator.generate_query.call_count == 1
+
+    clock[0] += 2
+    application_agent.observe(sample_incident)
+    assert mock_query_generator.generate_query.call_count == 2
+    assert application_agent._total_cost == Decimal("0.0020")
+
+
+def test_application_agent_deployment_query_is_valid_logql(
+    application_agent, sample_incident, mock_loki_client
+):
+    """Test deployment query uses one case-insensitive regex filter over the keywords."""
+    mock_loki_client.query_range.return_value = [
+        {"time": "2024-01-20T14:28:00Z", "line": "Canary ROLLOUT v2.3.1 started"},
+        {"time": "2024-01-20T14:29:00Z", "line": "Helm release payment-7 upgraded"},
+    ]
+
+    observations = application_agent.observe(sample_incident)
+
+    queries = [c.kwargs["query"] for c in mock_loki_client.query_range.call_args_list]
+    deployment_query = next(q for q in queries if "deploy" in q)
+    assert deployment_query == (
+        '{service="payment-service"} |~ "(?i)(deploy|rollout|canary|release)"'
+    )
+
+    # Loki applied the filter: every returned entry is a deployment record
+    deployment_obs = [obs for obs in observations if obs.source.startswith("loki:deployments")]
+    assert len(deployment_obs) == 1
+    assert [d["log"] for d in deployment_obs[0].data["deployments"]] == [
+        "Canary ROLLOUT v2.3.1 started",
+        "Helm release payment-7 upgraded",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("line", "is_deployment"),
+    [
+        ("Deployment v2.3.1 started", True),
+        ("deploy finished", True),
+        ("Argo Rollout payment-service progressing", True),
+        ("CANARY at 20% traffic", True),
+        ("Released v2.3.2", True),
+        ("cache warmed", False),
+        ("payment error: card declined", False),
+    ],
+)
+def test_application_agent_splits_deployment_lines_by_keyword(
+    mock_loki_client, sample_incident, line, is_deployment
+):
+    """Test combined results keep deployment lines by keyword, case-insensitively."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"), loki_client=mock_loki_client)
+    mock_loki_client.query_range.return_value = [{"time": "2024-01-20T14:28:00Z", "line": line}]
+
+    observations = agent.observe(sample_incident)
+
+    deployment_obs = [obs for obs in observations if obs.source.startswith("loki:deployments")]
+    assert bool(deployment_obs) is is_deployment
+
+
+def test_application_agent_tracks_costs_as_integer_microdollars(application_agent):
+    """Test internal cost bookkeeping is integer micro-dollars, reported as Decimal."""
+    application_agent._record_cost(1500, "error_rates")
+    application_agent._record_cost(250)
+
+    assert application_agent._total_cost_micro == 1750
+    assert application_agent._observation_costs["error_rates"] == 1500
+    assert isinstance(application_agent._total_cost, Decimal)
+    assert application_agent._total_cost == Decimal("0.00175")
+
+
+@pytest.mark.parametrize(
+    ("cost", "micro"),
+    [
+        (Decimal("0.003"), 3_000),
+        (Decimal("0.0000004"), 0),
+        (Decimal("0.0000005"), 1),
+        (Decimal("0.0012349999"), 1_235),
+    ],
+)
+def test_to_micro_rounds_half_up(cost, micro):
+    """Test dollar amounts round to the nearest micro-dollar instead of truncating."""
+    from compass.agents.workers.application_agent import _to_micro
+
+    assert _to_micro(cost) == micro
+
+
+def test_application_agent_calculates_time_window(application_agent, sample_incident):
+    """Test ±15 minute window parsing for 'Z' and explicit-offset start times."""
+    start, end = application_agent._calculate_time_range(sample_incident)
+    assert start == datetime(2024, 1, 20, 14, 15, tzinfo=timezone.utc)
+    assert end == datetime(2024, 1, 20, 14, 45, tzinfo=timezone.utc)
+
+    offset_incident = Incident(
+        incident_id="INC-002",
+        title="Offset start time",
+        start_time="2024-01-20T14:30:00+00:00",
+    )
+    assert application_agent._calculate_time_range(offset_incident) == (start, end)
+
+
+def test_application_agent_simple_query_strings(
+    mock_loki_client, mock_tempo_client, sample_incident
+):
+    """Test simple error and deployment filters are fetched in one LogQL query."""
+    agent = ApplicationAgent(
+        budget_limit=Decimal("2.00"),
+        loki_client=mock_loki_client,
+        tempo_client=mock_tempo_client,
+    )
+    mock_loki_client.query_range.return_value = []
+
+    agent.observe(sample_incident)
+
+    queries = [c.kwargs["query"] for c in mock_loki_client.query_range.call_args_list]
+    assert queries == [
+        '{service="payment-service"} |~ "error|(?i:deploy|rollout|canary|release)"'
+    ]
+
+
+def test_application_agent_splits_combined_log_query(
+    mock_loki_client, sample_incident
+):
+    """Test combined Loki results are partitioned into error and deployment observations."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"), loki_client=mock_loki_client)
+    mock_loki_client.query_range.return_value = [
+        {"time": "2024-01-20T14:25:00Z", "line": "payment error: card declined"},
+        {"time": "2024-01-20T14:26:00Z", "line": "ERROR upstream timeout"},
+        {"time": "2024-01-20T14:28:00Z", "line": "Deployment v2.3.1 started"},
+        {"time": "2024-01-20T14:29:00Z", "line": "rollout error, retrying"},
+    ]
+
+    observations = agent.observe(sample_incident)
+
+    by_source = {obs.source.split(":")[1]: obs for obs in observations}
+    # Case-sensitive like |= "error": the "ERROR" line is not counted
+    assert by_source["error_logs"].data["error_count"] == 2
+    assert [d["log"] for d in by_source["deployments"].data["deployments"]] == [
+        "Deployment v2.3.1 started",
+        "rollout error, retrying",
+    ]
+    assert mock_loki_client.query_range.call_count == 1
+    assert by_source["error_logs"].data["query"] == '{service="payment-service"} |= "error"'
+    assert by_source["error_logs"].kind is ObservationKind.ERROR_LOG
+    assert by_source["deployments"].kind is ObservationKind.DEPLOYMENT_LOG
+
+
+def test_application_agent_queries_log_sources_separately_when_combined_truncates(
+    mock_loki_client, sample_incident
+):
+    """Test error lines filling the combined query's limit don't starve deployments."""
+    error_flood = [
+        {"time": "2024-01-20T14:25:00Z", "line": f"payment error {i}"}
+        for i in range(ApplicationAgent.COMBINED_LOGS_LIMIT)
+    ]
+    deployment = [{"time": "2024-01-20T14:28:00Z", "line": "Deployment v2.3.1 started"}]
+
+    def query_range(query, **kwargs):
+        if query.endswith('"(?i)(deploy|rollout|canary|release)"'):
+            return deployment
+        return error_flood
+
+    mock_loki_client.query_range.side_effect = query_range
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"), loki_client=mock_loki_client)
+
+    observations = agent.observe(sample_incident)
+
+    calls = {c.kwargs["query"]: c.kwargs for c in mock_loki_client.query_range.call_args_list}
+    combined = '{service="payment-service"} |~ "error|(?i:deploy|rollout|canary|release)"'
+    assert calls[combined]["limit"] == ApplicationAgent.COMBINED_LOGS_LIMIT
+    assert set(calls) == {
+        combined,
+        '{service="payment-service"} |= "error"',
+        '{service="payment-service"} |~ "(?i)(deploy|rollout|canary|release)"',
+    }
+    by_source = {obs.source.split(":")[1]: obs for obs in observations}
+    assert by_source["error_logs"].data["error_count"] == ApplicationAgent.COMBINED_LOGS_LIMIT
+    assert by_source["deployments"].data["count"] == 1
+
+
+def test_application_agent_with_query_generator_queries_loki_separately(
+    application_agent, sample_incident, mock_query_generator, mock_loki_client
+):
+    """Test generated error queries are not merged with the deployment query."""
+    mock_query_generator.generate_query.return_value = GeneratedQuery(
+        query_type=QueryType.LOGQL,
+        query='{service="payment-service"} |= "error" | json',
+        explanation="test",
+        is_valid=True,
+        tokens_used=100,
+        cost=Decimal("0.0010"),
+    )
+    mock_loki_client.query_range.return_value = []
+
+    application_agent.observe(sample_incident)
+
+    queries = {c.kwargs["query"] for c in mock_loki_client.query_range.call_args_list}
+    assert queries == {
+        '{service="payment-service"} |= "error" | json',
+        '{service="payment-service"} |~ "(?i)(deploy|rollout|canary|release)"',
+    }
+
+
+def test_coalescing_loki_client_shares_in_flight_queries():
+    """Test identical concurrent Loki queries hit Loki once and share the result."""
+    started = threading.Event()
+    release = threading.Event()
+    loki = Mock()
+
+    def slow_query(**kwargs):
+        started.set()
+        release.wait(timeout=2)
+        return [{"line": "error"}]
+
+    loki.query_range.side_effect = slow_query
+    client = CoalescingLokiClient(loki)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.query_range(query="q", start=1, end=2)))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    # Give followers time to join the in-flight query before releasing it
+    started.wait(timeout=2)
+    threading.Event().wait(0.2)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert loki.query_range.call_count == 1
+    assert results == [[{"line": "error"}]] * 3
+
+
+def test_application_agent_keeps_injected_loki_client(mock_loki_client):
+    """Test the public loki attribute is the injected client, not the coalescing wrapper."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"), loki_client=mock_loki_client)
+    other = ApplicationAgent(budget_limit=Decimal("2.00"), loki_client=mock_loki_client)
+
+    assert agent.loki is mock_loki_client
+    # In-flight queries are tracked per wrapper, never keyed by client id()
+    assert agent._loki_queries._inflight is not other._loki_queries._inflight
+
+
+def test_application_agent_loki_queries_follow_reassigned_client(mock_loki_client):
+    """Test queries go to whichever client is currently assigned to agent.loki."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"))
+    assert agent._loki_queries is None
+
+    agent.loki = mock_loki_client
+    wrapper = agent._loki_queries
+    assert wrapper._client is mock_loki_client
+    assert agent._loki_queries is wrapper  # Cached while the client is unchanged
+
+    replacement = Mock()
+    agent.loki = replacement
+    agent._loki_queries.query_range(query='{service="api"}')
+
+    replacement.query_range.assert_called_once_with(query='{service="api"}')
+    mock_loki_client.query_range.assert_not_called()
+
+
+def test_application_agent_has_no_instance_dict():
+    """Test ApplicationAgent uses __slots__ (no per-instance __dict__)."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"))
+
+    assert not hasattr(agent, "__dict__")
+    with pytest.raises(AttributeError):
+        agent.unexpected_attribute = 1
+
+
+def test_application_agent_observe_without_sources_returns_empty(sample_incident):
+    """Test observe() short-circuits when no data source clients are configured."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"))
+
+    assert agent.observe(sample_incident) == []
+    assert agent._total_cost == Decimal("0")
+
+
+def test_application_agent_observes_sources_assigned_after_init(sample_incident):
+    """Test the no-sources short-circuit checks the clients assigned at observe() time."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"))
+    agent.loki = Mock()
+    agent.loki.query_range.return_value = []
+
+    agent.observe(sample_incident)
+
+    assert agent.loki.query_range.called
+
+
+def test_application_agent_skips_incomplete_deployment_entries(
+    mock_loki_client, sample_incident
+):
+    """Test deployment extraction ignores entries missing time/line or keywords."""
+    agent = ApplicationAgent(budget_limit=Decimal("2.00"), loki_client=mock_loki_client)
+    mock_loki_client.query_range.return_value = [
+        {"time": "2024-01-20T14:28:00Z", "line": "Deployment v2.3.1 started"},
+        {"line": "rollout without timestamp"},
+        {"time": "2024-01-20T14:29:00Z"},
+        {"time": "2024-01-20T14:29:30Z", "line": "cache warmed"},
+    ]
+
+    observations = agent.observe(sample_incident)
+
+    deployment_obs = [obs for obs in observations if obs.source.startswith("loki:deployments")]
+    assert len(deployment_obs) == 1
+    assert deployment_obs[0].data["deployments"] == [
+        {"time": "2024-01-20T14:28:00Z", "log": "Deployment v2.3.1 started"}
+    ]
+
+
+def test_application_agent_logs_one_record_per_observe(
+    application_agent, sample_incident, mock_loki_client, mock_tempo_client
+):
+    """Test observe() aggregates per-source counts into a single completion record."""
+    mock_loki_client.query_range.return_value = [
+        {"time": "2024-01-20T14:28:00Z", "line": "Deployment v2.3.1 error"}
+    ]
+    mock_tempo_client.query_traces.side_effect = RuntimeError("tempo down")
+    application_agent.query_generator = None
+
+    with capture_logs() as logs:
+        application_agent.observe(sample_incident)
+
+    events = [entry["event"] for entry in logs]
+    assert events.count("application_agent.observe_completed") == 1
+    assert "application_agent.observe_started" not in events
+    assert not any(event.endswith("_observation_succeeded") for event in events)
+    completed = next(e for e in logs if e["event"] == "application_agent.observe_completed")
+    assert completed["source_results"] == {"error": 1, "latency": None, "deployment": 1}
+    assert completed["incident_id"] == sample_incident.incident_id
+
+
+def test_application_agent_skips_span_when_observability_disabled(
+    application_agent, sample_incident, mock_loki_client, monkeypatch
+):
+    """Test observe() doesn't build a span when no tracer provider is active."""
+    from compass.agents.workers import application_agent as module
+
+    span_factory = Mock()
+    monkeypatch.setattr(module, "emit_span", span_factory)
+    monkeypatch.setattr(module, "spans_enabled", lambda: False)
+    mock_loki_client.query_range.return_value = []
+
+    application_agent.observe(sample_incident)
+
+    span_factory.assert_not_called()
+
+
+async def test_application_agent_observe_async_matches_observe(
+    application_agent, sample_incident, mock_loki_client, mock_tempo_client
+):
+    """Test observe_async() returns observe() results without blocking the loop."""
+    mock_loki_client.query_range.return_value = [
+        {"time": "2024-01-20T14:28:00Z", "line": "Deployment v2.3.1 error"}
+    ]
+    mock_tempo_client.query_traces.return_value = []
+    application_agent.query_generator = None
+
+    observations = await application_agent.observe_async(sample_incident)
+
+    sources = [obs.source.split(":")[1] for obs in observations]
+    assert sources == ["error_logs", "deployments"]
+
+
+# Minimal LogQL shape: one stream selector, then line filter stages
+_LOGQL_SELECTOR = r'\{service="[^"]+"\}'
+_LOGQL_FILTER = r'\s*(\|=|!=|\|~|!~)\s*"((?:[^"\\]|\\.)*)"'
+
+
+def _parse_logql_line_filters(query):
+    """Stub LogQL parse: return [(operator, argument)] or fail on invalid syntax."""
+    match = re.match(_LOGQL_SELECTOR, query)
+    assert match, f"missing stream selector: {query}"
+    rest = query[match.end():]
+    stages = []
+    while rest.strip():
+        stage = re.match(_LOGQL_FILTER, rest)
+        assert stage, f"invalid line filter stage in: {query}"
+        stages.append((stage.group(1), stage.group(2)))
+        rest = rest[stage.end():]
+    return stages
+
+
+@pytest.mark.parametrize("intent", ["error_logs", "deployment_logs", "error_or_deployment_logs"])
+def test_logql_templates_are_valid(intent):
+    """Test every catalog LogQL template renders to a parseable query."""
+    from compass.agents.workers.application_agent import _render_logql
+
+    stages = _parse_logql_line_filters(_render_logql(intent, "payment-service"))
+
+    assert stages
+    for operator, argument in stages:
+        if operator in ("|~", "!~"):
+            re.compile(argument)  # RE2 syntax used here is also valid Python re
+
+
+def test_application_agent_skips_query_generation_for_routine_incidents(
+    application_agent, mock_query_generator, mock_loki_client
+):
+    """Test routine incidents use the template error query without an LLM call."""
+    mock_query_generator.generate_query.return_value = GeneratedQuery(
+        query_type=QueryType.LOGQL,
+        query='{service="payment-service"} |= "error" | json',
+        explanation="test",
+        is_valid=True,
+        tokens_used=100,
+        cost=Decimal("0.0010"),
+    )
+    mock_loki_client.query_range.return_value = []
+
+    routine = Incident(
+        incident_id="INC-010",
+        title="Minor error blip",
+        start_time="2024-01-20T14:30:00Z",
+        affected_services=["payment-service"],
+    )
+    assert routine.severity in ApplicationAgent.TEMPLATE_ONLY_SEVERITIES  # Default "medium"
+    application_agent.observe(routine)
+
+    mock_query_generator.generate_query.assert_not_called()
+    assert application_agent._total_cost == Decimal("0")
+    queries = [c.kwargs["query"] for c in mock_loki_client.query_range.call_args_list]
+    assert queries == [
+        '{service="payment-service"} |~ "error|(?i:deploy|rollout|canary|release)"'
+    ]
+
+    # Custom log labels still warrant a generated query
+    labelled = Incident(
+        incident_id="INC-011",
+        title="Minor error blip",
+        start_time="2024-01-20T14:30:00Z",
+        affected_services=["payment-service"],
+        severity="low",
+        metadata={"log_labels": {"region": "eu-west-1"}},
+    )
+    application_agent.observe(labelled)
+
+    mock_query_generator.generate_query.assert_called_once()
+
+
+@pytest.mark.parametrize("severity", ["high", "critical"])
+def test_application_agent_generates_queries_for_severe_incidents(
+    application_agent, mock_query_generator, mock_loki_client, severity
+):
+    """Test severe incidents still get a generated error query."""
+    mock_query_generator.generate_query.return_value = GeneratedQuery(
+        query_type=QueryType.LOGQL,
+        query='{service="payment-service"} |= "error" | json',
+        explanation="test",
+        is_valid=True,
+        tokens_used=100,
+        cost=Decimal("0.0010"),
+    )
+    mock_loki_client.query_range.return_value = []
+
+    application_agent.observe(
+        Incident(
+            incident_id="INC-012",
+            title="Checkout failing",
+            start_time="2024-01-20T14:30:00Z",
+            affected_services=["payment-service"],
+            severity=severity,
+        )
+    )
+
+    mock_query_generator.generate_query.assert_called_once()
+    queries = {c.kwargs["query"] for c in mock_loki_client.query_range.call_args_list}
+    assert '{service="payment-service"} |= "error" | json' in queries
+
+
+def test_application_agent_skips_sources_once_budget_is_spent(
+    mock_loki_client, mock_tempo_client, mock_query_generator, sample_incident
+):
+    """Test sources return nothing (without querying) once the budget is fully spent."""
+    agent = ApplicationAgent(
+        budget_limit=Decimal("0.0030"),
+        loki_client=mock_loki_client,
+        tempo_client=mock_tempo_client,
+        query_generator=mock_query_generator,
+    )
+    mock_query_generator.generate_query.return_value = GeneratedQuery(
+        query_type=QueryType.LOGQL,
+        query='{service="payment-service"} |= "error" | json',
+        explanation="test",
+        is_valid=True,
+        tokens_used=100,
+        cost=Decimal("0.0030"),
+    )
+    mock_loki_client.query_range.return_value = [
+        {"time": "2024-01-20T14:30:00Z", "line": "error"}
+    ]
+    mock_tempo_client.query_traces.return_value = []
+
+    agent.observe(sample_incident)
+    assert agent._total_cost == agent.budget_limit
+    mock_loki_client.query_range.reset_mock()
+    mock_tempo_client.query_traces.reset_mock()
+
+    observations = agent.observe(sample_incident)
+
+    assert observations == []
+    mock_loki_client.query_range.assert_not_called()
+    mock_tempo_client.query_traces.assert_not_called()
+
+
+def test_application_agent_streams_error_logs_with_bounded_sample(
+    sample_incident, mock_query_generator
+):
+    """Test error logs are consumed from a streaming client keeping only a sample."""
+    mock_query_generator.generate_query.return_value = GeneratedQuery(
+        query_type=QueryType.LOGQL,
+        query='{service="payment-service"} |= "error" | json',
+        explanation="test",
+        is_valid=True,
+        tokens_used=100,
+        cost=Decimal("0.0010"),
+    )
+
+    class StreamingLoki:
+        def query_range(self, **kwargs):
+            raise AssertionError("streaming client should be iterated")
+
+        def iter_query_range(self, query, start, end):
+            for i in range(500):
+                yield {"time": "2024-01-20T14:30:00Z", "line": f"error {i}"}
+
+    agent = ApplicationAgent(
+        budget_limit=Decimal("2.00"),
+        loki_client=StreamingLoki(),
+        query_generator=mock_query_generator,
+    )
+
+    observations = agent.observe(sample_incident)
+
+    error_obs = [obs for obs in observations if obs.source.startswith("loki:error_logs")]
+    assert error_obs[0].data["error_count"] == 500
+    assert len(error_obs[0].data["sample"]) == ApplicationAgent.ERROR_SAMPLE_SIZE
+    assert error_obs[0].data["sample"][0]["line"] == "error 0"
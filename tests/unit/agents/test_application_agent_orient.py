@@ -15,7 +15,7 @@ import pytest
 
 from compass.agents.workers.application_agent import ApplicationAgent
 from compass.core.query_generator import QueryGenerator
-from compass.core.scientific_framework import Observation, Incident, Hypothesis
+from compass.core.scientific_framework import Observation, ObservationKind, Incident, Hypothesis
 
 
 @pytest.fixture
@@ -356,3 +356,70 @@ def test_application_agent_hypotheses_are_domain_specific(
 
         assert has_specific_cause, \
             f"Hypothesis should identify specific cause: {hypothesis.statement}"
+
+
+def test_application_agent_classifies_observations_once(
+    application_agent,
+    error_spike_observations,
+    latency_spike_observations,
+    deployment_observations,
+    memory_increase_observations,
+):
+    """Test all detectors receive the same pre-classified observation index."""
+    observations = (
+        error_spike_observations
+        + latency_spike_observations
+        + deployment_observations
+        + memory_increase_observations
+    )
+    received = []
+
+    def recording_detector(obs):
+        received.append(obs)
+        return None
+
+    application_agent._hypothesis_detectors.extend([recording_detector, recording_detector])
+
+    application_agent.generate_hypothesis(observations)
+
+    assert received[0] is received[1]
+    index = received[0]
+    assert list(index) == observations
+    assert index.error == error_spike_observations
+    assert index.latency == latency_spike_observations
+    assert index.deployment == deployment_observations
+    assert index.memory == memory_increase_observations
+
+
+@pytest.mark.parametrize(
+    "log_line,expected",
+    [
+        ("Deployment v2.3.1 started", "v2.3.1"),
+        ("Rolling out v2.3.1-rc4 to canary", "v2.3.1-rc4"),
+        ("deploy finished (v10), 3 pods", "v10"),
+        ("service revision 42 deployed", "unknown"),
+        ("validation passed for version", "unknown"),
+    ],
+)
+def test_application_agent_extracts_version_from_log(application_agent, log_line, expected):
+    """Test version extraction from deployment log lines."""
+    assert application_agent._extract_version_from_log(log_line) == expected
+
+
+def test_application_agent_routes_tagged_observations_by_kind(application_agent):
+    """Test tagged observations are bucketed by kind, not by keywords in source."""
+    from compass.agents.workers._shared import ObservationIndex
+
+    # Service name contains "deployment" - keyword matching would misroute this
+    error_obs = Observation(
+        source="loki:error_logs:deployment-controller",
+        data={"error_count": 3},
+        description="Found 3 error log entries for deployment-controller",
+        confidence=0.9,
+        kind=ObservationKind.ERROR_LOG,
+    )
+
+    index = ObservationIndex([error_obs])
+
+    assert index.error == [error_obs]
+    assert index.deployment == []
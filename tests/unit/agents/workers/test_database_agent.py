@@ -3,12 +3,13 @@
 import time
 from datetime import datetime, timezone
 from typing import Any, Dict
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+import structlog
 
 from compass.agents.workers.database_agent import DatabaseAgent
-from compass.core.scientific_framework import Hypothesis
+from compass.core.scientific_framework import Hypothesis, Incident
 from compass.integrations.mcp.base import MCPConnectionError, MCPQueryError, MCPResponse
 
 
@@ -287,7 +288,8 @@ class TestDatabaseAgentObserve:
 
         # Simulate 5 minutes passing by manually setting old cache time
         # Cache was set to current time, so set it to 301 seconds ago
-        agent._observe_cache_time = time.time() - 301  # 5 minutes 1 second ago
+        cached, _ = agent._observe_cache["default"]
+        agent._observe_cache["default"] = (cached, time.monotonic() - 301)  # 5 minutes 1 second ago
 
         # Execute second call after cache expiry
         await agent.observe()
@@ -436,6 +438,244 @@ class TestDatabaseAgentObserve:
         assert mock_grafana.query_logql.call_count == 1
         assert mock_tempo.query_traceql.call_count == 1
 
+    def test_observe_coalesces_concurrent_cold_callers(self):
+        """Verify concurrent cold-cache callers share one in-flight MCP query."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_traceql(**kwargs: Any) -> MCPResponse:
+            started.set()
+            release.wait(timeout=5)
+            return MCPResponse(
+                data={"traces": []},
+                query="test",
+                timestamp=datetime.now(timezone.utc),
+                metadata={},
+                server_type="tempo",
+            )
+
+        mock_tempo = Mock()
+        mock_tempo.query_traceql = Mock(side_effect=slow_traceql)
+        agent = DatabaseAgent(agent_id="test_database_agent", tempo_client=mock_tempo)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            owner = pool.submit(agent.observe)
+            assert started.wait(timeout=5)
+            waiters = [pool.submit(agent.observe) for _ in range(3)]
+            time.sleep(0.2)
+            release.set()
+            results = [owner.result()] + [w.result() for w in waiters]
+
+        assert mock_tempo.query_traceql.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert agent._observe_inflight == {}
+
+    def test_observe_maps_each_source_to_its_result_key(self):
+        """Verify per-source results land under their own key on partial failure."""
+
+        def response(data: Dict[str, Any]) -> MCPResponse:
+            return MCPResponse(
+                data=data,
+                query="test",
+                timestamp=datetime.now(timezone.utc),
+                metadata={},
+                server_type="grafana",
+            )
+
+        mock_grafana = Mock()
+        mock_grafana.query_promql = Mock(side_effect=MCPQueryError("bad query"))
+        mock_grafana.query_logql = Mock(return_value=response({"streams": ["log"]}))
+        mock_tempo = Mock()
+        mock_tempo.query_traceql = Mock(return_value=response({"traces": ["t1"]}))
+        agent = DatabaseAgent(
+            agent_id="test_database_agent",
+            grafana_client=mock_grafana,
+            tempo_client=mock_tempo,
+        )
+
+        result = agent.observe()
+
+        assert result["metrics"] == {}
+        assert result["logs"] == {"streams": ["log"]}
+        assert result["traces"] == {"traces": ["t1"]}
+        assert result["confidence"] == pytest.approx(2 / 3)
+
+    def test_observe_cache_compress_stores_bytes_and_returns_equal_result(self):
+        """Verify cache_compress keeps the cached result as bytes but returns the same data."""
+        mock_tempo = Mock()
+        mock_tempo.query_traceql = Mock(
+            return_value=MCPResponse(
+                data={"traces": [{"traceID": "abc", "spans": 3}]},
+                query="test",
+                timestamp=datetime.now(timezone.utc),
+                metadata={},
+                server_type="tempo",
+            )
+        )
+        agent = DatabaseAgent(
+            agent_id="test_database_agent",
+            tempo_client=mock_tempo,
+            config={"cache_compress": True},
+        )
+
+        first = agent.observe()
+        second = agent.observe()
+
+        assert isinstance(agent._observe_cache["default"][0], bytes)
+        assert second == first
+        assert second is not first
+        assert mock_tempo.query_traceql.call_count == 1
+
+    def test_observe_caps_results_at_source_with_config_overrides(self):
+        """Verify default queries cap result size and config can override per source."""
+        response = MCPResponse(
+            data={"result": []},
+            query="test",
+            timestamp=datetime.now(timezone.utc),
+            metadata={},
+            server_type="grafana",
+        )
+        mock_grafana = Mock()
+        mock_grafana.query_promql = Mock(return_value=response)
+        mock_grafana.query_logql = Mock(return_value=response)
+        agent = DatabaseAgent(
+            agent_id="test_database_agent",
+            grafana_client=mock_grafana,
+            config={"source_queries": {"logs": {"duration": "1m"}}},
+        )
+
+        agent.observe()
+
+        mock_grafana.query_promql.assert_called_once_with(
+            query="topk(50, db_connections)", datasource_uid="prometheus"
+        )
+        mock_grafana.query_logql.assert_called_once_with(
+            query='{app="postgres"}', datasource_uid="loki", duration="1m"
+        )
+
+    def test_observe_batches_grafana_queries_for_mcp_client(self):
+        """Verify a GrafanaMCPClient gets metrics and logs in one bulk call."""
+        from compass.integrations.mcp.grafana_client import BulkResponse, GrafanaMCPClient
+
+        grafana = GrafanaMCPClient(url="http://localhost:3000", token="glsa_test_token_123")
+        logs = MCPResponse(
+            data={"result": ["line"]},
+            query='{app="postgres"}',
+            timestamp=datetime.now(timezone.utc),
+            metadata={},
+            server_type="grafana",
+        )
+        bulk = BulkResponse(metrics=[MCPQueryError("bad query")], logs=[logs])
+        agent = DatabaseAgent(agent_id="test_database_agent", grafana_client=grafana)
+
+        with patch.object(grafana, "bulk_query_sync", return_value=bulk) as bulk_query:
+            with structlog.testing.capture_logs() as logs_captured:
+                result = agent.observe()
+
+        bulk_query.assert_called_once_with(
+            promql=[{"query": "topk(50, db_connections)", "datasource_uid": "prometheus"}],
+            logql=[{"query": '{app="postgres"}', "datasource_uid": "loki", "duration": "5m"}],
+        )
+        assert result["metrics"] == {}
+        assert result["logs"] == {"result": ["line"]}
+        assert result["confidence"] == 0.5
+        (failure,) = [
+            e for e in logs_captured if e["event"] == "database_agent.metrics_query_failed"
+        ]
+        assert failure["query"] == {
+            "query": "topk(50, db_connections)",
+            "datasource_uid": "prometheus",
+        }
+
+    def test_warmup_opens_mcp_sessions_and_tolerates_failures(self):
+        """Verify warmup() prewarms real MCP clients without raising on connection errors."""
+        from compass.integrations.mcp.grafana_client import GrafanaMCPClient
+
+        grafana = GrafanaMCPClient(url="http://localhost:3000", token="glsa_test_token_123")
+        agent = DatabaseAgent(
+            agent_id="test_database_agent", grafana_client=grafana, tempo_client=Mock()
+        )
+
+        with patch.object(grafana, "warmup") as warmup:
+            agent.warmup()
+        warmup.assert_called_once_with()
+        agent.tempo_client.warmup.assert_not_called()
+
+        with patch.object(grafana, "warmup", side_effect=MCPConnectionError("down")):
+            agent.warmup()
+
+    def test_observe_caches_per_incident_with_bounded_size(self, monkeypatch):
+        """Verify each incident gets its own cache entry and the oldest is evicted."""
+        from compass.agents.workers import database_agent as module
+
+        monkeypatch.setattr(module, "OBSERVE_CACHE_MAX_ENTRIES", 2)
+        mock_tempo = Mock()
+        mock_tempo.query_traceql = Mock(
+            return_value=MCPResponse(
+                data={"traces": []},
+                query="test",
+                timestamp=datetime.now(timezone.utc),
+                metadata={},
+                server_type="tempo",
+            )
+        )
+        agent = DatabaseAgent(agent_id="test_database_agent", tempo_client=mock_tempo)
+
+        incidents = {
+            incident_id: Incident(incident_id=incident_id, title="Test", start_time="")
+            for incident_id in ("INC-1", "INC-2", "INC-3")
+        }
+
+        agent.observe(incidents["INC-1"])
+        agent.observe(incidents["INC-2"])
+        agent.observe(incidents["INC-1"])
+        assert mock_tempo.query_traceql.call_count == 2
+
+        agent.observe(incidents["INC-3"])
+        assert list(agent._observe_cache) == ["INC-2", "INC-3"]
+        agent.observe(incidents["INC-1"])
+        assert mock_tempo.query_traceql.call_count == 4
+
+    def test_observe_cache_hit_does_not_take_lock(self):
+        """Verify a warm cache is served without acquiring the cache lock."""
+        agent = DatabaseAgent(agent_id="test_database_agent", tempo_client=Mock())
+        cached = {"metrics": {}, "logs": {}, "traces": {}, "confidence": 1.0}
+        agent._observe_cache["default"] = (cached, time.monotonic())
+        agent._cache_lock = MagicMock()  # Any acquire would go through __enter__
+
+        assert agent.observe() is cached
+        agent._cache_lock.__enter__.assert_not_called()
+
+    @pytest.mark.parametrize("debug_enabled", [False, True])
+    def test_observe_cache_hit_debug_log_gated_by_level(self, monkeypatch, debug_enabled):
+        """Verify the cache-hit debug record is only built when DEBUG is enabled."""
+        from structlog.testing import capture_logs
+
+        from compass.agents.workers import database_agent as module
+
+        monkeypatch.setattr(module, "_debug_enabled", lambda: debug_enabled)
+        agent = DatabaseAgent(agent_id="test_database_agent", tempo_client=Mock())
+        agent._observe_cache["default"] = ({"confidence": 1.0}, time.monotonic())
+
+        with capture_logs() as logs:
+            agent.observe()
+
+        events = [entry["event"] for entry in logs]
+        assert ("database_agent.observe_cache_hit" in events) is debug_enabled
+
+    def test_observe_inflight_failure_propagates_and_resets(self):
+        """Verify a failing in-flight query doesn't wedge later callers."""
+        agent = DatabaseAgent(agent_id="test_database_agent", tempo_client=Mock())
+
+        with patch.object(agent, "_observe_sources", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                agent.observe()
+
+        assert agent._observe_inflight == {}
+
 
 class TestDatabaseAgentDisproofStrategies:
     """Tests for generate_disproof_strategies() method."""
@@ -583,6 +823,51 @@ class TestDatabaseAgentDisproofStrategies:
         assert core_strategies.issubset(strategy_names2)
 
 
+    @pytest.mark.parametrize(
+        "statement,expected",
+        [
+            ("Lock contention since deploy", (0.9, 0.6, 0.65)),
+            ("Replica lag on orders shard", (0.7, 0.8, 0.65)),
+            ("Slow reads correlated with cache misses", (0.7, 0.6, 0.85)),
+            # Substring semantics: "timeout" and "handling" still match
+            ("Connection timeout handling", (0.9, 0.6, 0.85)),
+            ("Query plan regression", (0.7, 0.6, 0.65)),
+        ],
+    )
+    def test_strategy_priorities_follow_statement_keywords(self, statement, expected):
+        """Verify keyword groups drive the three dynamic strategy priorities."""
+        agent = DatabaseAgent(agent_id="test_database_agent")
+        hypothesis = Hypothesis(agent_id="test_database_agent", statement=statement)
+
+        priorities = {
+            s["strategy"]: s["priority"] for s in agent.generate_disproof_strategies(hypothesis)
+        }
+
+        assert (
+            priorities["temporal_contradiction"],
+            priorities["scope_verification"],
+            priorities["correlation_vs_causation"],
+        ) == expected
+
+
+    def test_strategies_are_fresh_dicts_per_call(self):
+        """Verify callers can mutate returned strategies without affecting later calls."""
+        agent = DatabaseAgent(agent_id="test_database_agent")
+        hypothesis = Hypothesis(agent_id="test_database_agent", statement="Query plan regression")
+
+        first = agent.generate_disproof_strategies(hypothesis)
+        for strategy in first:
+            strategy["priority"] = 0.0
+        second = agent.generate_disproof_strategies(hypothesis)
+
+        assert [s["priority"] for s in second] == [0.75, 0.7, 0.7, 0.65, 0.6, 0.6, 0.55]
+        assert [s["strategy"] for s in second][:3] == [
+            "metric_baseline_deviation",
+            "temporal_contradiction",
+            "external_factor_elimination",
+        ]
+
+
 class TestDatabaseAgentLLMHypothesis:
     """Tests for generate_hypothesis_with_llm() method."""
 
@@ -993,3 +1278,147 @@ class TestDatabaseAgentLLMHypothesis:
         # Without proper locking, race condition could allow this to succeed
         with pytest.raises(BudgetExceededError):
             await agent.generate_hypothesis_with_llm(observations)
+
+
+@pytest.mark.parametrize("context", ["", "Deploy at 14:00"])
+def test_format_hypothesis_prompt_matches_template_format(context: str) -> None:
+    """Verify the pre-parsed prompt renders exactly like str.format on the template."""
+    from compass.agents.workers.database_agent_prompts import (
+        HYPOTHESIS_GENERATION_PROMPT_TEMPLATE,
+        format_hypothesis_prompt,
+    )
+
+    prompt = format_hypothesis_prompt(
+        metrics="db_connections=95",
+        logs="",
+        traces="slow span",
+        timestamp="2024-01-20T14:30:00+00:00",
+        confidence=0.67,
+        context=context,
+    )
+
+    assert prompt == HYPOTHESIS_GENERATION_PROMPT_TEMPLATE.format(
+        metrics="db_connections=95",
+        logs="No logs data available",
+        traces="slow span",
+        timestamp="2024-01-20T14:30:00+00:00",
+        confidence=0.67,
+        context=f"\n### Additional Context\n{context}\n" if context else "",
+    )
+    assert '{\n  "statement"' in prompt
+
+
+def test_prompt_json_helpers_match_stdlib_json() -> None:
+    """Verify prompt serialization/parsing matches stdlib json, including fallbacks."""
+    import json
+
+    from compass.agents.workers.database_agent import _dumps_indented, _loads
+
+    payload = {"result": [{"metric": {"db": "primary"}, "value": [1705760000, "95"]}]}
+    assert _dumps_indented(payload) == json.dumps(payload, indent=2)
+    assert _dumps_indented({}) == "{}"
+    # Non-str keys are rejected by orjson and must fall back to stdlib json
+    assert _dumps_indented({1: "a"}) == json.dumps({1: "a"}, indent=2)
+
+    assert _loads('{"statement": "pool exhausted"}') == {"statement": "pool exhausted"}
+    with pytest.raises(json.JSONDecodeError):
+        _loads("not json")
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"statement": "Pool exhausted", "initial_confidence": 0.7, '
+        '"affected_systems": ["postgres"], "reasoning": "r"}',
+        '```json\n{"statement": "Pool exhausted", "initial_confidence": 0.7,\n'
+        '"affected_systems": ["postgres"], "reasoning": "r"}\n```',
+        '  ```\n{"statement": "Pool exhausted", "initial_confidence": 0.7, '
+        '"affected_systems": ["postgres"], "reasoning": "r"}\n  ```  ',
+        '```json\n{"statement": "Pool exhausted", "initial_confidence": 0.7, '
+        '"affected_systems": ["postgres"], "reasoning": "r"}',
+    ],
+)
+def test_generate_hypothesis_with_llm_strips_code_fences(content: str) -> None:
+    """Verify fenced and unfenced LLM JSON responses parse the same way."""
+    agent = DatabaseAgent(agent_id="test_database_agent")
+    agent.llm_provider = Mock()
+    agent.llm_provider.generate.return_value = Mock(
+        content=content, tokens_input=100, tokens_output=50, cost=0.001, model="test-model"
+    )
+
+    hypothesis = agent.generate_hypothesis_with_llm({"metrics": {}, "logs": {}, "traces": {}})
+
+    assert hypothesis.statement == "Pool exhausted"
+    assert hypothesis.affected_systems == ["postgres"]
+
+
+def test_generate_hypothesis_with_llm_reuses_identical_prompt() -> None:
+    """Verify identical prompts hit the LLM once and return independent copies."""
+    agent = DatabaseAgent(agent_id="test_database_agent")
+    agent.llm_provider = Mock()
+    agent.llm_provider.generate.return_value = Mock(
+        content='{"statement": "Pool exhausted", "initial_confidence": 0.7, '
+        '"affected_systems": ["postgres"], "reasoning": "r"}',
+        tokens_input=100,
+        tokens_output=50,
+        cost=0.001,
+        model="test-model",
+    )
+    observations = {"metrics": {"connections": 100}, "logs": {}, "traces": {}}
+
+    first = agent.generate_hypothesis_with_llm(observations)
+    first.affected_systems.append("mutated")
+    second = agent.generate_hypothesis_with_llm(observations)
+
+    assert agent.llm_provider.generate.call_count == 1
+    assert second.statement == first.statement
+    assert second.id != first.id
+    assert second.affected_systems == ["postgres"]
+    # Cache hits make no LLM call, so only the first call is charged
+    assert agent.get_cost() == pytest.approx(0.001)
+
+    # Different context -> different prompt -> new LLM call
+    agent.generate_hypothesis_with_llm(observations, context="Errors since 14:00")
+    assert agent.llm_provider.generate.call_count == 2
+
+
+def test_truncate_for_prompt_samples_lists_then_cuts_text() -> None:
+    """Verify prompt sections keep small payloads whole and cap large ones."""
+    import json
+
+    from compass.agents.workers.database_agent import _truncate_for_prompt
+
+    small = {"result": [1, 2, 3]}
+    assert _truncate_for_prompt(small, max_chars=4000) == json.dumps(small, indent=2)
+
+    # Many short entries: list sampling alone brings it under the cap, still valid JSON
+    logs = {"result": [f"line {i}" for i in range(500)]}
+    sampled = json.loads(_truncate_for_prompt(logs, max_chars=1000))
+    assert sampled["result"][:2] == ["line 0", "line 1"]
+    assert sampled["result"][-1] == "line 499"
+    assert "...[480 entries omitted]..." in sampled["result"]
+
+    # A single huge value can't be sampled: fall back to a head/tail text cut
+    huge = {"line": "x" * 10_000}
+    text = _truncate_for_prompt(huge, max_chars=1000)
+    assert len(text) < 1100
+    assert "chars omitted" in text
+
+
+def test_truncate_for_prompt_serializes_unsampleable_payload_once() -> None:
+    """Verify a payload with no long lists isn't dumped a second time."""
+    from compass.agents.workers import database_agent
+    from compass.agents.workers.database_agent import _sample_lists, _truncate_for_prompt
+
+    short = {"result": [{"line": "a"}, {"line": "b"}]}
+    assert _sample_lists(short, edge_items=10) is short
+
+    huge = {"result": [{"line": "x" * 10_000}]}
+    with patch.object(
+        database_agent, "_dumps_indented", wraps=database_agent._dumps_indented
+    ) as dumps:
+        text = _truncate_for_prompt(huge, max_chars=1000)
+
+    assert dumps.call_count == 1
+    assert "chars omitted" in text
+
@@ -137,6 +137,30 @@ def test_network_agent_dns_handles_general_exception(mock_prometheus, sample_inc
     assert len(dns_obs) == 0, "General exception should be handled gracefully"
 
 
+def test_network_agent_logs_query_failures_with_error_type(mock_prometheus, sample_incident):
+    """P1-1 FIX: Test failure logs keep the structured error/error_type fields."""
+    from structlog.testing import capture_logs
+
+    mock_prometheus.custom_query_range.side_effect = ValueError("Unexpected error")
+    agent = NetworkAgent(
+        budget_limit=Decimal("10.00"),
+        prometheus_client=mock_prometheus,
+    )
+
+    with capture_logs() as logs:
+        agent.observe(sample_incident)
+
+    dns_failure = next(e for e in logs if e["event"] == "dns_query_failed_unknown")
+    assert dns_failure["log_level"] == "error"
+    assert dns_failure["error"] == "Unexpected error"
+    assert dns_failure["error_type"] == "ValueError"
+    assert dns_failure["service"] == "payment-service"
+
+    source_failure = next(e for e in logs if e["event"] == "dns_observation_failed")
+    assert source_failure["log_level"] == "warning"
+    assert source_failure["error_type"] == "ValueError"
+
+
 def test_network_agent_without_prometheus(sample_incident):
     """Test NetworkAgent gracefully handles missing Prometheus client."""
     agent = NetworkAgent(
@@ -205,8 +229,62 @@ def test_network_agent_uses_query_generator_when_available(mock_prometheus, samp
     assert dns_obs[0].data["dns_server"] == "1.1.1.1"
 
 
+@pytest.mark.parametrize("debug_enabled", [False, True])
+def test_network_agent_query_generator_debug_log_gated_by_level(
+    mock_prometheus, sample_incident, monkeypatch, debug_enabled
+):
+    """Test the query_generator_used debug record is only built when DEBUG is enabled."""
+    from structlog.testing import capture_logs
+
+    from compass.agents.workers import network_agent as module
+
+    monkeypatch.setattr(module, "_debug_enabled", lambda: debug_enabled)
+    mock_query_gen = Mock()
+    mock_query_gen.generate_query.return_value = Mock(query="up", cost=Decimal("0.0025"))
+    mock_prometheus.custom_query_range.return_value = []
+    agent = NetworkAgent(
+        budget_limit=Decimal("10.00"),
+        prometheus_client=mock_prometheus,
+        query_generator=mock_query_gen,
+    )
+
+    with capture_logs() as logs:
+        agent.observe(sample_incident)
+
+    events = [entry["event"] for entry in logs]
+    assert ("query_generator_used" in events) is debug_enabled
+
+
+def test_network_agent_reuses_generated_queries_across_incidents(mock_prometheus, sample_incident):
+    """Test repeat incidents for a service reuse generated PromQL without new LLM cost."""
+    mock_query_gen = Mock()
+    mock_query_gen.generate_query.return_value = Mock(query="up", cost=Decimal("0.0025"))
+    mock_prometheus.custom_query_range.return_value = []
+    agent = NetworkAgent(
+        budget_limit=Decimal("10.00"),
+        prometheus_client=mock_prometheus,
+        query_generator=mock_query_gen,
+    )
+
+    agent.observe(sample_incident)
+    later = Incident(
+        incident_id="test-002",
+        title="DNS slow again",
+        start_time=datetime(2024, 1, 21, 9, 0, 0, tzinfo=timezone.utc).isoformat(),
+        affected_services=["payment-service"],
+    )
+    agent.observe(later)
+
+    # DNS, latency and packet loss generated once each; second incident is all hits
+    assert mock_query_gen.generate_query.call_count == 3
+    assert agent._total_cost == Decimal("0.0075")
+    assert agent.get_query_cache_stats()["hits"] == 3
+
+
 def test_network_agent_falls_back_when_query_generator_fails(mock_prometheus, sample_incident):
     """Test fallback to inline query when QueryGenerator fails."""
+    from structlog.testing import capture_logs
+
     # Mock QueryGenerator that fails
     mock_query_gen = Mock()
     mock_query_gen.generate_query.side_effect = Exception("QueryGenerator failed")
@@ -222,7 +300,14 @@ def test_network_agent_falls_back_when_query_generator_fails(mock_prometheus, sa
         query_generator=mock_query_gen,
     )
 
-    observations = agent.observe(sample_incident)
+    with capture_logs() as logs:
+        observations = agent.observe(sample_incident)
+
+    # Every generator-fallback handler logs the structured error fields
+    fallbacks = [e for e in logs if e["event"] == "query_generator_failed_using_fallback"]
+    assert len(fallbacks) == 3  # DNS, latency and packet loss
+    assert all(e["error_type"] == "Exception" for e in fallbacks)
+    assert all(e["service"] == "payment-service" for e in fallbacks)
 
     # Should still get observations using fallback queries (multiple observation methods)
     assert len(observations) > 0, "Should have observations from fallback queries"
@@ -236,6 +321,32 @@ def test_network_agent_falls_back_when_query_generator_fails(mock_prometheus, sa
     assert agent._total_cost == Decimal("0.0000")
 
 
+def test_network_agent_concurrent_generation_stays_within_budget(
+    mock_prometheus, sample_incident
+):
+    """Test concurrent sources reserve generation cost so they can't overshoot the budget."""
+    import time
+
+    def slow_generate(request):
+        time.sleep(0.05)  # Keep generations overlapping across the source threads
+        return Mock(query="up", cost=Decimal("0.003"))
+
+    mock_query_gen = Mock()
+    mock_query_gen.generate_query.side_effect = slow_generate
+    mock_prometheus.custom_query_range.return_value = []
+    agent = NetworkAgent(
+        budget_limit=Decimal("0.004"),
+        prometheus_client=mock_prometheus,
+        query_generator=mock_query_gen,
+    )
+
+    agent.observe(sample_incident)
+
+    assert mock_query_gen.generate_query.call_count == 1
+    assert agent._total_cost <= agent.budget_limit
+    assert agent._total_cost == Decimal("0.003")
+
+
 def test_network_agent_calculates_time_window_correctly(mock_prometheus, sample_incident):
     """Test that time window calculation is correct (±15 minutes).
 
@@ -263,6 +374,87 @@ def test_network_agent_calculates_time_window_correctly(mock_prometheus, sample_
         assert call_kwargs["end_time"] is not None, "P0-5: end_time must not be None"
 
 
+def test_network_agent_keeps_slotted_layout():
+    """Test NetworkAgent inherits ApplicationAgent's __slots__ (no per-instance __dict__)."""
+    agent = NetworkAgent(
+        budget_limit=Decimal("10.00"),
+        prometheus_client=Mock(),
+    )
+
+    assert not hasattr(agent, "__dict__")
+    assert agent.agent_id == "network_agent"
+
+
+def test_network_agent_skips_span_when_observability_disabled(sample_incident, monkeypatch):
+    """Test observe() doesn't build a span when no tracer provider is active."""
+    from compass.agents.workers import network_agent as module
+
+    span_factory = Mock()
+    monkeypatch.setattr(module, "emit_span", span_factory)
+    monkeypatch.setattr(module, "spans_enabled", lambda: False)
+    agent = NetworkAgent(budget_limit=Decimal("10.00"))
+
+    agent.observe(sample_incident)
+
+    span_factory.assert_not_called()
+
+
+def test_network_agent_observes_sources_concurrently(sample_incident, monkeypatch):
+    """Test observe() runs the five sources in parallel and keeps their order."""
+    import threading
+
+    barrier = threading.Barrier(5, timeout=5)  # Sequential calls would time out
+
+    def source(name, fail=False):
+        def observe_source(self, incident, service, start_time, end_time, **kwargs):
+            barrier.wait()
+            if fail:
+                raise requests.exceptions.Timeout("slow")
+            return [name]
+
+        return observe_source
+
+    for method, name in [
+        ("_observe_dns_resolution", "dns"),
+        ("_observe_network_latency", "latency"),
+        ("_observe_load_balancer", "load_balancer"),
+        ("_observe_connection_failures", "connection_failures"),
+    ]:
+        monkeypatch.setattr(NetworkAgent, method, source(name))
+    monkeypatch.setattr(NetworkAgent, "_observe_packet_loss", source("packet_loss", fail=True))
+    agent = NetworkAgent(budget_limit=Decimal("10.00"), prometheus_client=Mock())
+
+    observations = agent.observe(sample_incident)
+
+    assert observations == ["dns", "latency", "load_balancer", "connection_failures"]
+
+
+@pytest.mark.parametrize(
+    "kind, expected",
+    [
+        ("dns", 'rate(dns_lookup_duration_seconds{service="api"}[5m])'),
+        (
+            "latency",
+            'histogram_quantile(0.95, rate(http_request_duration_seconds_bucket{service="api"}[5m]))',
+        ),
+        ("packet_loss", "rate(node_network_transmit_drop_total[5m])"),
+        ("lb_backend_status", 'haproxy_backend_status{service="api"}'),
+        (
+            "network_logs",
+            '{service="api"} |~ "backend.*(DOWN|UP|MAINT)|connection.*(refused|timeout|failed)"',
+        ),
+        ("lb_logs", '{service="api"} |~ "backend.*(DOWN|UP|MAINT)"'),
+        ("connection_logs", '{service="api"} |~ "connection.*(refused|timeout|failed)"'),
+    ],
+)
+def test_network_agent_fallback_queries_are_memoized(kind, expected):
+    """Test fallback queries render per service once and are reused."""
+    from compass.agents.workers.network_agent import _fallback_query
+
+    assert _fallback_query(kind, "api") == expected
+    assert _fallback_query(kind, "api") is _fallback_query(kind, "api")
+
+
 def test_network_agent_has_hypothesis_detectors():
     """Test that NetworkAgent extends hypothesis detectors from ApplicationAgent."""
     agent = NetworkAgent(
@@ -282,6 +474,22 @@ def test_network_agent_has_hypothesis_detectors():
     assert '_detect_and_create_connection_exhaustion_hypothesis' in detector_names
 
 
+def test_network_agent_binds_declared_detectors_per_instance():
+    """Test detectors come from the class-level name tuple, bound per agent."""
+    agent = NetworkAgent(budget_limit=Decimal("10.00"))
+    other = NetworkAgent(budget_limit=Decimal("10.00"))
+
+    assert isinstance(NetworkAgent.HYPOTHESIS_DETECTOR_NAMES, tuple)
+    assert [d.__name__ for d in agent._hypothesis_detectors] == list(
+        NetworkAgent.HYPOTHESIS_DETECTOR_NAMES
+    )
+    assert agent._hypothesis_detectors[-1].__self__ is agent
+
+    # Per-instance list: extending one agent doesn't affect another
+    agent._hypothesis_detectors.append(lambda observations: None)
+    assert len(other._hypothesis_detectors) == len(NetworkAgent.HYPOTHESIS_DETECTOR_NAMES)
+
+
 def test_network_agent_inherits_budget_enforcement():
     """Test that NetworkAgent inherits budget enforcement from ApplicationAgent."""
     agent = NetworkAgent(
@@ -367,6 +575,25 @@ def test_network_agent_observes_packet_loss(mock_prometheus, sample_incident):
     assert high_loss[0].data["instance"] == "node-2"
 
 
+def test_network_agent_defaults_missing_prometheus_labels(mock_prometheus, sample_incident):
+    """Test results without "metric"/"value" fall back to unknown labels and zero."""
+    mock_prometheus.custom_query_range.return_value = [{}]
+    agent = NetworkAgent(budget_limit=Decimal("10.00"), prometheus_client=mock_prometheus)
+
+    observations = agent.observe(sample_incident)
+
+    packet_obs = [o for o in observations if o.source.startswith("prometheus:packet_loss")]
+    assert packet_obs[0].source == "prometheus:packet_loss:unknown:unknown"
+    assert packet_obs[0].data["drop_rate"] == 0.0
+    lb_obs = [o for o in observations if o.source.startswith("prometheus:load_balancer")]
+    assert lb_obs[0].data == {
+        "backend": "unknown",
+        "status": "unknown",
+        "value": 0.0,
+        "service": "payment-service",
+    }
+
+
 def test_network_agent_observes_load_balancer(mock_prometheus, mock_loki, sample_incident):
     """Test load balancer observation (Prometheus + Loki)."""
     # Mock Prometheus response for LB backend health
@@ -436,6 +663,29 @@ def test_network_agent_observes_connection_failures(mock_loki, sample_incident):
         assert loki_call[1].get("limit") == 1000, "P0-3: Should have limit=1000"
 
 
+def test_network_agent_splits_one_loki_query_between_log_sources(mock_loki, sample_incident):
+    """Test both log sources share one Loki query and each keeps only its lines."""
+    mock_loki.query_range.return_value = [
+        {"stream": {"service": "payment-service"}, "values": [
+            ["1", "backend-2 DOWN"],
+            ["2", "connection refused to database"],
+            ["3", "backend pool connection timeout, marking MAINT"],
+        ]},
+    ]
+    agent = NetworkAgent(budget_limit=Decimal("10.00"), loki_client=mock_loki)
+
+    observations = agent.observe(sample_incident)
+
+    mock_loki.query_range.assert_called_once()
+    lb_lines = [o.data["log_line"] for o in observations if "load_balancer_logs" in o.source]
+    conn_lines = [o.data["log_line"] for o in observations if "connection_failures" in o.source]
+    assert lb_lines == ["backend-2 DOWN", "backend pool connection timeout, marking MAINT"]
+    assert conn_lines == [
+        "connection refused to database",
+        "backend pool connection timeout, marking MAINT",
+    ]
+
+
 def test_network_agent_connection_failures_warns_on_truncation(mock_loki, sample_incident):
     """Test warning when Loki results are truncated at limit."""
     # Mock Loki returning exactly 1000 results (limit reached)
@@ -461,6 +711,74 @@ def test_network_agent_connection_failures_warns_on_truncation(mock_loki, sample
     assert len(conn_obs) > 0
 
 
+def test_network_agent_requeries_each_log_source_when_shared_query_truncates(
+    mock_loki, sample_incident
+):
+    """Test one source filling the shared limit doesn't starve the other."""
+    from structlog.testing import capture_logs
+
+    connection_flood = [
+        {"stream": {"service": "payment-service"}, "values": [["1", f"connection refused {i}"]]}
+        for i in range(1000)
+    ]
+    lb_lines = [{"stream": {"service": "payment-service"}, "values": [["2", "backend-2 DOWN"]]}]
+
+    def query_range(query, **kwargs):
+        # The shared and connection queries both match the flood; only the
+        # load balancer's own query reaches its lines
+        if "backend" in query and "connection" not in query:
+            return lb_lines
+        return connection_flood
+
+    mock_loki.query_range.side_effect = query_range
+    agent = NetworkAgent(budget_limit=Decimal("10.00"), loki_client=mock_loki)
+
+    with capture_logs() as logs:
+        observations = agent.observe(sample_incident)
+
+    queries = sorted(c.kwargs["query"] for c in mock_loki.query_range.call_args_list)
+    assert queries == [
+        '{service="payment-service"} |~ "backend.*(DOWN|UP|MAINT)"',
+        '{service="payment-service"} |~ "backend.*(DOWN|UP|MAINT)|connection.*(refused|timeout|failed)"',
+        '{service="payment-service"} |~ "connection.*(refused|timeout|failed)"',
+    ]
+    assert all(c.kwargs["limit"] == 1000 for c in mock_loki.query_range.call_args_list)
+    lb_obs = [o for o in observations if "load_balancer_logs" in o.source]
+    assert [o.data["log_line"] for o in lb_obs] == ["backend-2 DOWN"]
+    truncated = [e for e in logs if e["event"] == "connection_failures_truncated"]
+    assert truncated and truncated[0]["limit"] == 1000
+    assert not [e for e in logs if e["event"] == "loki_results_truncated"]
+
+
+def test_network_agent_caps_log_observations_per_source(mock_loki, sample_incident):
+    """Test only the first MAX_LOG_OBSERVATIONS_PER_SOURCE log lines become observations."""
+    mock_loki.query_range.return_value = [
+        {"stream": {"service": "payment-service"}, "values": [["1", f"connection refused {i}"]]}
+        for i in range(1000)
+    ]
+    agent = NetworkAgent(budget_limit=Decimal("10.00"), loki_client=mock_loki)
+
+    observations = agent.observe(sample_incident)
+
+    conn_obs = [o for o in observations if o.source == "loki:connection_failures:payment-service"]
+    assert len(conn_obs) == NetworkAgent.MAX_LOG_OBSERVATIONS_PER_SOURCE
+    assert conn_obs[0].description == "Connection failure: connection refused 0"
+    assert conn_obs[0].data == {
+        "log_line": "connection refused 0",
+        "timestamp_ns": "1",
+        "service": "payment-service",
+        "failure_count": 1000,
+    }
+
+    # The detector counts every matched line, not just the capped sample
+    hypotheses = agent.generate_hypothesis(observations)
+    exhaustion = [
+        h for h in hypotheses if h.metadata["hypothesis_type"] == "connection_exhaustion"
+    ]
+    assert exhaustion[0].metadata["observed_value"] == 1000
+    assert "1000 failures across 1 service(s)" in exhaustion[0].statement
+
+
 # ============================================================================
 # Day 2: Hypothesis Detector Tests
 # ============================================================================
@@ -496,6 +814,61 @@ def test_network_agent_detects_dns_hypothesis():
     assert dns_hypotheses[0].initial_confidence > 0
 
 
+def test_network_agent_classifies_observations_once_for_all_detectors(monkeypatch):
+    """Test generate_hypothesis() builds one network index shared by every detector."""
+    from compass.agents.workers import network_agent as module
+
+    builds = []
+    original_init = module._NetworkObservationIndex.__init__
+
+    def counting_init(self, observations):
+        builds.append(len(observations))
+        original_init(self, observations)
+
+    monkeypatch.setattr(module._NetworkObservationIndex, "__init__", counting_init)
+    agent = NetworkAgent(budget_limit=Decimal("10.00"), prometheus_client=Mock())
+    observations = [
+        Observation(
+            source="prometheus:dns_resolution:8.8.8.8",
+            data={"dns_server": "8.8.8.8", "avg_duration_ms": 1500},
+        ),
+        Observation(
+            source="prometheus:load_balancer:backend-2",
+            data={"backend": "backend-2", "status": "DOWN"},
+        ),
+    ]
+
+    hypotheses = agent.generate_hypothesis(observations)
+
+    assert builds == [2]
+    assert {h.metadata["hypothesis_type"] for h in hypotheses} == {
+        "dns_failure",
+        "load_balancer_failure",
+    }
+
+
+def test_network_agent_hypotheses_share_one_suspected_time_per_pass():
+    """Test detectors in one generate_hypothesis() pass reuse a single timestamp."""
+    agent = NetworkAgent(budget_limit=Decimal("10.00"), prometheus_client=Mock())
+    observations = [
+        Observation(
+            source="prometheus:dns_resolution:8.8.8.8",
+            data={"dns_server": "8.8.8.8", "avg_duration_ms": 1500},
+        ),
+        Observation(
+            source="prometheus:load_balancer:backend-2",
+            data={"backend": "backend-2", "status": "DOWN"},
+        ),
+    ]
+
+    hypotheses = agent.generate_hypothesis(observations)
+
+    suspected_times = {h.metadata["suspected_time"] for h in hypotheses}
+    assert len(hypotheses) == 2
+    assert len(suspected_times) == 1
+    assert datetime.fromisoformat(suspected_times.pop()).tzinfo is not None
+
+
 def test_network_agent_does_not_detect_dns_hypothesis_when_normal():
     """Test DNS hypothesis not created when duration is normal."""
     agent = NetworkAgent(
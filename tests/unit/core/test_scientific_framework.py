@@ -16,6 +16,7 @@ from compass.core.scientific_framework import (
     EvidenceQuality,
     Hypothesis,
     HypothesisStatus,
+    Observation,
 )
 
 # ============================================================================
@@ -556,3 +557,23 @@ def test_confidence_reasoning_updated_on_recalculation() -> None:
         "evidence" in hypothesis.confidence_reasoning.lower()
         or "supporting" in hypothesis.confidence_reasoning.lower()
     )
+
+
+def test_observation_precomputes_lowercased_strings() -> None:
+    """Test lowercased source/description are cached without affecting equality."""
+    obs = Observation(id="o1", source="Loki:Error_Logs", description="High LATENCY")
+
+    assert obs._source_lc == "loki:error_logs"
+    assert obs._desc_lc == "high latency"
+    assert "_source_lc" not in repr(obs)
+    assert obs == Observation(
+        id="o1", timestamp=obs.timestamp, source="Loki:Error_Logs", description="High LATENCY"
+    )
+
+
+def test_observation_uses_slots() -> None:
+    """Test Observation has a fixed attribute layout (no per-instance __dict__)."""
+    obs = Observation(source="loki:error_logs")
+
+    assert not hasattr(obs, "__dict__")
+    assert "_source_lc" in Observation.__slots__
@@ -1,5 +1,7 @@
 """Tests for MCP base abstractions."""
 
+import asyncio
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -9,6 +11,8 @@ from compass.integrations.mcp.base import (
     MCPQueryError,
     MCPResponse,
     MCPValidationError,
+    SyncLoopRunner,
+    decode_json_body,
 )
 
 
@@ -142,3 +146,51 @@ class TestExceptions:
         """Test MCPValidationError can be raised and caught."""
         with pytest.raises(MCPValidationError, match="Invalid query"):
             raise MCPValidationError("Invalid query: empty string")
+
+
+class TestSyncLoopRunner:
+    """Tests for running coroutines on a persistent background loop."""
+
+    def test_runs_every_call_on_the_same_loop(self) -> None:
+        """Test consecutive calls share one loop (so sessions survive between them)."""
+        runner = SyncLoopRunner("test-sync-loop")
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        try:
+            first = runner.run(current_loop())
+            second = runner.run(current_loop())
+        finally:
+            runner.stop()
+
+        assert first is second
+        assert first.is_closed()
+
+    def test_propagates_exceptions_and_restarts_after_stop(self) -> None:
+        """Test coroutine errors reach the caller and stop() is not terminal."""
+        runner = SyncLoopRunner("test-sync-loop")
+
+        async def fail() -> None:
+            raise MCPQueryError("bad query")
+
+        async def answer() -> int:
+            return 42
+
+        try:
+            with pytest.raises(MCPQueryError):
+                runner.run(fail())
+            runner.stop()
+            assert runner.run(answer()) == 42
+        finally:
+            runner.stop()
+
+
+def test_decode_json_body_parses_wire_bytes() -> None:
+    """Test response bodies decode from bytes and reject invalid JSON consistently."""
+    assert decode_json_body(b'{"data": {"result": [1, 2.5, "x"]}}') == {
+        "data": {"result": [1, 2.5, "x"]}
+    }
+    with pytest.raises(json.JSONDecodeError):
+        decode_json_body(b"<html>bad gateway</html>")
+
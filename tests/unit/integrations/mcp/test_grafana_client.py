@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timezone
 
 from compass.integrations.mcp import MCPResponse
-from compass.integrations.mcp.grafana_client import GrafanaMCPClient
+from compass.integrations.mcp.grafana_client import BulkResponse, GrafanaMCPClient
 from compass.integrations.mcp.base import MCPConnectionError, MCPQueryError
 
 
@@ -265,6 +265,108 @@ class TestQueryLogQL:
             assert call_args.get("duration") == "10m"
 
 
+class TestBulkQuery:
+    """Tests for batching PromQL and LogQL queries into one pass."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_query_returns_results_in_request_order(self):
+        """Test bulk_query splits results back into metrics and logs."""
+        client = GrafanaMCPClient(
+            url="http://localhost:3000",
+            token="glsa_test_token_123"
+        )
+
+        async def fake_call(tool_name, params, **kwargs):
+            return {"data": {"tool": tool_name, "query": params["query"]}}
+
+        with patch.object(client, '_call_mcp_tool', new=AsyncMock(side_effect=fake_call)):
+            bulk = await client.bulk_query(
+                promql=[
+                    {"query": "up", "datasource_uid": "prometheus"},
+                    {"query": "db_connections", "datasource_uid": "prometheus"},
+                ],
+                logql=[{"query": '{app="postgres"}', "datasource_uid": "loki"}],
+            )
+
+        assert isinstance(bulk, BulkResponse)
+        assert [r.data["query"] for r in bulk.metrics] == ["up", "db_connections"]
+        assert bulk.logs[0].data == {"tool": "execute_logql_query", "query": '{app="postgres"}'}
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_bulk_query_keeps_other_results_when_one_fails(self):
+        """Test a failing query is returned as its exception without losing the rest."""
+        client = GrafanaMCPClient(
+            url="http://localhost:3000",
+            token="glsa_test_token_123"
+        )
+
+        async def fake_call(tool_name, params, **kwargs):
+            if tool_name == "execute_promql_query":
+                raise MCPQueryError("bad query")
+            return {"data": {"result": ["line"]}}
+
+        with patch.object(client, '_call_mcp_tool', new=AsyncMock(side_effect=fake_call)):
+            bulk = await client.bulk_query(
+                promql=[{"query": "up{", "datasource_uid": "prometheus"}],
+                logql=[{"query": '{app="postgres"}', "datasource_uid": "loki"}],
+            )
+
+        assert isinstance(bulk.metrics[0], MCPQueryError)
+        assert bulk.logs[0].data == {"result": ["line"]}
+        await client.disconnect()
+
+
+class TestSyncSessionReuse:
+    """Tests for keeping the session alive across synchronous wrapper calls."""
+
+    def test_sync_wrappers_reuse_warmed_session(self):
+        """Test warmup() opens a session that later sync calls reuse until close_sync()."""
+        client = GrafanaMCPClient(
+            url="http://localhost:3000",
+            token="glsa_test_token_123"
+        )
+
+        client.warmup()
+        session = client._session
+        try:
+            with patch.object(
+                client, '_call_mcp_tool', new=AsyncMock(return_value={"data": {}})
+            ):
+                client.bulk_query_sync(promql=[{"query": "up", "datasource_uid": "prometheus"}])
+                client.bulk_query_sync(promql=[{"query": "up", "datasource_uid": "prometheus"}])
+            assert client._session is session
+        finally:
+            client.close_sync()
+
+        assert client._session is None
+
+
+class TestCallMCPTool:
+    """Tests for decoding MCP tool responses."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_response_body_bytes(self):
+        """Test a successful tool call returns the decoded JSON body."""
+        import httpx
+
+        client = GrafanaMCPClient(
+            url="http://localhost:3000",
+            token="glsa_test_token_123"
+        )
+        await client.connect()
+        body = b'{"data": {"result": [{"value": [1, "95"]}]}}'
+        response = httpx.Response(
+            200, content=body, request=httpx.Request("POST", "http://localhost:3000/mcp")
+        )
+
+        with patch.object(client._session, 'post', new=AsyncMock(return_value=response)):
+            result = await client._call_mcp_tool("execute_promql_query", {"query": "up"})
+
+        assert result == {"data": {"result": [{"value": [1, "95"]}]}}
+        await client.disconnect()
+
+
 class TestSearchDashboards:
     """Tests for dashboard search via Grafana MCP."""
 
@@ -335,6 +437,23 @@ class TestConnectionLifecycle:
 
         await client.disconnect()
 
+    @pytest.mark.asyncio
+    async def test_connect_sizes_connection_pool(self):
+        """Test that connect() keeps max_connections connections alive."""
+        client = GrafanaMCPClient(
+            url="http://localhost:3000",
+            token="glsa_test_token_123",
+            max_connections=8,
+        )
+
+        with patch("httpx.AsyncClient") as async_client:
+            async_client.return_value.is_closed = False
+            await client.connect()
+
+        limits = async_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 8
+
     @pytest.mark.asyncio
     async def test_disconnect_closes_session(self):
         """Test that disconnect() closes HTTP session."""
@@ -103,3 +103,83 @@ def test_get_logger_with_name() -> None:
     assert logger is not None
     # Name should be accessible for debugging
     assert hasattr(logger, "bind")
+
+
+def test_setup_logging_prod_renders_json(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test production logging emits one JSON object per event and filters by level."""
+    import json
+    import logging
+    from decimal import Decimal
+
+    from compass.config import Environment, LogLevel, Settings
+
+    # basicConfig is a no-op once handlers exist; start from a clean root logger
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    setup_logging(Settings(environment=Environment.PROD, log_level=LogLevel.INFO))
+    try:
+        logger = get_logger("test.json")
+        logger.debug("hidden_event")
+        logger.info("json_event", count=3)
+        logger.info("payload_event", cost=Decimal("0.0025"), by_status={500: 2})
+    finally:
+        # Don't leave a handler bound to the captured stdout for later tests
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        structlog.reset_defaults()
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.strip()]
+    events = [json.loads(line) for line in lines]
+    assert [e["event"] for e in events] == ["json_event", "payload_event"]
+    assert events[0]["count"] == 3
+    # Decimals render as plain strings (_json_default); int keys become str keys
+    assert events[1]["cost"] == "0.0025"
+    assert events[1]["by_status"] == {"500": 2}
+
+
+def test_setup_logging_dev_renders_decimals_as_plain_strings(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the console chain renders Decimal fields without a Decimal(...) repr."""
+    import logging
+    from decimal import Decimal
+
+    from compass.config import Environment, Settings
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    setup_logging(Settings(environment=Environment.DEV))
+    try:
+        get_logger("test.console").info("cost_event", cost=Decimal("0.0025"))
+    finally:
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        structlog.reset_defaults()
+
+    out = capsys.readouterr().out
+    assert "0.0025" in out
+    assert "Decimal(" not in out
+
+
+def test_import_renders_raw_decimal_log_fields() -> None:
+    """Test raw Decimals logged by agents render plainly with no explicit setup_logging()."""
+    import subprocess
+    import sys
+
+    # Fresh interpreter: importing compass configures the chain on its own
+    code = (
+        "from decimal import Decimal\n"
+        "from compass.agents.workers.network_agent import NetworkAgent\n"
+        "NetworkAgent(budget_limit=Decimal('10.00'))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert "network_agent_initialized" in result.stdout
+    assert "10.00" in result.stdout
+    assert "Decimal(" not in result.stdout
@@ -46,6 +46,28 @@ def test_orchestrator_initialization():
     assert orchestrator.network_agent is mock_net
 
 
+@pytest.mark.parametrize("start_time", ["not-a-time", 1705761000])
+def test_orchestrator_rejects_invalid_start_time(start_time):
+    """Test observe() refuses incidents whose start_time isn't ISO 8601."""
+    orchestrator = Orchestrator(budget_limit=Decimal("10.00"))
+    incident = Incident(incident_id="bad-time", title="Test", start_time=start_time)
+
+    with pytest.raises(ValueError, match="valid ISO8601"):
+        orchestrator.observe(incident)
+
+
+def test_orchestrator_validation_shares_agents_time_parse(sample_incident):
+    """Test the validated start time is served from the agents' memoized parse."""
+    from compass.core.scientific_framework import parse_incident_time
+
+    Orchestrator(budget_limit=Decimal("10.00")).observe(sample_incident)
+    hits = parse_incident_time.cache_info().hits
+
+    parse_incident_time(sample_incident.start_time)
+
+    assert parse_incident_time.cache_info().hits == hits + 1
+
+
 def test_orchestrator_dispatches_all_agents_sequentially(sample_incident):
     """Test orchestrator calls observe() on all 3 agents in sequence."""
     mock_app = Mock()
@@ -78,6 +100,28 @@ def test_orchestrator_dispatches_all_agents_sequentially(sample_incident):
     assert len(observations) == 3
 
 
+def test_orchestrator_passes_incident_to_database_agent(sample_incident):
+    """Test the real DatabaseAgent accepts the Incident the orchestrator passes."""
+    from compass.agents.workers.database_agent import DatabaseAgent
+
+    database_agent = DatabaseAgent(agent_id="database_specialist")
+    database_agent._total_cost = Decimal("0.00")  # ScientificAgent tracks cost as float
+    orchestrator = Orchestrator(
+        budget_limit=Decimal("10.00"),
+        database_agent=database_agent,
+    )
+
+    with patch("compass.orchestrator.logger") as mock_logger:
+        orchestrator.observe(sample_incident)
+
+    failures = [
+        call for call in mock_logger.warning.call_args_list
+        if call.args[0] == "database_agent_failed"
+    ]
+    assert failures == []
+    assert list(database_agent._observe_cache) == [sample_incident.incident_id]
+
+
 def test_orchestrator_checks_budget_after_each_agent(sample_incident):
     """
     Test orchestrator checks budget after EACH agent completes.